@@ -1,7 +1,20 @@
 #!/usr/bin/env python3
 import json
+import operator
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+# ijson and orjson are optional; ijson streams the results array one file at a
+# time, orjson parses whole reports several times faster than json
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # NC breach notification law requires notification for PII including:
 # - Social Security numbers (SSN)
@@ -36,31 +49,61 @@ NC_BREACH_ENTITIES = {
 # Threshold values for high confidence PII
 HIGH_CONFIDENCE_THRESHOLD = 0.7
 
-def analyze_pii_report(report_path):
-    with open(report_path, 'r') as f:
-        data = json.load(f)
+# Field accessor for report entities; entities missing a field use .get defaults
+_get_type_and_text = operator.itemgetter('entity_type', 'text')
+
+def iter_report_results(report_path):
+    """Yields the file results of a report, streaming them when ijson is installed"""
+    if ijson is not None:
+        with open(report_path, 'rb') as f:
+            yield from ijson.items(f, 'results.item', use_float=True)
+        return
     
-    # Dictionary to track files and their sensitive entities
-    high_risk_files = defaultdict(list)
+    if orjson is not None:
+        with open(report_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(report_path, 'r') as f:
+            data = json.load(f)
+    yield from data.get('results', [])
+
+def analyze_pii_report(report_path):
+    # Dictionary to track files and their sensitive entities, stored as
+    # parallel lists of fields rather than one dict per entity
+    high_risk_files = {}
     
     # Process each file result
-    for file_result in data.get('results', []):
+    for file_result in iter_report_results(report_path):
         file_path = file_result.get('file_path', '')
         entities = file_result.get('entities', [])
         
         for entity in entities:
-            entity_type = entity.get('entity_type', '')
-            confidence = entity.get('score', 0.0)
-            text = entity.get('text', '')
+            # Check the score first, so a low-confidence entity costs one lookup
+            try:
+                confidence = entity['score']
+            except KeyError:
+                confidence = 0.0
+            if confidence < HIGH_CONFIDENCE_THRESHOLD:
+                continue
+            
+            try:
+                entity_type, text = _get_type_and_text(entity)
+            except KeyError:
+                entity_type = entity.get('entity_type', '')
+                text = entity.get('text', '')
             
-            # Check if this is a sensitive entity type with high confidence
-            if entity_type in NC_BREACH_ENTITIES and confidence >= HIGH_CONFIDENCE_THRESHOLD:
-                high_risk_files[file_path].append({
-                    'type': entity_type,
-                    'category': NC_BREACH_ENTITIES[entity_type],
-                    'confidence': confidence,
-                    'text': text
-                })
+            # Check if this is a sensitive entity type
+            if entity_type in NC_BREACH_ENTITIES:
+                entity_type = sys.intern(entity_type)
+                file_entities = high_risk_files.get(file_path)
+                if file_entities is None:
+                    file_entities = high_risk_files[file_path] = {
+                        'type': [], 'category': [], 'confidence': [], 'text': []
+                    }
+                file_entities['type'].append(entity_type)
+                file_entities['category'].append(NC_BREACH_ENTITIES[entity_type])
+                file_entities['confidence'].append(confidence)
+                file_entities['text'].append(text)
     
     return high_risk_files
 
@@ -68,72 +111,86 @@ def report_high_risk_files(high_risk_files):
     print(f"Files containing high-confidence PII requiring breach notification under NC law:\n")
     
     # Sort files by number of sensitive entities (highest first)
-    sorted_files = sorted(high_risk_files.items(), key=lambda x: len(x[1]), reverse=True)
+    sorted_files = sorted(high_risk_files.items(), key=lambda x: len(x[1]['type']), reverse=True)
     
     for file_path, entities in sorted_files:
+        types = entities['type']
+        categories = entities['category']
+        
         print(f"File: {file_path}")
-        print(f"Number of sensitive entities: {len(entities)}")
+        print(f"Number of sensitive entities: {len(types)}")
         
         # Count entity types
-        entity_counts = defaultdict(int)
-        for entity in entities:
-            entity_counts[entity['category']] += 1
+        entity_counts = Counter(categories)
         
         print("Entity types:")
-        for category, count in sorted(entity_counts.items(), key=lambda x: x[1], reverse=True):
+        for category, count in entity_counts.most_common():
             print(f"  - {category}: {count}")
         
         # Show sample of entity text (max 3 per type)
         print("Sample entities (max 3 per type):")
         samples_by_type = defaultdict(list)
         
-        for entity in entities:
-            category = entity['category']
+        for i in range(len(types)):
+            category = categories[i]
             if len(samples_by_type[category]) < 3:
-                samples_by_type[category].append(entity)
+                samples_by_type[category].append(i)
                 
         for category, samples in samples_by_type.items():
             print(f"  {category}:")
-            for sample in samples:
+            for i in samples:
                 # Mask part of the sensitive data for the report
-                masked_text = mask_sensitive_text(sample['text'], sample['type'])
-                print(f"    - {masked_text} (confidence: {sample['confidence']:.2f})")
+                masked_text = mask_sensitive_text(entities['text'][i], types[i])
+                print(f"    - {masked_text} (confidence: {entities['confidence'][i]:.2f})")
         
         print("-" * 80)
 
+def _mask_last4(text):
+    """Show only the last 4 characters"""
+    if len(text) > 4:
+        return f"****{text[-4:]}"
+    return "****"
+
+def _mask_email(text):
+    """Show the first 2 characters of the username and the domain"""
+    username, at, domain = text.partition('@')
+    if not at or '@' in domain:
+        return "***@***"
+    if len(username) > 2:
+        return f"{username[:2]}***@{domain}"
+    return f"***@{domain}"
+
+def _mask_phone(text):
+    """Show only the last 4 digits"""
+    digits = ''.join(c for c in text if c.isdigit())
+    if len(digits) >= 4:
+        return f"***-***-{digits[-4:]}"
+    return "***-***-****"
+
+def _mask_person(text):
+    """Show the first initial and last name"""
+    parts = text.split()
+    if len(parts) > 1:
+        return f"{parts[0][0]}. {parts[-1]}"
+    return text
+
+def _mask_other(text):
+    """Show the first and last character of other types"""
+    if len(text) > 4:
+        return f"{text[0]}***{text[-1]}"
+    return "****"
+
+# Masking function for each entity type; other types use _mask_other
+_MASKERS = {
+    **{entity_type: _mask_last4 for entity_type in ('US_SSN', 'CREDIT_CARD', 'BANK_ACCOUNT', 'US_BANK_NUMBER', 'IBAN_CODE')},
+    'EMAIL_ADDRESS': _mask_email,
+    'PHONE_NUMBER': _mask_phone,
+    'PERSON': _mask_person,
+}
+
 def mask_sensitive_text(text, entity_type):
     """Masks sensitive text for display in reports"""
-    if entity_type in ['US_SSN', 'CREDIT_CARD', 'BANK_ACCOUNT', 'US_BANK_NUMBER', 'IBAN_CODE']:
-        # Show only last 4 characters
-        if len(text) > 4:
-            return f"****{text[-4:]}"
-        return "****"
-    elif entity_type in ['EMAIL_ADDRESS']:
-        parts = text.split('@')
-        if len(parts) == 2:
-            username = parts[0]
-            domain = parts[1]
-            if len(username) > 2:
-                return f"{username[:2]}***@{domain}"
-            return f"***@{domain}"
-        return "***@***"
-    elif entity_type in ['PHONE_NUMBER']:
-        # Show only last 4 digits
-        digits = ''.join(c for c in text if c.isdigit())
-        if len(digits) >= 4:
-            return f"***-***-{digits[-4:]}"
-        return "***-***-****"
-    elif entity_type in ['PERSON']:
-        parts = text.split()
-        if len(parts) > 1:
-            # First initial, last name
-            return f"{parts[0][0]}. {parts[-1]}"
-        return text
-    else:
-        # For other types, show first and last character
-        if len(text) > 4:
-            return f"{text[0]}***{text[-1]}"
-        return "****"
+    return _MASKERS.get(entity_type, _mask_other)(text)
 
 if __name__ == '__main__':
     if len(sys.argv) != 2:
@@ -9,17 +9,27 @@ import sys
 import time
 import subprocess
 import argparse
+import concurrent.futures
 from typing import Dict, List, Optional, Tuple
 import json
 import tempfile
 
 from rich.console import Console
+from rich.markup import escape
 from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
 from rich.table import Table
 
+# Add src directory to path to allow imports from PII analyzer modules
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from src.utils.file_utils import find_files
+
 # Initialize rich console
 console = Console()
 
+# Default number of files analyzed at once; each runs in its own CLI
+# subprocess, so the threads mostly wait on subprocess startup and I/O
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
 def scan_directory(directory_path: str, extensions: Optional[List[str]] = None) -> List[str]:
     """Scan directory for supported files and return their paths."""
     if extensions is None:
@@ -27,14 +37,8 @@ def scan_directory(directory_path: str, extensions: Optional[List[str]] = None)
     
     console.print(f"Scanning directory: [bold blue]{directory_path}[/bold blue]")
     
-    # Use find command to get all files with the supported extensions
-    all_files = []
-    for root, _, files in os.walk(directory_path):
-        for file in files:
-            if any(file.lower().endswith(f".{ext}") for ext in extensions):
-                all_files.append(os.path.join(root, file))
-    
-    return all_files
+    # Scan with os.scandir, matching each name's extension with a set lookup
+    return find_files(directory_path, extensions=extensions)
 
 def analyze_single_file(
     file_path: str,
@@ -49,6 +53,9 @@ def analyze_single_file(
     """Analyze a single file with detailed debugging."""
     start_time = time.time()
     
+    # Files run in parallel, so each debug line names the file it belongs to
+    label = escape(file_path)
+    
     # Create a temporary output file using a context manager
     with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp_file:
         temp_output = tmp_file.name
@@ -74,31 +81,37 @@ def analyze_single_file(
             cmd.extend(["--max-pages", str(max_pages)])
         
         if debug:
-            console.print(f"  Running command: {' '.join(cmd)}")
+            console.print(f"  {label}: Running command: {' '.join(cmd)}")
         
-        # Run the CLI tool with full output capture
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run the CLI tool; results go to temp_output, so stdout is only
+        # captured when it is shown for debugging
+        process = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE if debug else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
         
         # Debugging info if requested
         if debug and process.stdout:
-            console.print(f"  Command stdout: {process.stdout}")
+            console.print(f"  {label}: Command stdout: {process.stdout}")
         
         # Check if process returned an error
         if process.returncode != 0:
             error_msg = process.stderr or "Unknown error (no stderr)"
             if debug:
-                console.print(f"  [bold red]Command failed:[/bold red] {error_msg}")
+                console.print(f"  {label}: [bold red]Command failed:[/bold red] {error_msg}")
             return False, {}, error_msg
         
         # Check if output file exists and has content
         if not os.path.exists(temp_output):
             if debug:
-                console.print(f"  [bold red]No output file created[/bold red]")
+                console.print(f"  {label}: [bold red]No output file created[/bold red]")
             return False, {}, "No output file created"
         
         if os.path.getsize(temp_output) == 0:
             if debug:
-                console.print(f"  [bold red]Output file is empty[/bold red]")
+                console.print(f"  {label}: [bold red]Output file is empty[/bold red]")
             return False, {}, "Output file is empty"
         
         # Try to read the JSON output
@@ -122,13 +135,13 @@ def analyze_single_file(
                 error_msg = f"Invalid JSON: {str(e)}"
                 
             if debug:
-                console.print(f"  [bold red]JSON decode error:[/bold red] {error_msg}")
+                console.print(f"  {label}: [bold red]JSON decode error:[/bold red] {error_msg}")
             return False, {}, error_msg
             
     except Exception as e:
         error_msg = f"Exception: {str(e)}"
         if debug:
-            console.print(f"  [bold red]Exception:[/bold red] {error_msg}")
+            console.print(f"  {label}: [bold red]Exception:[/bold red] {error_msg}")
         return False, {}, error_msg
     
     finally:
@@ -146,9 +159,14 @@ def analyze_files(
     ocr_threads: int = 0,
     max_pages: Optional[int] = None,
     sample_size: Optional[int] = None,
-    debug: bool = False
+    debug: bool = False,
+    workers: int = DEFAULT_WORKERS
 ) -> Dict:
-    """Analyze files with progress bar and detailed error logging."""
+    """Analyze files with progress bar and detailed error logging.
+    
+    Files are analyzed by up to `workers` CLI subprocesses at once, so their
+    startup (model loading) overlaps; results are recorded in file order.
+    """
     total_files = len(files)
     
     if sample_size and sample_size < total_files:
@@ -189,24 +207,35 @@ def analyze_files(
         task = progress.add_task("[green]Processing files...", total=total_files)
         
         all_results = []
+        outcomes = [None] * total_files
         
-        for idx, file_path in enumerate(files):
-            file_name = os.path.basename(file_path)
-            file_ext = os.path.splitext(file_path)[1].lower()
+        # Each worker thread just blocks on its subprocess
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(
+                    analyze_single_file,
+                    file_path=file_path,
+                    threshold=threshold,
+                    force_ocr=force_ocr,
+                    ocr_dpi=ocr_dpi,
+                    ocr_threads=ocr_threads,
+                    max_pages=max_pages,
+                    entities=entities,
+                    debug=debug
+                ): idx
+                for idx, file_path in enumerate(files)
+            }
             
-            progress.update(task, description=f"[green]Processing: [cyan]{file_name[:30]}...[/cyan]")
-            
-            # Process the file
-            success, result_data, error_msg = analyze_single_file(
-                file_path=file_path,
-                threshold=threshold,
-                force_ocr=force_ocr,
-                ocr_dpi=ocr_dpi,
-                ocr_threads=ocr_threads,
-                max_pages=max_pages,
-                entities=entities,
-                debug=debug
-            )
+            for future in concurrent.futures.as_completed(futures):
+                idx = futures[future]
+                outcomes[idx] = future.result()
+                
+                file_name = os.path.basename(files[idx])
+                progress.update(task, advance=1,
+                                description=f"[green]Processed: [cyan]{file_name[:30]}...[/cyan]")
+        
+        for file_path, (success, result_data, error_msg) in zip(files, outcomes):
+            file_ext = os.path.splitext(file_path)[1].lower()
             
             # Update statistics based on file type
             if success:
@@ -249,8 +278,6 @@ def analyze_files(
                     "file": file_path,
                     "error": error_msg
                 })
-            
-            progress.update(task, advance=1)
     
     # Final timing
     results["total_time"] = time.time() - overall_start_time
@@ -386,6 +413,8 @@ def main():
     parser.add_argument("--sample", type=int, help="Analyze only a sample of files")
     parser.add_argument("--debug", action="store_true", help="Show detailed debug information")
     parser.add_argument("--test-docx", action="store_true", help="Test DOCX files only")
+    parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS,
+                        help=f"Number of files analyzed at once (default: {DEFAULT_WORKERS})")
     
     args = parser.parse_args()
     
@@ -420,17 +449,14 @@ def main():
         
         # Process a directory
         else:
-            # Scan directory for files
-            all_files = scan_directory(args.input)
-            
-            # Filter for DOCX files if test-docx flag is set
+            # Scan directory for files; with test-docx only DOCX files are
+            # collected instead of filtering a list of every supported file
             if args.test_docx:
-                docx_files = [f for f in all_files if f.lower().endswith('.docx')]
-                console.print(f"Found [bold]{len(docx_files)}[/bold] DOCX files to process")
-                files_to_process = docx_files
+                files_to_process = scan_directory(args.input, extensions=["docx"])
+                console.print(f"Found [bold]{len(files_to_process)}[/bold] DOCX files to process")
             else:
-                console.print(f"Found [bold]{len(all_files)}[/bold] files to process")
-                files_to_process = all_files
+                files_to_process = scan_directory(args.input)
+                console.print(f"Found [bold]{len(files_to_process)}[/bold] files to process")
             
             # Show file types
             file_types = {}
@@ -458,7 +484,8 @@ def main():
                 ocr_threads=args.ocr_threads,
                 max_pages=args.max_pages,
                 sample_size=args.sample,
-                debug=args.debug
+                debug=args.debug,
+                workers=args.workers
             )
             
             # Display results
@@ -328,7 +328,9 @@ def _analyze_file(
     force_ocr: bool,
     ocr_dpi: int = 300,
     ocr_threads: int = 0,
-    max_pages: Optional[int] = None
+    max_pages: Optional[int] = None,
+    extractor: Optional[ExtractorFactory] = None,
+    analyzer: Optional[PresidioAnalyzer] = None
 ) -> None:
     """Analyze a single file for PII entities.
     
@@ -342,6 +344,9 @@ def _analyze_file(
         ocr_dpi: DPI for OCR (higher = better quality but slower)
         ocr_threads: Number of OCR processing threads (0=auto)
         max_pages: Maximum pages to process per PDF (None=all)
+        extractor: Extractor factory to reuse (None to create one)
+        analyzer: Analyzer to reuse, so the spaCy model is loaded once for
+                  a batch of files (None to create one)
     """
     if not is_valid_file(file_path):
         logger.error(f"Input file not found or not readable: {file_path}")
@@ -361,7 +366,8 @@ def _analyze_file(
         # Extract text from file
         console.print("Extracting text...", end="")
         extraction_start = time.time()
-        extractor = _create_extractor_factory(ocr_dpi, ocr_threads)
+        if extractor is None:
+            extractor = _create_extractor_factory(ocr_dpi, ocr_threads)
         text, metadata = extractor.extract_text(
             file_path, 
             force_ocr=force_ocr,
@@ -382,7 +388,8 @@ def _analyze_file(
         # Analyze text for PII
         console.print("Analyzing for PII...", end="")
         analysis_start = time.time()
-        analyzer = PresidioAnalyzer(score_threshold=threshold)
+        if analyzer is None:
+            analyzer = PresidioAnalyzer(score_threshold=threshold)
         detected_entities = analyzer.analyze_text(
             text=text,
             entities=entities
@@ -556,8 +563,10 @@ def _analyze_directory(
                 f.write(f"Analysis timestamp: {os.path.basename(directory)}\n")
                 f.write("-" * 80 + "\n\n")
         
-        # Initialize extractor once for all files
+        # Initialize extractor and analyzer once for all files; creating the
+        # analyzer loads the spaCy model
         extractor = _create_extractor_factory(ocr_dpi, ocr_threads)
+        analyzer = PresidioAnalyzer(score_threshold=threshold)
         
         start_time = time.time()
         
@@ -593,7 +602,6 @@ def _analyze_directory(
                     
                     # Analyze text for PII
                     analysis_start = time.time()
-                    analyzer = PresidioAnalyzer(score_threshold=threshold)
                     detected_entities = analyzer.analyze_text(
                         text=text,
                         entities=entities
@@ -694,7 +702,10 @@ def _analyze_directory(
         logger.info(f"Analysis complete. Found {stats['total_entities']} PII entities in {stats['processed_files']} files.")
         
     else:
-        # No output path specified, process each file individually
+        # No output path specified, process each file individually,
+        # sharing one extractor and analyzer between them
+        extractor = _create_extractor_factory(ocr_dpi, ocr_threads)
+        analyzer = PresidioAnalyzer(score_threshold=threshold)
         for file_path in files:
             _analyze_file(
                 file_path=file_path,
@@ -705,7 +716,9 @@ def _analyze_directory(
                 force_ocr=force_ocr,
                 ocr_dpi=ocr_dpi,
                 ocr_threads=ocr_threads,
-                max_pages=max_pages
+                max_pages=max_pages,
+                extractor=extractor,
+                analyzer=analyzer
             )
 
 def _display_analysis_summary(stats: Dict):
@@ -779,7 +792,10 @@ def _redact_file(
     force_ocr: bool,
     ocr_dpi: int = 300,
     ocr_threads: int = 0,
-    max_pages: Optional[int] = None
+    max_pages: Optional[int] = None,
+    extractor: Optional[ExtractorFactory] = None,
+    analyzer: Optional[PresidioAnalyzer] = None,
+    anonymizer: Optional[PresidioAnonymizer] = None
 ) -> None:
     """Redact PII entities from a file.
     
@@ -794,6 +810,9 @@ def _redact_file(
         ocr_dpi: DPI for OCR (higher = better quality but slower)
         ocr_threads: Number of OCR processing threads (0=auto)
         max_pages: Maximum pages to process per PDF (None=all)
+        extractor: Extractor factory to reuse (None to create one)
+        analyzer: Analyzer to reuse (None to create one)
+        anonymizer: Anonymizer to reuse (None to create one)
     """
     if not is_valid_file(file_path):
         logger.error(f"Input file not found or not readable: {file_path}")
@@ -805,7 +824,8 @@ def _redact_file(
     
     try:
         # Extract text from file
-        extractor = _create_extractor_factory(ocr_dpi, ocr_threads)
+        if extractor is None:
+            extractor = _create_extractor_factory(ocr_dpi, ocr_threads)
         text, metadata = extractor.extract_text(file_path, force_ocr=force_ocr, max_pages=max_pages)
         
         if not text:
@@ -813,7 +833,8 @@ def _redact_file(
             return
             
         # Analyze text for PII
-        analyzer = PresidioAnalyzer(score_threshold=threshold)
+        if analyzer is None:
+            analyzer = PresidioAnalyzer(score_threshold=threshold)
         detected_entities = analyzer.analyze_text(
             text=text,
             entities=entities
@@ -824,7 +845,8 @@ def _redact_file(
             return
             
         # Anonymize text
-        anonymizer = PresidioAnonymizer()
+        if anonymizer is None:
+            anonymizer = PresidioAnonymizer()
         anonymized_text = anonymizer.anonymize_text(
             text=text,
             entities=detected_entities,
@@ -924,6 +946,12 @@ def _redact_directory(
             logger.error(f"Error creating output directory {output_path}: {e}")
             return
     
+    # Share one extractor, analyzer and anonymizer between all files, so the
+    # spaCy model is loaded once
+    extractor = _create_extractor_factory(ocr_dpi, ocr_threads)
+    analyzer = PresidioAnalyzer(score_threshold=threshold)
+    anonymizer = PresidioAnonymizer()
+    
     # Process each file
     for idx, file_path in enumerate(files):
         try:
@@ -949,7 +977,10 @@ def _redact_directory(
                 force_ocr=force_ocr,
                 ocr_dpi=ocr_dpi,
                 ocr_threads=ocr_threads,
-                max_pages=max_pages
+                max_pages=max_pages,
+                extractor=extractor,
+                analyzer=analyzer,
+                anonymizer=anonymizer
             )
             
             # Show progress
@@ -6,7 +6,9 @@ for resumable processing
 """
 
 import os
+import stat
 import time
+import concurrent.futures
 import logging
 from typing import List, Tuple, Set, Dict, Any, Optional, Callable
 from pathlib import Path
@@ -17,15 +19,40 @@ from src.database.db_utils import PIIDatabase
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('file_discovery')
 
-# Default supported file extensions
-DEFAULT_SUPPORTED_EXTENSIONS = {
-    '.txt', '.pdf', '.docx', '.doc', '.rtf',  # Text documents
-    '.xlsx', '.xls', '.csv', '.tsv',          # Spreadsheets
-    '.pptx', '.ppt',                          # Presentations
-    '.json', '.xml', '.html', '.htm',         # Structured data
-    '.eml', '.msg',                           # Email files
-    '.md', '.markdown'                        # Markdown
-}
+# Default supported file extensions (lowercase, without the dot)
+DEFAULT_SUPPORTED_EXTENSIONS = frozenset({
+    'txt', 'pdf', 'docx', 'doc', 'rtf',  # Text documents
+    'xlsx', 'xls', 'csv', 'tsv',         # Spreadsheets
+    'pptx', 'ppt',                       # Presentations
+    'json', 'xml', 'html', 'htm',        # Structured data
+    'eml', 'msg',                        # Email files
+    'md', 'markdown'                     # Markdown
+})
+
+# Number of files registered per database transaction while scanning
+SCAN_BATCH_SIZE = 1000
+
+# Threads used to list directories; scanning is bound by syscalls, not CPU
+DEFAULT_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def get_scan_workers() -> int:
+    """
+    Get the number of directory scanning threads.
+    PII_SCAN_WORKERS overrides the default, e.g. to keep more requests in
+    flight against high-latency network mounts.
+    
+    Returns:
+        Number of scanning threads
+    """
+    value = os.environ.get('PII_SCAN_WORKERS')
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid PII_SCAN_WORKERS value: {value}")
+    return DEFAULT_SCAN_WORKERS
+
+SCAN_WORKERS = get_scan_workers()
 
 def get_file_type(file_path: str) -> str:
     """
@@ -67,12 +94,108 @@ def is_supported_file(file_path: str, extensions: Set[str]) -> bool:
         
     return False
 
+def normalize_extensions(extensions: Set[str]) -> frozenset:
+    """
+    Normalize a set of extensions to lowercase without a leading dot.
+    
+    Args:
+        extensions: Extensions with or without dots
+        
+    Returns:
+        Frozen set of normalized extensions
+    """
+    return frozenset(ext.strip().lstrip('.').lower() for ext in extensions)
+
+def scan_single_directory(
+    directory_path: str,
+    extensions: frozenset
+) -> Tuple[List[Tuple[str, int, str, float]], List[str], int]:
+    """
+    List one directory (without recursing) and stat its supported files.
+    
+    Args:
+        directory_path: Directory to list
+        extensions: Normalized set of supported extensions (no dots)
+        
+    Returns:
+        Tuple of (file info tuples, subdirectory paths, number of files seen)
+        where each file info tuple is (file_path, file_size, file_type, modified_time)
+    """
+    files = []
+    subdirs = []
+    scanned = 0
+    
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    
+                    scanned += 1
+                    
+                    # Same result as os.path.splitext without building a tuple;
+                    # leading dots (e.g. .bashrc) don't start an extension
+                    name = entry.name
+                    i = name.rfind('.')
+                    if i <= 0 or (name[0] == '.' and not name[:i].strip('.')):
+                        continue
+                    ext = name[i + 1:].lower()
+                    if ext not in extensions:
+                        continue
+                    
+                    file_stat = entry.stat()
+                    files.append((entry.path, file_stat.st_size, '.' + ext, file_stat.st_mtime))
+                except OSError as e:
+                    logger.error(f"Error accessing file {entry.path}: {e}")
+    except OSError as e:
+        logger.error(f"Error reading directory {directory_path}: {e}")
+    
+    return files, subdirs, scanned
+
+def walk_directory_parallel(
+    directory_path: str,
+    extensions: frozenset,
+    max_workers: Optional[int] = None
+):
+    """
+    Recursively list a directory tree using a pool of threads.
+    Directory listing and stat calls release the GIL, so many of them
+    can be in flight at once on slow or network file systems.
+    
+    Args:
+        directory_path: Root directory to walk
+        extensions: Normalized set of supported extensions
+        max_workers: Number of scanning threads (None for SCAN_WORKERS)
+        
+    Yields:
+        Tuple of (file info tuples, number of files seen) for each directory
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or SCAN_WORKERS) as executor:
+        pending = {executor.submit(scan_single_directory, directory_path, extensions)}
+        
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                files, subdirs, scanned = future.result()
+                
+                for subdir in subdirs:
+                    pending.add(executor.submit(scan_single_directory, subdir, extensions))
+                
+                yield files, scanned
+
 def scan_directory(
     db: PIIDatabase, 
     job_id: int,
     directory_path: str, 
     extensions: Optional[Set[str]] = None,
-    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    root_stat: Optional[os.stat_result] = None
 ) -> Dict[str, int]:
     """
     Scan directory for files and register them in the database.
@@ -83,13 +206,20 @@ def scan_directory(
         directory_path: Directory to scan
         extensions: Set of allowed file extensions (None for defaults)
         progress_callback: Optional callback for progress updates
+        root_stat: Result of os.stat on directory_path if the caller already has it
         
     Returns:
         Dictionary with scan statistics
     """
     logger.info(f"Scanning directory: {directory_path}")
     
-    if not os.path.isdir(directory_path):
+    if root_stat is None:
+        try:
+            root_stat = os.stat(directory_path)
+        except OSError:
+            root_stat = None
+    
+    if root_stat is None or not stat.S_ISDIR(root_stat.st_mode):
         logger.error(f"Directory not found: {directory_path}")
         return {'added': 0, 'removed': 0, 'total': 0}
     
@@ -109,45 +239,36 @@ def scan_directory(
     
     # Start timing scan
     start_time = time.time()
-    last_update_time = start_time
     
-    # Scan directory
+    # Files waiting to be registered in the next transaction
+    batch = []
+    
+    def flush_batch():
+        stats['files_added'] += db.register_files_batch(job_id, batch)
+        batch.clear()
+        
+        # Report progress once per batch rather than per file
+        if progress_callback:
+            progress_callback({
+                'type': 'progress',
+                'files_scanned': stats['files_scanned']
+            })
+    
+    # Scan directory; listing runs on worker threads while this thread
+    # writes the results to the database
     try:
-        for root, _, files in os.walk(directory_path):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                
-                # Update scanned count
-                stats['files_scanned'] += 1
-                
-                # Check if it's a supported file type
-                if not is_supported_file(file_path, extensions):
-                    continue
-                
-                # Add to found file set
-                found_files.add(file_path)
-                
-                # Call progress callback periodically
-                current_time = time.time()
-                if progress_callback and (stats['files_scanned'] % 100 == 0 or 
-                                          current_time - last_update_time > 1.0):
-                    progress_callback({
-                        'type': 'progress',
-                        'files_scanned': stats['files_scanned']
-                    })
-                    last_update_time = current_time
+        for files, scanned in walk_directory_parallel(directory_path, normalize_extensions(extensions)):
+            stats['files_scanned'] += scanned
+            
+            for file_info in files:
+                found_files.add(file_info[0])
+                batch.append(file_info)
                 
-                # Get file information
-                try:
-                    file_size = os.path.getsize(file_path)
-                    modified_time = os.path.getmtime(file_path)
-                    file_type = get_file_type(file_path)
-                    
-                    # Register file in database
-                    if db.register_file(job_id, file_path, file_size, file_type, modified_time):
-                        stats['files_added'] += 1
-                except OSError as e:
-                    logger.error(f"Error accessing file {file_path}: {e}")
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    flush_batch()
+        
+        if batch:
+            flush_batch()
     
         # Check for removed files
         removed_count = db.mark_missing_files(job_id, found_files)
@@ -325,19 +446,12 @@ def get_file_statistics(db: PIIDatabase, job_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary with statistics
     """
-    # Get status counts
-    status_counts = db.get_file_status_counts(job_id)
-    
-    # Extract counts for common statuses
-    pending = status_counts.get('pending', 0)
-    processing = status_counts.get('processing', 0)
-    completed = status_counts.get('completed', 0)
-    error = status_counts.get('error', 0)
+    counters = db.get_job_counters(job_id)
     
     return {
-        'pending': pending,
-        'processing': processing,
-        'completed': completed,
-        'error': error,
-        'total': pending + processing + completed + error
-    } 
\ No newline at end of file
+        'pending': counters.pending,
+        'processing': counters.processing,
+        'completed': counters.completed,
+        'error': counters.error,
+        'total': counters.pending + counters.processing + counters.completed + counters.error
+    }
\ No newline at end of file
@@ -11,13 +11,19 @@ import logging
 import multiprocessing
 import queue
 import threading
+import signal
 import os
 import psutil
 import setproctitle
 import math
+from collections import Counter
+from multiprocessing.util import Finalize
 from typing import Callable, List, Dict, Any, Optional, Tuple
 
 from src.database.db_utils import get_database, PIIDatabase
+from src.utils.file_utils import add_unsupported_counts, take_unsupported_counts
+from src.utils.logger import flush_log_buffers
+from src.utils.system_stats import read_system_stats, set_system_stats_source
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -30,6 +36,14 @@ thread_local = threading.local()
 # Will be initialized during process_files_parallel
 OCR_SEMAPHORE = None
 
+# Settings shared by every task in a worker process
+# Set once per process by init_worker instead of being pickled with each task
+WORKER_SETTINGS: Dict[str, Any] = {}
+
+# Start method for worker processes; forkserver children don't inherit the
+# parent's threads or open database connection
+WORKER_START_METHOD = 'forkserver'
+
 # Target CPU utilization (percentage)
 TARGET_CPU_UTILIZATION = 70  # Reduced from 85% to 70%
 MIN_CPU_UTILIZATION = 60     # Adjusted down to match new target
@@ -43,6 +57,15 @@ WORKER_STEP_SIZE = 20        # Normal worker adjustment step
 WORKER_EMERGENCY_REDUCTION = 50  # Larger reduction when system is overloaded
 BATCH_STEP_SIZE = 25         # Increase/decrease batch size by this amount
 
+# Task dispatch parameters
+MAX_TASK_CHUNK_SIZE = 64         # Most files sent to a worker in one task
+CHUNKS_PER_WORKER = 4            # Target number of tasks per worker in each batch
+
+# Result commit parameters
+DEFAULT_COMMIT_BATCH_SIZE = 50   # Files written per database transaction
+COMMIT_INTERVAL = 0.2            # Maximum seconds results wait before being committed
+STOP_CHECK_INTERVAL = 0.5        # Seconds between stop request checks while waiting on chunks
+
 # Load average thresholds (relative to CPU count)
 # For a 96-core system, MAX_LOAD_FACTOR of 1.5 means alert at load avg > 144
 MAX_LOAD_FACTOR = 1.5        # Maximum acceptable load average as a factor of CPU count
@@ -94,12 +117,17 @@ def get_system_utilization() -> Dict[str, float]:
     Returns:
         Dictionary with CPU and memory utilization percentages and load average
     """
-    # Get CPU utilization (averaged over 0.5 seconds for faster response)
-    cpu_percent = psutil.cpu_percent(interval=0.5)
-    
-    # Get memory utilization
-    memory = psutil.virtual_memory()
-    memory_percent = memory.percent
+    # Use the performance monitor's latest sample when one is published
+    shared_stats = read_system_stats()
+    if shared_stats is not None:
+        cpu_percent = shared_stats['cpu_percent']
+        memory_percent = shared_stats['memory_percent']
+    else:
+        # Get CPU utilization (averaged over 0.5 seconds for faster response)
+        cpu_percent = psutil.cpu_percent(interval=0.5)
+        
+        # Get memory utilization
+        memory_percent = psutil.virtual_memory().percent
     
     # Get system load average
     load_avg = os.getloadavg()
@@ -236,7 +264,9 @@ def process_files_parallel(
     max_files: Optional[int] = None,
     settings: Optional[Dict[str, Any]] = None,
     progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
-    enable_dynamic_scaling: bool = True  # Enable dynamic scaling by default
+    enable_dynamic_scaling: bool = True,  # Enable dynamic scaling by default
+    batch_commit_size: int = DEFAULT_COMMIT_BATCH_SIZE,
+    stop_event: Optional[threading.Event] = None
 ) -> Dict[str, Any]:
     """
     Process files in parallel using database to track progress.
@@ -251,6 +281,11 @@ def process_files_parallel(
         settings: Additional settings to pass to processing function
         progress_callback: Optional callback function to report progress
         enable_dynamic_scaling: Whether to dynamically adjust workers and batch size
+        batch_commit_size: Number of file results written per database transaction
+        stop_event: Optional event that stops processing when set; files
+                    already running are finished and committed first. A
+                    KeyboardInterrupt stops at once and returns the running
+                    files to pending
         
     Returns:
         Dictionary with processing statistics
@@ -268,7 +303,7 @@ def process_files_parallel(
     # Set process title for main process
     setproctitle.setproctitle(f"pii-main-{os.getpid()}")
     
-    start_time = time.time()
+    start_time = time.monotonic()
     stats_queue = SafeQueue()
     files_remaining = True
     processed_count = 0
@@ -283,7 +318,7 @@ def process_files_parallel(
     # Initialize scaling variables
     current_batch_size = batch_size
     current_max_workers = max_workers
-    last_scaling_check = time.time()
+    last_scaling_check = time.monotonic()
     scaling_stats = {
         'adjustments': 0,
         'worker_increases': 0,
@@ -294,10 +329,42 @@ def process_files_parallel(
     
     # Create a process pool with fixed number of workers
     # Use ProcessPoolExecutor for true parallelism
-    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+    mp_context = None
+    if WORKER_START_METHOD in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context(WORKER_START_METHOD)
+    
+    def create_executor():
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=init_worker,
+            initargs=(settings,)
+        )
+    
+    executor = create_executor()
+    
+    def submit_chunk(chunk):
+        nonlocal executor
+        try:
+            # Settings were handed to each worker by init_worker
+            return executor.submit(process_file_chunk, chunk, db_path, job_id)
+        except concurrent.futures.process.BrokenProcessPool:
+            # A worker died (e.g. killed for memory during OCR), which breaks
+            # the whole pool; replace it so the remaining files can run
+            logger.warning("Worker pool broken, starting a new one")
+            executor.shutdown(wait=False)
+            executor = create_executor()
+            return executor.submit(process_file_chunk, chunk, db_path, job_id)
+    
+    pending_results = []
+    interrupted = False
+    try:
         while files_remaining and (max_files is None or processed_count < max_files):
+            if stop_event is not None and stop_event.is_set():
+                break
+            
             # Dynamic scaling: periodically check and adjust resources
-            if enable_dynamic_scaling and time.time() - last_scaling_check > SCALING_INTERVAL:
+            if enable_dynamic_scaling and time.monotonic() - last_scaling_check > SCALING_INTERVAL:
                 # Check current CPU and memory utilization
                 utilization = get_system_utilization()
                 cpu_percent = utilization['cpu_percent']
@@ -345,7 +412,7 @@ def process_files_parallel(
                         scaling_stats['batch_decreases'] += 1
                 
                 # Update last check time
-                last_scaling_check = time.time()
+                last_scaling_check = time.monotonic()
             
             # Get batch of pending files using current batch size
             limit = min(current_batch_size, max_files - processed_count if max_files else current_batch_size)
@@ -358,81 +425,132 @@ def process_files_parallel(
             # Log batch information
             logger.info(f"Processing batch of {len(pending_files)} files")
             
-            # Submit jobs to process pool
-            futures = []
-            for i, (file_id, file_path) in enumerate(pending_files):
-                # Mark file as processing
-                if db.mark_file_processing(file_id):
-                    # Assign a worker ID for tracking
-                    worker_settings = settings.copy()
-                    worker_settings['worker_id'] = i
-                    
-                    futures.append(
-                        executor.submit(
-                            process_single_file_process_safe,
-                            file_id,
-                            file_path,
-                            db_path,
-                            job_id,
-                            worker_settings
-                        )
-                    )
+            # Mark files as processing
+            files_to_submit = [
+                (file_id, file_path) for file_id, file_path in pending_files
+                if db.mark_file_processing(file_id)
+            ]
+            
+            # Submit files to the process pool in chunks so that pickling and
+            # dispatch overhead is shared by several files
+            chunk_size = calculate_chunk_size(len(files_to_submit), max_workers)
+            futures = {}
+            for i in range(0, len(files_to_submit), chunk_size):
+                chunk = files_to_submit[i:i + chunk_size]
+                future = submit_chunk(chunk)
+                futures[future] = chunk
             
             # Wait for the batch to complete
-            batch_start_time = time.time()
+            batch_start_time = time.monotonic()
             batch_files_processed = 0
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    result = future.result()
-                    batch_files_processed += 1
+            pending_results = []
+            last_commit_time = time.monotonic()
+            cancelled = False
+            not_done = set(futures)
+            
+            # Files of failed chunks, retried one at a time once nothing else
+            # runs, so a file that kills its worker only takes itself down
+            retry_files = []
+            retry_futures = set()
+            while not_done or (retry_files and not cancelled):
+                if not not_done:
+                    retry_chunk = [retry_files.pop(0)]
+                    retry = submit_chunk(retry_chunk)
+                    futures[retry] = retry_chunk
+                    retry_futures.add(retry)
+                    not_done.add(retry)
+                
+                # Wait with a timeout so a stop request is noticed while
+                # long chunks are still running
+                done, not_done = concurrent.futures.wait(
+                    not_done, timeout=STOP_CHECK_INTERVAL,
+                    return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                
+                # On a stop request, drop chunks that haven't started yet and
+                # let the running ones finish so their results are kept
+                if not cancelled and stop_event is not None and stop_event.is_set():
+                    logger.info("Stop requested, finishing files already in progress")
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    cancelled = True
+                
+                for future in done:
+                    if future.cancelled():
+                        continue
                     
-                    if result.get('success', False):
-                        # Update the database with results
-                        db.store_file_results(
-                            result['file_id'], 
-                            result['processing_time'], 
-                            result.get('entities', []), 
-                            result.get('metadata', {})
-                        )
-                        db.mark_file_completed(result['file_id'], job_id)
-                        stats_queue.add_processed()
-                        processed_count += 1
-                    else:
-                        # Mark as error
-                        db.mark_file_error(result['file_id'], job_id, result.get('error_message', 'Unknown error'))
-                        stats_queue.add_error()
-                        error_count += 1
+                    try:
+                        chunk_results, unsupported_counts = future.result()
+                        add_unsupported_counts(unsupported_counts)
+                    except Exception as e:
+                        logger.error(f"Worker process error: {e}")
+                        
+                        # Files of a stopped job are returned to pending below
+                        if cancelled:
+                            continue
+                        
+                        # Files analyzed before the failure are lost with the
+                        # chunk, and a dead worker fails every chunk in the
+                        # pool; only a file that fails on its own is an error
+                        if future not in retry_futures:
+                            retry_files.extend(futures[future])
+                            continue
+                        
+                        # Record and report the file so it isn't left in 'processing'
+                        for file_id, file_path in futures[future]:
+                            db.mark_file_error(file_id, job_id, str(e))
+                            stats_queue.add_error()
+                            error_count += 1
+                            if progress_callback:
+                                progress_callback({
+                                    'type': 'file_error',
+                                    'file_id': file_id,
+                                    'file_path': file_path,
+                                    'error': str(e)
+                                })
+                        continue
+                    
+                    for result in chunk_results:
+                        batch_files_processed += 1
+                        pending_results.append(result)
                     
-                    # Call progress callback if provided
-                    if progress_callback:
-                        progress_callback({
-                            'type': 'file_completed' if result.get('success', False) else 'file_error',
-                            'file_id': result.get('file_id'),
-                            'file_path': result.get('file_path'),
-                            'entities': result.get('entities', []),
-                            'error': result.get('error_message') if not result.get('success', False) else None
-                        })
+                        if result.get('success', False):
+                            stats_queue.add_processed()
+                            processed_count += 1
+                        else:
+                            stats_queue.add_error()
+                            error_count += 1
+                    
+                    # Write results in batches rather than one transaction per file
+                    if (len(pending_results) >= batch_commit_size or
+                            time.monotonic() - last_commit_time >= COMMIT_INTERVAL):
+                        failed_count = commit_results(db, job_id, pending_results, progress_callback)
+                        processed_count -= failed_count
+                        error_count += failed_count
+                        pending_results = []
+                        last_commit_time = time.monotonic()
                     
                     # Check progress more frequently
                     total_processed = processed_count + error_count
-                    if total_processed % 5 == 0 and total_processed > 0:
-                        elapsed = time.time() - start_time
+                    if total_processed // 5 > (total_processed - len(chunk_results)) // 5:
+                        elapsed = time.monotonic() - start_time
                         rate = total_processed / elapsed if elapsed > 0 else 0
                         logger.info(f"Processed {total_processed} files in {elapsed:.2f}s ({rate:.2f} files/sec)")
-                        
-                except Exception as e:
-                    logger.error(f"Worker process error: {e}")
-                    error_count += 1
-                    
-                    # Call progress callback for errors if provided
-                    if progress_callback:
-                        progress_callback({
-                            'type': 'file_error',
-                            'error': str(e)
-                        })
+            
+            # Write any results left over from this batch
+            if pending_results:
+                failed_count = commit_results(db, job_id, pending_results, progress_callback)
+                processed_count -= failed_count
+                error_count += failed_count
+                pending_results = []
+            
+            # Files in cancelled chunks never started; return them to pending
+            if cancelled:
+                reset_count = db.reset_processing_files(job_id)
+                logger.info(f"Returned {reset_count} unstarted files to pending")
             
             # Log batch statistics
-            batch_elapsed = time.time() - batch_start_time
+            batch_elapsed = time.monotonic() - batch_start_time
             batch_rate = batch_files_processed / batch_elapsed if batch_elapsed > 0 else 0
             logger.info(f"Batch completed: {batch_files_processed} files in {batch_elapsed:.2f}s ({batch_rate:.2f} files/sec)")
             
@@ -441,9 +559,28 @@ def process_files_parallel(
             if mem.percent > 90:
                 logger.warning(f"Memory pressure detected ({mem.percent}% used), reducing batch size")
                 current_batch_size = max(MIN_BATCH_SIZE, current_batch_size // 2)  # Maintain minimum batch size of 50
+    except KeyboardInterrupt:
+        # A second stop request: abandon the files still running rather than
+        # waiting for them, since workers ignore SIGINT
+        logger.info("Processing interrupted, abandoning files in progress")
+        interrupted = True
+        files_remaining = True
+        terminate_workers(executor)
+    finally:
+        executor.shutdown(wait=not interrupted, cancel_futures=interrupted)
+    
+    if interrupted:
+        # Keep the results already collected and return the abandoned files
+        # to pending so a resumed job processes them
+        if pending_results:
+            failed_count = commit_results(db, job_id, pending_results, progress_callback)
+            processed_count -= failed_count
+            error_count += failed_count
+        reset_count = db.reset_processing_files(job_id)
+        logger.info(f"Returned {reset_count} abandoned files to pending")
     
     # Update job status
-    elapsed = time.time() - start_time
+    elapsed = time.monotonic() - start_time
     rate = processed_count / elapsed if elapsed > 0 else 0
     
     # Log scaling statistics
@@ -468,12 +605,178 @@ def process_files_parallel(
         'scaling_stats': scaling_stats if enable_dynamic_scaling else {}
     }
 
+def terminate_workers(executor: concurrent.futures.ProcessPoolExecutor) -> None:
+    """
+    Stop an executor's worker processes without waiting for their tasks.
+    ProcessPoolExecutor has no public way to stop running tasks, so the
+    worker processes are terminated directly.
+    
+    Args:
+        executor: Process pool whose workers should stop
+    """
+    for process in list((getattr(executor, '_processes', None) or {}).values()):
+        if process.is_alive():
+            process.terminate()
+
+def commit_results(
+    db: PIIDatabase,
+    job_id: int,
+    results: List[Dict[str, Any]],
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> int:
+    """
+    Write a batch of worker results to the database in a single transaction
+    and report each of them to the progress callback. If the transaction
+    fails, the files are stored one at a time instead.
+    
+    Args:
+        db: Database connection
+        job_id: Job ID the files belong to
+        results: Worker result dictionaries
+        progress_callback: Optional callback function to report progress
+        
+    Returns:
+        Number of successful results that could not be stored and were
+        recorded as errors instead
+    """
+    failed_count = 0
+    if not db.store_results_batch(job_id, results):
+        # The whole batch was rolled back; store each file on its own so one
+        # bad result doesn't leave the others stuck in 'processing'
+        logger.warning(f"Batch commit of {len(results)} results failed, storing files individually")
+        stored_results = []
+        for result in results:
+            stored = commit_single_result(db, job_id, result)
+            if result.get('success', False) and not stored.get('success', False):
+                failed_count += 1
+            stored_results.append(stored)
+        results = stored_results
+    
+    if progress_callback:
+        for result in results:
+            success = result.get('success', False)
+            progress_callback({
+                'type': 'file_completed' if success else 'file_error',
+                'file_id': result.get('file_id'),
+                'file_path': result.get('file_path'),
+                'entities': result.get('entities', []),
+                'error': result.get('error_message') if not success else None
+            })
+    
+    return failed_count
+
+def commit_single_result(
+    db: PIIDatabase,
+    job_id: int,
+    result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Write one worker result to the database in its own transactions.
+    
+    Args:
+        db: Database connection
+        job_id: Job ID the file belongs to
+        result: Worker result dictionary
+        
+    Returns:
+        The result, or an error result if a successful one could not be stored
+    """
+    file_id = result.get('file_id')
+    
+    if result.get('success', False):
+        if (db.store_file_results(
+                file_id,
+                result.get('processing_time', 0),
+                result.get('entities', []),
+                result.get('metadata', {})
+            ) and db.mark_file_completed(file_id, job_id)):
+            return result
+        
+        result = dict(result, success=False, error_message="Could not store file results")
+    
+    db.mark_file_error(file_id, job_id, result.get('error_message', 'Unknown error'))
+    return result
+
+def calculate_chunk_size(file_count: int, worker_count: int) -> int:
+    """
+    Calculate how many files to send to a worker in a single task.
+    Larger chunks cut per-task IPC overhead, while keeping several chunks
+    per worker leaves room to balance uneven file sizes.
+    
+    Args:
+        file_count: Number of files to be submitted
+        worker_count: Number of worker processes
+        
+    Returns:
+        Number of files per task
+    """
+    return max(1, min(MAX_TASK_CHUNK_SIZE, file_count // (max(1, worker_count) * CHUNKS_PER_WORKER)))
+
+def process_file_chunk(
+    files: List[Tuple[int, str]],
+    db_path: str,
+    job_id: int
+) -> Tuple[List[Dict[str, Any]], Counter]:
+    """
+    Process several files in a worker process as a single task.
+    
+    Args:
+        files: List of (file_id, file_path) tuples
+        db_path: Path to the database
+        job_id: ID of the current job
+        
+    Returns:
+        Tuple of processing result dictionaries, one per file, and the
+        unsupported file counts by extension for the main process to report
+    """
+    results = [
+        process_single_file_process_safe(file_id, file_path, db_path, job_id)
+        for file_id, file_path in files
+    ]
+    
+    # Write this chunk's buffered log records while the worker is known alive
+    flush_log_buffers()
+    return results, take_unsupported_counts()
+
+def init_worker(settings: Dict[str, Any]) -> None:
+    """
+    Initialize a worker process before it takes any tasks.
+    Stores the job settings and loads the analyzer once per process
+    rather than once per file.
+    
+    Args:
+        settings: Processing settings shared by all tasks
+    """
+    WORKER_SETTINGS.clear()
+    WORKER_SETTINGS.update(settings)
+    WORKER_SETTINGS.setdefault('worker_id', os.getpid())
+    
+    # Ctrl+C is handled by the main process, which lets running files finish
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    # Workers leave through os._exit, which skips logging shutdown; flush
+    # buffered log records from the process's exit finalizers instead
+    Finalize(None, flush_log_buffers, exitpriority=10)
+    
+    # Set process title for identifying in monitoring tools
+    setproctitle.setproctitle(f"pii-worker-{WORKER_SETTINGS['worker_id']}")
+    
+    # Read system utilization from the monitor's shared block if it runs
+    set_system_stats_source(WORKER_SETTINGS.get('system_stats_name'))
+    
+    try:
+        # Pay the analyzer/model import cost up front
+        import src.core.pii_analyzer_adapter  # noqa: F401
+    except Exception as e:
+        # Leave the error to be reported per file by the task itself
+        logger.warning(f"Could not preload analyzer in worker {os.getpid()}: {e}")
+
 def process_single_file_process_safe(
     file_id: int,
     file_path: str,
     db_path: str,
     job_id: int,
-    settings: Dict[str, Any]
+    settings: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Process a single file safely in a separate process.
@@ -484,11 +787,14 @@ def process_single_file_process_safe(
         file_path: Path to the file
         db_path: Path to the database
         job_id: ID of the current job
-        settings: Processing settings
+        settings: Processing settings (None to use the settings set by init_worker)
         
     Returns:
         Processing result dictionary
     """
+    if settings is None:
+        settings = WORKER_SETTINGS
+    
     try:
         # Import the pii_analyzer_adapter in the worker process
         from src.core.pii_analyzer_adapter import analyze_file
@@ -496,9 +802,6 @@ def process_single_file_process_safe(
         # Process the file
         start_time = time.time()
         
-        # Set process title for identifying in monitoring tools
-        setproctitle.setproctitle(f"pii-worker-{settings.get('worker_id', os.getpid())}")
-        
         result = analyze_file(file_path, settings)
         
         # Add file ID and path to result for tracking
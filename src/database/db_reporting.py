@@ -10,12 +10,16 @@ classification and reporting scripts.
 import os
 import json
 import math
+import functools
 from datetime import datetime, timedelta
 from typing import Dict, List, Set, Optional, Any, Tuple
 from collections import defaultdict
 
 from .db_utils import get_database
 
+# Number of (database, job, version) summary statistics kept by get_summary_statistics
+SUMMARY_STATS_CACHE_SIZE = 32
+
 def get_file_processing_stats(db_path: str, job_id: Optional[int] = None) -> Dict[str, int]:
     """
     Get statistics about file processing status for a job.
@@ -239,9 +243,8 @@ def load_pii_data_from_db(db_path: str, job_id: Optional[int] = None, threshold:
     # Get file processing status statistics
     processing_stats = get_file_processing_stats(db_path, job_id)
     
-    # Get all completed files for this job
-    files = db.get_completed_files(job_id)
-    total_completed = len(files)
+    # Count completed files for this job
+    total_completed = db.get_job_counters(job_id).completed
     
     # Get processing time statistics
     time_stats = get_processing_time_stats(db_path, job_id)
@@ -249,42 +252,17 @@ def load_pii_data_from_db(db_path: str, job_id: Optional[int] = None, threshold:
     # Structure to hold results
     results = []
     
-    # Get file results with entities
-    for file_data in files:
-        file_id = file_data['file_id']
-        file_path = file_data['file_path']
-        
-        # Get result record
-        result = db.get_result_by_file_id(file_id)
-        if not result:
-            continue
-            
-        result_id = result['result_id']
-        
-        # Get entities
-        entities = db.get_entities_by_result_id(result_id)
-        
-        # Filter entities by threshold
-        filtered_entities = [
-            {
-                'entity_type': entity['entity_type'],
-                'text': entity['text'],
-                'score': entity['score'],
-                'start_index': entity['start_index'],
-                'end_index': entity['end_index']
-            }
-            for entity in entities if entity['score'] >= threshold
-        ]
-        
+    # Get file results with entities at or above the threshold, filtered in SQL
+    for file_data, result, entities in db.iter_completed_results(job_id, threshold):
         # Create file result object (similar to JSON structure)
         file_result = {
-            'file_path': file_path,
+            'file_path': file_data['file_path'],
             'file_size': file_data.get('file_size', 0),
             'file_type': file_data.get('file_type', ''),
-            'entity_count': len(filtered_entities),
+            'entity_count': len(entities),
             'extraction_method': result.get('extraction_method', 'unknown'),
             'processing_time': result.get('processing_time', 0),
-            'entities': filtered_entities
+            'entities': entities
         }
         
         results.append(file_result)
@@ -310,6 +288,41 @@ def load_pii_data_from_db(db_path: str, job_id: Optional[int] = None, threshold:
     
     return pii_data
 
+def iter_entity_types_from_db(db_path: str, job_id: Optional[int] = None, threshold: float = 0.7):
+    """
+    Stream each completed file's entity types, for analyses that don't need
+    the individual entities.
+    
+    Args:
+        db_path: Path to the database file
+        job_id: Specific job ID to load (most recent if None)
+        threshold: Confidence threshold for filtering entities
+        
+    Yields:
+        File result dictionaries with one entity per distinct entity type,
+        carrying the type's highest score and no text
+    """
+    # Connect to database
+    db = get_database(db_path)
+    
+    # Get job ID if not provided
+    if job_id is None:
+        jobs = db.get_all_jobs()
+        if not jobs:
+            raise ValueError(f"No jobs found in database: {db_path}")
+        job_id = jobs[0]['job_id']  # Get most recent job
+    elif not db.get_job(job_id):
+        raise ValueError(f"Job ID {job_id} not found in database: {db_path}")
+    
+    for file_path, entity_types in db.iter_entity_types(job_id, threshold):
+        yield {
+            'file_path': file_path,
+            'entities': [
+                {'entity_type': entity_type, 'score': score, 'text': ''}
+                for entity_type, score in entity_types.items()
+            ]
+        }
+
 def convert_db_to_json_format(db_path: str, output_path: str, job_id: Optional[int] = None, threshold: float = 0.7) -> str:
     """
     Convert database contents to a JSON file compatible with the original format.
@@ -390,4 +403,60 @@ def get_entity_statistics(db_path: str, job_id: Optional[int] = None, threshold:
     # Get entity statistics using SQL aggregation
     entity_counts = db.get_entity_counts_by_type(job_id, threshold)
     
-    return entity_counts 
\ No newline at end of file
+    return entity_counts 
+
+def get_database_version(db_path: str) -> Tuple[int, ...]:
+    """
+    Get a value that changes whenever the database is written.
+    
+    Commits land in the write-ahead log before they are checkpointed into the
+    main file, so the modification time and size of both are used. Opening a
+    connection creates an empty log, which counts the same as a missing one.
+    
+    Args:
+        db_path: Path to the database file
+        
+    Returns:
+        Tuple of modification times and sizes (zeros for missing files)
+    """
+    version = []
+    for path in (db_path, db_path + '-wal'):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        if stat is not None and stat.st_size:
+            version.extend((stat.st_mtime_ns, stat.st_size))
+        else:
+            version.extend((0, 0))
+    return tuple(version)
+
+@functools.lru_cache(maxsize=SUMMARY_STATS_CACHE_SIZE)
+def _cached_summary_statistics(db_path: str, job_id: Optional[int], version: Tuple[int, ...]):
+    """Query the summary statistics for one version of the database."""
+    return (
+        get_file_type_statistics(db_path, job_id),
+        get_file_processing_stats(db_path, job_id),
+        get_processing_time_stats(db_path, job_id)
+    )
+
+def get_summary_statistics(db_path: str, job_id: Optional[int] = None) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, Any]]:
+    """
+    Get the file type, processing and timing statistics used by executive summaries.
+    
+    Results are cached until the database changes, so regenerating a summary
+    for an unchanged database doesn't query it again.
+    
+    Args:
+        db_path: Path to the database file
+        job_id: Specific job ID to analyze (most recent if None)
+        
+    Returns:
+        Tuple of (file type statistics, file processing statistics,
+        processing time statistics); each is a new dictionary the caller may modify
+    """
+    db_path = os.path.abspath(db_path)
+    file_type_stats, processing_stats, time_stats = _cached_summary_statistics(
+        db_path, job_id, get_database_version(db_path)
+    )
+    return dict(file_type_stats), dict(processing_stats), dict(time_stats)
@@ -8,6 +8,7 @@ import os
 import json
 import sqlite3
 import logging
+from collections import namedtuple
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple, Set
 
@@ -18,6 +19,14 @@ logger = logging.getLogger('pii_database')
 # Schema version for future upgrades
 SCHEMA_VERSION = 2
 
+# File counts for a job by status, from a single GROUP BY query
+JobCounters = namedtuple('JobCounters', ['total', 'completed', 'pending', 'processing', 'error'])
+
+# Connection tuning
+MMAP_SIZE = 256 * 1024 * 1024   # Bytes of the database file read through mmap
+CACHE_SIZE_KB = 64 * 1024       # Page cache size per connection
+BUSY_TIMEOUT_MS = 30000         # How long to wait for a lock before failing
+
 class PIIDatabase:
     """Manages SQLite database operations for the PII Analyzer."""
     
@@ -39,6 +48,21 @@ class PIIDatabase:
             # Connect with foreign key support
             self.conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
             self.conn.execute("PRAGMA foreign_keys = ON")
+            
+            # WAL lets status readers run alongside the writer and, with NORMAL
+            # sync, costs one fsync per checkpoint rather than per commit. The
+            # trade-off is that a power loss can drop the last few commits;
+            # that is acceptable here because interrupted files are simply
+            # picked up again when the job is resumed.
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            self.conn.execute("PRAGMA temp_store = MEMORY")
+            self.conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            self.conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+            
+            # Wait for a concurrent writer (e.g. --status during a run) instead
+            # of failing immediately with "database is locked"
+            self.conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
             self.conn.row_factory = sqlite3.Row
             
             if not exists:
@@ -140,6 +164,7 @@ class PIIDatabase:
                 # Create indexes for performance
                 self.conn.execute("CREATE INDEX idx_files_status ON files(status)")
                 self.conn.execute("CREATE INDEX idx_files_job_id ON files(job_id)")
+                self.conn.execute("CREATE INDEX idx_files_job_status ON files(job_id, status)")
                 self.conn.execute("CREATE INDEX idx_results_file_id ON results(file_id)")
                 self.conn.execute("CREATE INDEX idx_entities_result_id ON entities(result_id)")
                 self.conn.execute("CREATE INDEX idx_entities_type ON entities(entity_type)")
@@ -179,6 +204,11 @@ class PIIDatabase:
                 logger.info("Adding metadata column to results table")
                 cursor.execute("ALTER TABLE results ADD COLUMN metadata TEXT")
                 self.conn.commit()
+            
+            # Per-job status counts and pending-file lookups are answered
+            # from this index alone; databases created before it get it here
+            with self.conn:
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_files_job_status ON files(job_id, status)")
                 
         except Exception as e:
             logger.error(f"Schema verification error: {e}")
@@ -464,6 +494,48 @@ class PIIDatabase:
             logger.error(f"Error registering file {file_path}: {e}")
             return False
     
+    def register_files_batch(self, job_id: int, 
+                             files: List[Tuple[str, int, str, float]]) -> int:
+        """
+        Register a batch of files for processing in a single transaction.
+        Files already registered for the job are skipped.
+        
+        Args:
+            job_id: Job ID these files belong to
+            files: List of (file_path, file_size, file_type, modified_time) tuples
+            
+        Returns:
+            Number of files newly registered
+        """
+        if not files:
+            return 0
+        
+        try:
+            with self.conn:
+                before = self.conn.total_changes
+                
+                self.conn.executemany("""
+                INSERT OR IGNORE INTO files (job_id, file_path, file_size, file_type, modified_time, status)
+                VALUES (?, ?, ?, ?, ?, 'pending')
+                """, [
+                    (job_id, file_path, file_size, file_type, datetime.fromtimestamp(modified_time))
+                    for file_path, file_size, file_type, modified_time in files
+                ])
+                
+                added = self.conn.total_changes - before
+                
+                # Update job total_files count once for the batch
+                if added:
+                    self.conn.execute("""
+                    UPDATE jobs SET total_files = total_files + ?, last_updated = ?
+                    WHERE job_id = ?
+                    """, (added, datetime.now(), job_id))
+                
+                return added
+        except sqlite3.Error as e:
+            logger.error(f"Error registering batch of {len(files)} files for job {job_id}: {e}")
+            return 0
+    
     def get_pending_files(self, job_id: int, limit: int = 100) -> List[Tuple[int, str]]:
         """
         Get list of pending files for processing.
@@ -628,6 +700,84 @@ class PIIDatabase:
             logger.error(f"Error storing results for file {file_id}: {e}")
             return False
     
+    def store_results_batch(self, job_id: int, results: List[Dict[str, Any]]) -> bool:
+        """
+        Store results and final status for a batch of processed files
+        in a single transaction.
+        
+        Args:
+            job_id: Job ID the files belong to
+            results: Worker result dictionaries with file_id, success,
+                     processing_time, entities, metadata and error_message
+            
+        Returns:
+            bool: Success of the operation
+        """
+        try:
+            with self.conn:
+                cursor = self.conn.cursor()
+                now = datetime.now()
+                completed_count = 0
+                error_count = 0
+                
+                for result in results:
+                    file_id = result['file_id']
+                    
+                    if result.get('success', False):
+                        entities = result.get('entities', [])
+                        metadata = result.get('metadata', {})
+                        metadata_json = json.dumps(metadata) if metadata else None
+                        
+                        cursor.execute("""
+                        INSERT INTO results (file_id, entity_count, processing_time, metadata)
+                        VALUES (?, ?, ?, ?)
+                        """, (file_id, len(entities), result.get('processing_time', 0), metadata_json))
+                        
+                        result_id = cursor.lastrowid
+                        
+                        if entities:
+                            cursor.executemany("""
+                            INSERT INTO entities (
+                                result_id, entity_type, text, start_index, 
+                                end_index, score
+                            ) VALUES (?, ?, ?, ?, ?, ?)
+                            """, [
+                                (
+                                    result_id,
+                                    entity.get('entity_type', ''),
+                                    entity.get('text', ''),
+                                    entity.get('start', 0),
+                                    entity.get('end', 0),
+                                    entity.get('score', 0.0)
+                                )
+                                for entity in entities
+                            ])
+                        
+                        cursor.execute("""
+                        UPDATE files SET status = 'completed', process_end = ?
+                        WHERE file_id = ?
+                        """, (now, file_id))
+                        completed_count += 1
+                    else:
+                        cursor.execute("""
+                        UPDATE files SET status = 'error', process_end = ?, error_message = ?
+                        WHERE file_id = ?
+                        """, (now, result.get('error_message', 'Unknown error'), file_id))
+                        error_count += 1
+                
+                # Update job counters once for the whole batch
+                cursor.execute("""
+                UPDATE jobs SET processed_files = processed_files + ?,
+                                error_files = error_files + ?,
+                                last_updated = ?
+                WHERE job_id = ?
+                """, (completed_count, error_count, now, job_id))
+                
+                return True
+        except sqlite3.Error as e:
+            logger.error(f"Error storing results batch for job {job_id}: {e}")
+            return False
+    
     # ---- Query Functions ----
     
     def get_file_entity_types(self, file_id: int) -> List[str]:
@@ -709,28 +859,24 @@ class PIIDatabase:
             logger.error(f"Error getting statistics for job {job_id}: {e}")
             return {}
     
-    def export_to_json(self, job_id: int, include_entities: bool = True) -> Dict[str, Any]:
+    def get_export_header(self, job_id: int) -> Dict[str, Any]:
         """
-        Export job results in the traditional JSON format.
+        Get the job-level fields of a JSON export.
         
         Args:
             job_id: ID of the job to export
-            include_entities: Whether to include detailed entity data
             
         Returns:
-            Dict with results in the original JSON format
+            Dict with job fields, or an empty dict if the job doesn't exist
         """
         try:
             cursor = self.conn.cursor()
-            
-            # Get job details
             cursor.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
             job = cursor.fetchone()
             if not job:
                 return {}
             
-            # Build results structure
-            results = {
+            return {
                 "job_id": job_id,
                 "command_line": job['command_line'],
                 "start_time": job['start_time'],
@@ -738,60 +884,170 @@ class PIIDatabase:
                 "status": job['status'],
                 "total_files": job['total_files'],
                 "processed_files": job['processed_files'],
-                "error_files": job['error_files'],
-                "results": []
+                "error_files": job['error_files']
             }
+        except sqlite3.Error as e:
+            logger.error(f"Error getting export header for job {job_id}: {e}")
+            return {}
+    
+    def iter_export_results(self, job_id: int, include_entities: bool = True):
+        """
+        Stream per-file export results for a job, one file at a time.
+        Uses a single query ordered by file so only the current file's
+        rows are held in memory.
+        
+        Args:
+            job_id: ID of the job to export
+            include_entities: Whether to include detailed entity data
             
-            # Get all processed files
-            cursor.execute("""
-            SELECT f.*, r.entity_count, r.processing_time, r.result_id, r.metadata 
+        Yields:
+            Dict for each file in the original JSON result format
+        """
+        entity_columns = ""
+        entity_join = ""
+        if include_entities:
+            entity_columns = """, e.entity_id, e.entity_type, e.text,
+                   e.start_index, e.end_index, e.score"""
+            entity_join = "LEFT JOIN entities e ON r.result_id = e.result_id"
+        
+        try:
+            cursor = self.conn.cursor()
+            cursor.arraysize = 1000
+            cursor.execute(f"""
+            SELECT f.file_id, f.file_path, f.file_type, f.file_size, f.status,
+                   r.processing_time, r.metadata{entity_columns}
             FROM files f
             LEFT JOIN results r ON f.file_id = r.file_id
+            {entity_join}
             WHERE f.job_id = ?
+            ORDER BY f.file_id
             """, (job_id,))
             
-            files = cursor.fetchall()
-            for file in files:
-                file_result = {
-                    "file_path": file['file_path'],
-                    "file_type": file['file_type'],
-                    "file_size": file['file_size'],
-                    "status": file['status'],
-                    "processing_time": file['processing_time'] if file['processing_time'] else 0,
-                    "entities": []
-                }
-                
-                # Parse and add metadata if available
-                if file['metadata']:
-                    try:
-                        metadata = json.loads(file['metadata'])
-                        file_result['metadata'] = metadata
-                    except json.JSONDecodeError:
-                        pass
-                
-                if include_entities and file['result_id']:
-                    # Get entities for this file
-                    cursor.execute("""
-                    SELECT * FROM entities
-                    WHERE result_id = ?
-                    """, (file['result_id'],))
+            current_id = None
+            file_result = None
+            
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                
+                for row in rows:
+                    if row['file_id'] != current_id:
+                        if file_result is not None:
+                            yield file_result
+                        
+                        current_id = row['file_id']
+                        file_result = {
+                            "file_path": row['file_path'],
+                            "file_type": row['file_type'],
+                            "file_size": row['file_size'],
+                            "status": row['status'],
+                            "processing_time": row['processing_time'] if row['processing_time'] else 0,
+                            "entities": []
+                        }
+                        
+                        # Parse and add metadata if available
+                        if row['metadata']:
+                            try:
+                                file_result['metadata'] = json.loads(row['metadata'])
+                            except json.JSONDecodeError:
+                                pass
                     
-                    entities = cursor.fetchall()
-                    for entity in entities:
+                    if include_entities and row['entity_id'] is not None:
                         file_result['entities'].append({
-                            "entity_type": entity['entity_type'],
-                            "text": entity['text'],
-                            "start": entity['start_index'],
-                            "end": entity['end_index'],
-                            "score": entity['score']
+                            "entity_type": row['entity_type'],
+                            "text": row['text'],
+                            "start": row['start_index'],
+                            "end": row['end_index'],
+                            "score": row['score']
                         })
-                
-                results['results'].append(file_result)
             
-            return results
+            if file_result is not None:
+                yield file_result
         except sqlite3.Error as e:
             logger.error(f"Error exporting results for job {job_id}: {e}")
+    
+    def has_json_functions(self) -> bool:
+        """
+        Check whether this SQLite build provides the JSON functions.
+        
+        Returns:
+            bool: True if json_object and friends are available
+        """
+        try:
+            self.conn.execute("SELECT json_object('a', 1)").fetchone()
+            return True
+        except sqlite3.OperationalError:
+            return False
+    
+    def iter_export_json(self, job_id: int):
+        """
+        Stream per-file export results as JSON text built by SQLite itself.
+        Produces the same documents as iter_export_results without creating
+        a Python object per row; requires has_json_functions().
+        
+        Args:
+            job_id: ID of the job to export
+            
+        Yields:
+            JSON text for each file in the original result format
+        """
+        cursor = self.conn.cursor()
+        cursor.arraysize = 1000
+        cursor.execute("""
+        SELECT CASE WHEN json_valid(metadata)
+                    THEN json_set(doc, '$.metadata', json(metadata))
+                    ELSE doc END
+        FROM (
+            SELECT f.file_id, r.metadata AS metadata, json_object(
+                'file_path', f.file_path,
+                'file_type', f.file_type,
+                'file_size', f.file_size,
+                'status', f.status,
+                'processing_time', COALESCE(r.processing_time, 0),
+                'entities', json((
+                    SELECT json_group_array(json_object(
+                        'entity_type', e.entity_type,
+                        'text', e.text,
+                        'start', e.start_index,
+                        'end', e.end_index,
+                        'score', e.score
+                    ))
+                    FROM entities e
+                    WHERE e.result_id = r.result_id
+                ))
+            ) AS doc
+            FROM files f
+            LEFT JOIN results r ON f.file_id = r.file_id
+            WHERE f.job_id = ?
+            ORDER BY f.file_id
+        )
+        """, (job_id,))
+        
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield row[0]
+    
+    def export_to_json(self, job_id: int, include_entities: bool = True) -> Dict[str, Any]:
+        """
+        Export job results in the traditional JSON format.
+        
+        Args:
+            job_id: ID of the job to export
+            include_entities: Whether to include detailed entity data
+            
+        Returns:
+            Dict with results in the original JSON format
+        """
+        results = self.get_export_header(job_id)
+        if not results:
             return {}
+        
+        results['results'] = list(self.iter_export_results(job_id, include_entities))
+        return results
 
     def get_jobs_by_metadata(self, key: str, value: str) -> List[Dict[str, Any]]:
         """
@@ -980,6 +1236,127 @@ class PIIDatabase:
             logger.error(f"Error getting entities for result {result_id}: {e}")
             return []
     
+    def iter_completed_results(self, job_id: int, min_score: float = 0.0):
+        """
+        Stream completed files with their results and entities, one file at
+        a time, from a single query. Entities below min_score are filtered
+        out by SQLite rather than loaded and discarded.
+        
+        Args:
+            job_id: Job ID to get results for
+            min_score: Minimum entity confidence score to include
+            
+        Yields:
+            Tuple of (file dict, result dict, list of entity dicts) for each
+            completed file that has a result
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.arraysize = 1000
+            cursor.execute("""
+            SELECT f.file_id, f.file_path, f.file_size, f.file_type,
+                   r.result_id, r.processing_time,
+                   e.entity_id, e.entity_type, e.text, e.score, e.start_index, e.end_index
+            FROM files f
+            JOIN results r ON r.result_id = (
+                SELECT MIN(result_id) FROM results WHERE file_id = f.file_id
+            )
+            LEFT JOIN entities e ON e.result_id = r.result_id AND e.score >= ?
+            WHERE f.job_id = ? AND f.status = 'completed'
+            ORDER BY f.file_id, e.entity_id
+            """, (min_score, job_id))
+            
+            current_id = None
+            file_data = result = entities = None
+            
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                
+                for row in rows:
+                    if row['file_id'] != current_id:
+                        if file_data is not None:
+                            yield file_data, result, entities
+                        
+                        current_id = row['file_id']
+                        file_data = {
+                            'file_id': row['file_id'],
+                            'file_path': row['file_path'],
+                            'file_size': row['file_size'],
+                            'file_type': row['file_type']
+                        }
+                        result = {
+                            'result_id': row['result_id'],
+                            'processing_time': row['processing_time']
+                        }
+                        entities = []
+                    
+                    if row['entity_id'] is not None:
+                        entities.append({
+                            'entity_type': row['entity_type'],
+                            'text': row['text'],
+                            'score': row['score'],
+                            'start_index': row['start_index'],
+                            'end_index': row['end_index']
+                        })
+            
+            if file_data is not None:
+                yield file_data, result, entities
+        except sqlite3.Error as e:
+            logger.error(f"Error getting completed results for job {job_id}: {e}")
+    
+    def iter_entity_types(self, job_id: int, min_score: float = 0.0):
+        """
+        Stream the distinct entity types of each completed file. SQLite
+        filters and groups the entities, so one row per file and type is
+        returned instead of one per entity.
+        
+        Args:
+            job_id: Job ID to get entity types for
+            min_score: Minimum entity confidence score to include
+            
+        Yields:
+            Tuple of (file path, dict mapping entity type to its highest
+            score) for each completed file with entities at or above min_score
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.arraysize = 1000
+            cursor.execute("""
+            SELECT f.file_id, f.file_path, e.entity_type, MAX(e.score) AS score
+            FROM files f
+            JOIN results r ON r.result_id = (
+                SELECT MIN(result_id) FROM results WHERE file_id = f.file_id
+            )
+            JOIN entities e ON e.result_id = r.result_id AND e.score >= ?
+            WHERE f.job_id = ? AND f.status = 'completed'
+            GROUP BY f.file_id, e.entity_type
+            ORDER BY f.file_id
+            """, (min_score, job_id))
+            
+            current_id = None
+            file_path = entity_types = None
+            
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                
+                for row in rows:
+                    if row['file_id'] != current_id:
+                        if file_path is not None:
+                            yield file_path, entity_types
+                        current_id = row['file_id']
+                        file_path = row['file_path']
+                        entity_types = {}
+                    entity_types[row['entity_type']] = row['score']
+            
+            if file_path is not None:
+                yield file_path, entity_types
+        except sqlite3.Error as e:
+            logger.error(f"Error getting entity types for job {job_id}: {e}")
+    
     def get_files_by_job_id(self, job_id: int) -> List[Dict[str, Any]]:
         """
         Get all files for a job.
@@ -1315,6 +1692,26 @@ class PIIDatabase:
             logger.error(f"Error getting file status counts for job {job_id}: {e}")
             return {}
 
+    def get_job_counters(self, job_id: int) -> JobCounters:
+        """
+        Get file counts for a job, by status and in total, from one query.
+        
+        Args:
+            job_id: Job ID to get counts for
+            
+        Returns:
+            JobCounters with total, completed, pending, processing and error counts
+        """
+        counts = self.get_file_status_counts(job_id)
+        
+        return JobCounters(
+            total=sum(counts.values()),
+            completed=counts.get('completed', 0),
+            pending=counts.get('pending', 0),
+            processing=counts.get('processing', 0),
+            error=counts.get('error', 0)
+        )
+
     def reset_processing_files(self, job_id: int) -> int:
         """
         Reset files in 'processing' status to 'pending'.
@@ -1,6 +1,6 @@
 from typing import Optional, Tuple, Dict, Union, List
 
-from ..utils.file_utils import get_extraction_method, is_supported_format
+from ..utils.file_utils import get_extraction_method
 from ..utils.logger import app_logger as logger
 from .tika_extractor import TikaExtractor
 from .ocr_extractor import OCRExtractor
@@ -64,13 +64,13 @@ class ExtractorFactory:
         Raises:
             ValueError: If file format is not supported
         """
-        if not is_supported_format(file_path):
+        # One extension lookup both validates the format and picks the method
+        extraction_method = get_extraction_method(file_path)
+        if extraction_method is None:
             raise ValueError(f"Unsupported file format: {file_path}")
             
         if force_ocr:
             return 'ocr'
-            
-        extraction_method = get_extraction_method(file_path)
         
         if extraction_method == 'tika':
             return 'tika'
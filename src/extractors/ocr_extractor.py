@@ -10,6 +10,7 @@ from pdf2image import convert_from_path
 from PIL import Image
 
 from ..utils.logger import app_logger as logger
+from ..utils.system_stats import get_available_memory_gb
 
 class OCRExtractor:
     """Text extraction using OCR for image-based files."""
@@ -72,7 +73,7 @@ class OCRExtractor:
             cpu_count = os.cpu_count() or 1
             
             # Check available memory
-            available_memory_gb = psutil.virtual_memory().available / (1024 * 1024 * 1024)
+            available_memory_gb = get_available_memory_gb()
             
             # Tesseract is memory intensive, so we need to consider memory constraints
             # Each OCR thread can use approximately 200-300MB of memory
@@ -5,67 +5,112 @@ Command-line tool for PII Analysis with resumable processing
 
 import os
 import sys
+import stat
 import argparse
 import logging
 import time
+import json
 import glob
 import re
 import multiprocessing
 import threading
 import signal
-import psutil
+import functools
 from typing import Dict, Any, List, Optional
 
+# orjson is optional; it encodes exports several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the project root to path if needed
 sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
-# Add Rich for better progress visualization
-from rich.console import Console
-from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
-from rich.table import Table
-from rich.prompt import Prompt
-from rich.panel import Panel
-from rich.live import Live
-
+# Rich, psutil and the analyzer are imported inside the functions that use
+# them so that --help, --status and --list-jobs start quickly
 from src.database.db_utils import get_database
 from src.core.file_discovery import (
     scan_directory,
     find_resumption_point,
-    reset_stalled_files,
-    get_file_statistics
+    reset_stalled_files
 )
-from src.core.worker_management import (
-    process_files_parallel,
-    estimate_completion_time,
-    calculate_optimal_workers
-)
-from src.core.pii_analyzer_adapter import analyze_file
 
-# Initialize rich console
-console = Console()
+@functools.lru_cache(maxsize=None)
+def get_console():
+    """
+    Get the shared Rich console, creating it on first use
+    
+    Returns:
+        Rich Console instance
+    """
+    from rich.console import Console
+    return Console()
+
+# Configure logging; the log file only records warnings and errors unless
+# --debug is given, so routine info records don't hit the disk
+file_handler = logging.FileHandler('pii_analyzer.log')
+file_handler.setLevel(logging.WARNING)
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('pii_analyzer.log')
+        file_handler
     ]
 )
 logger = logging.getLogger('pii_analyzer')
 
-# Default supported file extensions
-DEFAULT_EXTENSIONS = {
-    '.txt', '.pdf', '.docx', '.doc', '.rtf',
-    '.xlsx', '.xls', '.csv', '.tsv',
-    '.pptx', '.ppt',
-    '.json', '.xml', '.html', '.htm',
-    '.md', '.log'
+# Default supported file extensions (lowercase, without the dot)
+DEFAULT_EXTENSIONS = frozenset({
+    'txt', 'pdf', 'docx', 'doc', 'rtf',
+    'xlsx', 'xls', 'csv', 'tsv',
+    'pptx', 'ppt',
+    'json', 'xml', 'html', 'htm',
+    'md', 'log'
+})
+
+# Status snapshots written by a running job so that --status can avoid the database
+STATUS_SNAPSHOT_DIR = 'logs'
+STATUS_SNAPSHOT_INTERVAL = 5.0   # Seconds between snapshot writes
+STATUS_SNAPSHOT_MAX_AGE = 30.0   # Older snapshots are ignored in favour of the database
+
+# Progress display settings
+PROGRESS_RECONCILE_INTERVAL = 100   # Completed files between database count checks
+PROGRESS_REFRESH_INTERVAL = 0.1     # Minimum seconds between progress repaints
+
+# Seconds between performance monitor refreshes
+MONITOR_INTERVAL = 2.0
+
+# Rich colors for job statuses in status tables
+STATUS_COLORS = {
+    'completed': 'green',
+    'running': 'blue',
+    'interrupted': 'yellow',
+    'error': 'red',
+    'unknown': 'magenta'
 }
 
-def parse_args():
-    """Parse command line arguments"""
+def canonical_path(path: str) -> str:
+    """
+    Normalize a directory argument to the absolute form stored with jobs
+    
+    Args:
+        path: Path as given on the command line
+        
+    Returns:
+        Absolute, normalized path (no trailing slash or ./ components)
+    """
+    return os.path.abspath(os.fspath(path))
+
+def parse_args(argv: Optional[List[str]] = None):
+    """
+    Parse command line arguments
+    
+    Args:
+        argv: Arguments to parse (None for sys.argv)
+    """
     parser = argparse.ArgumentParser(
         description='PII Analyzer with resumable processing',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -110,7 +155,8 @@ Examples:
     )
     
     # Basic arguments
-    parser.add_argument('directory', nargs='?', help='Directory to scan for files')
+    parser.add_argument('directory', nargs='?', type=canonical_path,
+                        help='Directory to scan for files')
     parser.add_argument('--db-path', type=str, default='pii_results.db',
                         help='Path to database file')
     
@@ -137,7 +183,7 @@ Examples:
                         help='Follow logs of a detached process (by PID or timestamp)')
     parser.add_argument('--list-detached', action='store_true',
                         help='List all detached processes')
-    parser.add_argument('--list-jobs', type=str, metavar='DIRECTORY', 
+    parser.add_argument('--list-jobs', type=canonical_path, metavar='DIRECTORY', 
                         help='List all jobs for a specific directory')
     
     # File filtering
@@ -171,23 +217,147 @@ Examples:
     # Output options
     parser.add_argument('--export', type=str, default=None,
                         help='Export results to JSON file')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Write --export output as JSON Lines, one file result per line')
     parser.add_argument('--status', action='store_true',
-                        help='Show job status and exit')
+                        help='Show job status and exit (uses the snapshot of a running job when fresh)')
     parser.add_argument('--verbose', action='store_true',
                         help='Enable verbose output')
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug mode with detailed logging')
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+def get_status_snapshot_path(job_id: int) -> str:
+    """
+    Get the path of the status snapshot file for a job
+    
+    Args:
+        job_id: Job ID the snapshot belongs to
+        
+    Returns:
+        Path to the snapshot file
+    """
+    return os.path.join(STATUS_SNAPSHOT_DIR, f"status_{job_id}.json")
+
+def write_status_snapshot(snapshot: Dict[str, Any]):
+    """
+    Atomically write a status snapshot for a running job
+    
+    Args:
+        snapshot: Snapshot data, must include 'job_id'
+    """
+    os.makedirs(STATUS_SNAPSHOT_DIR, exist_ok=True)
+    snapshot_path = get_status_snapshot_path(snapshot['job_id'])
+    temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    
+    snapshot['updated_at'] = time.time()
+    with open(temp_path, 'w') as f:
+        json.dump(snapshot, f)
+    
+    # Rename is atomic, so readers never see a partially written snapshot
+    os.replace(temp_path, snapshot_path)
+
+def remove_status_snapshot(job_id: int):
+    """
+    Remove the status snapshot for a job once it stops running
+    
+    Args:
+        job_id: Job ID the snapshot belongs to
+    """
+    try:
+        os.remove(get_status_snapshot_path(job_id))
+    except OSError:
+        pass
+
+def load_status_snapshot(db_path: str, job_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load the most recent fresh status snapshot for a database
+    
+    Args:
+        db_path: Path to the database the snapshot must belong to
+        job_id: Specific job ID to load (None for any job)
+        
+    Returns:
+        Snapshot dictionary, or None if missing or older than STATUS_SNAPSHOT_MAX_AGE
+    """
+    if job_id is not None:
+        snapshot_paths = [get_status_snapshot_path(job_id)]
+    else:
+        snapshot_paths = glob.glob(os.path.join(STATUS_SNAPSHOT_DIR, 'status_*.json'))
+    
+    db_path = os.path.abspath(db_path)
+    now = time.time()
+    latest = None
+    
+    for snapshot_path in snapshot_paths:
+        try:
+            with open(snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            continue
+        
+        if snapshot.get('db_path') != db_path:
+            continue
+        if now - snapshot.get('updated_at', 0) > STATUS_SNAPSHOT_MAX_AGE:
+            continue
+        if latest is None or snapshot['updated_at'] > latest['updated_at']:
+            latest = snapshot
+    
+    return latest
+
+def show_status_snapshot(snapshot: Dict[str, Any]):
+    """
+    Show status of a running job from its status snapshot
+    
+    Args:
+        snapshot: Snapshot dictionary written by the running job
+    """
+    from rich.table import Table
+    
+    console = get_console()
+    
+    table = Table(title=f"Job {snapshot['job_id']} - {snapshot.get('directory', 'unknown')}")
+    table.add_column("Property", style="cyan")
+    table.add_column("Value")
+    
+    running_since = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshot.get('running_since', 0)))
+    age = time.time() - snapshot.get('updated_at', 0)
+    
+    table.add_row("Status", "[blue]running[/blue]")
+    table.add_row("Running Since", running_since)
+    table.add_row("Files Completed", f"[green]{snapshot.get('processed', 0)}[/green]")
+    table.add_row("Files Pending", f"[blue]{snapshot.get('pending', 0)}[/blue]")
+    table.add_row("Files Error", f"[red]{snapshot.get('failed', 0)}[/red]")
+    table.add_row("Last File", snapshot.get('last_file') or 'none')
+    table.add_row("Snapshot Age", f"{age:.0f}s")
+    
+    console.print(table)
+    console.print("")
 
 def show_status(db_path: str, job_id: Optional[int] = None):
     """
     Show status of jobs in the database
     
+    A fresh status snapshot written by a running job is shown in place of
+    that job's database counts; polling --status for a single running job
+    then does not have to query the database at all.
+    
     Args:
         db_path: Path to the database
         job_id: Specific job ID to show (None for all jobs)
     """
+    from rich.table import Table
+    
+    console = get_console()
+    
+    # Use the running job's snapshot if it is fresh enough
+    if job_id is not None:
+        snapshot = load_status_snapshot(db_path, job_id)
+        if snapshot:
+            show_status_snapshot(snapshot)
+            return
+    
     # Connect to database
     db = get_database(db_path)
     
@@ -209,14 +379,15 @@ def show_status(db_path: str, job_id: Optional[int] = None):
     # Display job information
     for job in jobs:
         job_id = job['job_id']
+        
+        # A running job's snapshot is more current than its database rows
+        snapshot = load_status_snapshot(db_path, job_id)
+        if snapshot:
+            show_status_snapshot(snapshot)
+            continue
+        
         status = job.get('status', 'unknown')
-        status_color = {
-            'completed': 'green',
-            'running': 'blue',
-            'interrupted': 'yellow',
-            'error': 'red',
-            'unknown': 'magenta'
-        }.get(status, 'white')
+        status_color = STATUS_COLORS.get(status, 'white')
         
         # Create a table for job details
         table = Table(title=f"Job {job_id} - {job.get('directory', 'unknown')}")
@@ -225,27 +396,30 @@ def show_status(db_path: str, job_id: Optional[int] = None):
         
         # Add rows
         table.add_row("Status", f"[{status_color}]{status}[/{status_color}]")
-        table.add_row("Start Time", job.get('start_time', 'unknown'))
-        table.add_row("Last Update", job.get('last_update', 'unknown'))
+        table.add_row("Start Time", str(job.get('start_time') or 'unknown'))
+        table.add_row("Last Update", str(job.get('last_updated') or 'unknown'))
         
         if 'file_count' in job:
             table.add_row("Total Files", str(job.get('file_count', 0)))
         
         # Get file statistics
-        stats = get_file_statistics(db, job_id)
-        completed = stats.get('completed', 0)
-        pending = stats.get('pending', 0)
-        processing = stats.get('processing', 0)
-        error = stats.get('error', 0)
+        counters = db.get_job_counters(job_id)
+        completed = counters.completed
+        pending = counters.pending
+        processing = counters.processing
+        error = counters.error
         total = completed + pending + processing + error
+        percent = 100.0 / total if total else 0.0
         
-        table.add_row("Files Completed", f"[green]{completed}[/green] ({completed/total*100:.1f}% of {total})")
-        table.add_row("Files Pending", f"[blue]{pending}[/blue] ({pending/total*100:.1f}% of {total})")
-        table.add_row("Files Processing", f"[yellow]{processing}[/yellow] ({processing/total*100:.1f}% of {total})")
-        table.add_row("Files Error", f"[red]{error}[/red] ({error/total*100:.1f}% of {total})")
+        table.add_row("Files Completed", f"[green]{completed}[/green] ({completed * percent:.1f}% of {total})")
+        table.add_row("Files Pending", f"[blue]{pending}[/blue] ({pending * percent:.1f}% of {total})")
+        table.add_row("Files Processing", f"[yellow]{processing}[/yellow] ({processing * percent:.1f}% of {total})")
+        table.add_row("Files Error", f"[red]{error}[/red] ({error * percent:.1f}% of {total})")
         
         # Estimate completion
         if status == 'running' and completed > 0 and pending > 0:
+            from src.core.worker_management import estimate_completion_time
+            
             estimate = estimate_completion_time(db, job_id)
             remaining_time = estimate.get('remaining_seconds', 0)
             remaining_hours = remaining_time // 3600
@@ -271,17 +445,27 @@ def process_directory(args):
     Args:
         args: Parsed command-line arguments
     """
+    from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
+    from src.core.worker_management import process_files_parallel, calculate_optimal_workers
+    from src.core.pii_analyzer_adapter import analyze_file
+    
+    console = get_console()
+    
     if not args.directory:
         console.print("[bold red]Error:[/bold red] Directory is required")
-        return
+        raise SystemExit(2)
     
-    # Expand directory path
-    directory = os.path.abspath(args.directory)
+    # Directory was normalized by canonical_path when arguments were parsed
+    directory = args.directory
     
-    # Check if directory exists
-    if not os.path.isdir(directory):
+    # Check if directory exists; the stat result is reused by the scanner
+    try:
+        root_stat = os.stat(directory)
+    except OSError:
+        root_stat = None
+    if root_stat is None or not stat.S_ISDIR(root_stat.st_mode):
         console.print(f"[bold red]Error:[/bold red] Directory not found: {directory}")
-        return
+        raise SystemExit(2)
     
     # Connect to database
     db = get_database(args.db_path)
@@ -289,7 +473,7 @@ def process_directory(args):
     # Get extensions to process
     extensions = None
     if args.extensions:
-        extensions = set('.' + ext.strip().lstrip('.') for ext in args.extensions.split(','))
+        extensions = frozenset(ext.strip().lstrip('.').lower() for ext in args.extensions.split(','))
     else:
         extensions = DEFAULT_EXTENSIONS
     
@@ -302,7 +486,7 @@ def process_directory(args):
                 console.print(f"[bold red]Error:[/bold red] Job ID {args.job_id} not found or not associated with {directory}")
             else:
                 console.print(f"[bold red]Error:[/bold red] No existing job found for {directory}")
-            return
+            raise SystemExit(1)
         
         # If job is already completed
         if job_info.get('status') == 'completed' and not args.force_restart:
@@ -336,7 +520,8 @@ def process_directory(args):
                 job_id, 
                 directory, 
                 extensions=extensions, 
-                progress_callback=scan_progress_callback
+                progress_callback=scan_progress_callback,
+                root_stat=root_stat
             )
             
             console.print(f"Added {result['added']} new files, removed {result['removed']} missing files")
@@ -368,14 +553,15 @@ def process_directory(args):
             job_id, 
             directory, 
             extensions=extensions, 
-            progress_callback=scan_progress_callback
+            progress_callback=scan_progress_callback,
+            root_stat=root_stat
         )
         
         console.print(f"Added {result['added']} files to the database")
     
     # Get stats before processing
-    stats = get_file_statistics(db, job_id)
-    pending_count = stats.get('pending', 0)
+    counters = db.get_job_counters(job_id)
+    pending_count = counters.pending
     
     if pending_count == 0:
         console.print("[yellow]No pending files to process.[/yellow]")
@@ -407,25 +593,39 @@ def process_directory(args):
     
     console.print(f"[bold blue]Starting processing with {max_workers} worker processes...[/bold blue]")
     
-    # Set up signal handling for graceful termination
+    # Set up signal handling for graceful termination. The handler only sets
+    # a flag; process_files_parallel finishes the files in progress, commits
+    # them and returns, and the job is marked interrupted below.
+    stop_event = threading.Event()
+    
     def signal_handler(sig, frame):
-        console.print("\n[yellow]Interrupting processing...[/yellow]")
-        db.update_job_status(job_id, 'interrupted')
-        sys.exit(0)
+        if stop_event.is_set():
+            # Second Ctrl+C: process_files_parallel catches this, stops the
+            # workers and returns their files to pending
+            raise KeyboardInterrupt
+        console.print("\n[yellow]Interrupting processing, finishing files in progress...[/yellow]")
+        stop_event.set()
     
     signal.signal(signal.SIGINT, signal_handler)
     
     # Get total file count for progress tracking
-    total_files = db.get_file_count_for_job(job_id)
-    completed_files = stats.get('completed', 0)
+    total_files = counters.total
+    completed_files = counters.completed
     
     # Monitor worker processes if requested
     if args.monitor:
         # Start monitoring in a separate thread
+        from src.utils.system_stats import get_system_stats_name, set_system_stats_source
+        
+        # The monitor publishes its samples for this process and the workers
+        stats_name = get_system_stats_name()
+        settings['system_stats_name'] = stats_name
+        set_system_stats_source(stats_name)
+        
         monitor_stop_event = threading.Event()
         monitor_thread = threading.Thread(
             target=monitor_performance,
-            args=(monitor_stop_event, max_workers)
+            args=(monitor_stop_event, max_workers, stats_name)
         )
         monitor_thread.daemon = True
         monitor_thread.start()
@@ -437,45 +637,95 @@ def process_directory(args):
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeElapsedColumn(),
         TimeRemainingColumn(),
+        TextColumn("{task.fields[rate]}"),
         console=console
     ) as progress:
         progress_task = progress.add_task(
             f"Processed: {completed_files} files", 
             total=total_files,
-            completed=completed_files
+            completed=completed_files,
+            rate=""
         )
         
-        last_update_time = time.time()
-        last_completed = completed_files
+        # Smoothed nanoseconds per completed file, updated with integer
+        # arithmetic on every event and only turned into a rate on repaint
+        last_event_ns = time.monotonic_ns()
+        ewma_ns_per_file = 0
+        
+        # Completed files are counted locally and only checked against the
+        # database every PROGRESS_RECONCILE_INTERVAL events
+        completed_counter = completed_files
+        last_render_time = 0.0
+        rate_text = ""
+        
+        # Status snapshot shared with --status callers
+        snapshot = {
+            'job_id': job_id,
+            'db_path': os.path.abspath(args.db_path),
+            'directory': directory,
+            'processed': completed_files,
+            'failed': counters.error,
+            'pending': pending_count,
+            'running_since': time.time(),
+            'last_file': None
+        }
+        last_snapshot_time = 0.0
+        
+        def update_status_snapshot(file_path):
+            nonlocal last_snapshot_time
+            
+            snapshot['last_file'] = file_path
+            snapshot['pending'] = max(0, total_files - snapshot['processed'] - snapshot['failed'])
+            
+            current_time = time.time()
+            if current_time - last_snapshot_time >= STATUS_SNAPSHOT_INTERVAL:
+                try:
+                    write_status_snapshot(snapshot)
+                except OSError as e:
+                    logger.warning(f"Could not write status snapshot: {e}")
+                last_snapshot_time = current_time
         
         # Define progress callback
         def progress_callback(state):
-            nonlocal last_update_time, last_completed
+            nonlocal last_event_ns, ewma_ns_per_file, completed_counter, last_render_time, rate_text
             
             if state['type'] == 'file_completed':
                 # Increment completed count
-                completed_count = db.get_completed_count_for_job(job_id)
-                progress.update(progress_task, completed=completed_count, 
-                                description=f"Processed: {completed_count} files")
+                completed_counter += 1
+                if completed_counter % PROGRESS_RECONCILE_INTERVAL == 0:
+                    completed_counter = db.get_completed_count_for_job(job_id)
+                completed_count = completed_counter
                 
-                # Calculate processing rate every 10 files
-                current_time = time.time()
-                if completed_count % 10 == 0:
-                    elapsed = current_time - last_update_time
-                    files_processed = completed_count - last_completed
-                    
-                    if elapsed > 0 and files_processed > 0:
-                        rate = files_processed / elapsed
-                        progress.console.print(f"Processing rate: {rate:.2f} files/second")
-                        
-                        last_update_time = current_time
-                        last_completed = completed_count
+                snapshot['processed'] = completed_count
+                update_status_snapshot(state.get('file_path'))
+                
+                # Update the moving average time per file (weight 1/16)
+                now_ns = time.monotonic_ns()
+                delta_ns = now_ns - last_event_ns
+                last_event_ns = now_ns
+                if ewma_ns_per_file:
+                    ewma_ns_per_file = (ewma_ns_per_file * 15 + delta_ns) >> 4
+                else:
+                    ewma_ns_per_file = delta_ns
+                
+                # Collapse bursts of events into at most one repaint per interval
+                now = time.monotonic()
+                if now - last_render_time >= PROGRESS_REFRESH_INTERVAL:
+                    if ewma_ns_per_file > 0:
+                        rate_text = f"{1e9 / ewma_ns_per_file:.2f} files/s"
+                    progress.update(progress_task, completed=completed_count, 
+                                    description=f"Processed: {completed_count} files",
+                                    rate=rate_text)
+                    last_render_time = now
             
             elif state['type'] == 'file_error':
                 # Log the error
                 file_path = state.get('file_path', 'unknown')
                 error = state.get('error', 'Unknown error')
-                logger.error(f"Error processing file {file_path}: {error}")
+                logger.error("Error processing file %s: %s", file_path, error)
+                
+                snapshot['failed'] += 1
+                update_status_snapshot(file_path)
         
         # Process files in parallel
         result = process_files_parallel(
@@ -486,14 +736,25 @@ def process_directory(args):
             batch_size=args.batch_size,
             max_files=args.max_files,
             settings=settings,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            stop_event=stop_event
         )
         
+        # Show the final count from the database
+        counters = db.get_job_counters(job_id)
+        completed_count = counters.completed
+        progress.update(progress_task, completed=completed_count,
+                        description=f"Processed: {completed_count} files",
+                        rate=rate_text)
+        
         # Update job status
         if result['status'] == 'completed':
             db.update_job_status(job_id, 'completed')
         else:
             db.update_job_status(job_id, 'interrupted')
+        
+        # Job is no longer running, so --status must read the database again
+        remove_status_snapshot(job_id)
     
     # Stop monitoring if active
     if args.monitor:
@@ -501,10 +762,8 @@ def process_directory(args):
         monitor_thread.join(timeout=1.0)
     
     # Display final statistics
-    stats = get_file_statistics(db, job_id)
-    completed = stats.get('completed', 0)
-    error = stats.get('error', 0)
-    total = db.get_file_count_for_job(job_id)
+    completed = counters.completed
+    error = counters.error
     elapsed = result['elapsed']
     rate = result['rate']
     
@@ -513,63 +772,141 @@ def process_directory(args):
     console.print(f"Average processing rate: {rate:.2f} files/second")
     console.print(f"Job status: {db.get_job_status(job_id)}")
 
-def monitor_performance(stop_event, worker_count):
+def monitor_performance(stop_event, worker_count, stats_name: Optional[str] = None):
     """
     Monitor system performance metrics and display in console
     
     Args:
         stop_event: Event to signal when monitoring should stop
         worker_count: Number of worker processes to expect
+        stats_name: Shared memory block to publish each sample to, so that
+                    workers can read it instead of sampling psutil themselves
     """
+    import psutil
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.live import Live
+    from src.utils.system_stats import SystemStatsPublisher
+    
+    publisher = None
     try:
         # Initialize console for monitoring
         monitor_console = Console()
         
+        if stats_name:
+            publisher = SystemStatsPublisher(stats_name)
+        
+        # psutil.Process objects for the worker pool, keyed by PID. Only
+        # these are polled instead of every process on the machine, and
+        # reusing them keeps the cpu_percent baseline between refreshes.
+        worker_procs = {}
+        last_content = None
+        
         with Live(Panel("[bold]Starting performance monitoring...[/bold]"), 
-                  console=monitor_console, refresh_per_second=1, transient=True) as live:
+                  console=monitor_console, refresh_per_second=0.5, transient=True) as live:
             while not stop_event.is_set():
                 # Get CPU and memory info
                 cpu_percent = psutil.cpu_percent(interval=None)
                 memory = psutil.virtual_memory()
                 
+                if publisher:
+                    publisher.publish(cpu_percent, memory.percent, memory.available / (1 << 30))
+                
+                # Refresh the worker list only when the pool's PIDs change
+                child_pids = {child.pid for child in multiprocessing.active_children()}
+                if child_pids != set(worker_procs):
+                    for pid in child_pids - set(worker_procs):
+                        try:
+                            worker_procs[pid] = psutil.Process(pid)
+                        except psutil.Error:
+                            continue
+                    for pid in set(worker_procs) - child_pids:
+                        del worker_procs[pid]
+                
                 # Get process info
                 process_info = []
                 worker_processes = []
                 
-                for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+                for pid, proc in worker_procs.items():
                     try:
-                        # Track worker processes
-                        if "pii-worker" in proc.info['name'] or "python" in proc.info['name']:
-                            worker_processes.append(proc)
-                            
-                            # Only collect detailed info for top processes
-                            if proc.info['cpu_percent'] > 1.0:
-                                process_info.append(proc.info)
-                    except:
+                        proc_cpu = proc.cpu_percent(interval=None)
+                        worker_processes.append(proc)
+                        
+                        # Only collect detailed info for top processes
+                        if proc_cpu > 1.0:
+                            process_info.append({
+                                'pid': pid,
+                                'name': proc.name(),
+                                'cpu_percent': proc_cpu,
+                                'memory_mb': proc.memory_info().rss / 1024 / 1024
+                            })
+                    except psutil.Error:
                         continue
                 
                 # Sort process info by CPU usage
                 process_info.sort(key=lambda x: x['cpu_percent'], reverse=True)
                 
                 # Create status panel
-                content = f"[bold]System Performance:[/bold]\n"
-                content += f"CPU: {cpu_percent:.1f}% | Memory: {memory.percent:.1f}% ({memory.used/1024/1024/1024:.1f} GB)\n"
-                content += f"Workers running: {len(worker_processes)}/{worker_count}\n\n"
+                parts = [
+                    "[bold]System Performance:[/bold]",
+                    f"CPU: {cpu_percent:.1f}% | Memory: {memory.percent:.1f}% ({memory.used / (1 << 30):.1f} GB)",
+                    f"Workers running: {len(worker_processes)}/{worker_count}",
+                    ""
+                ]
                 
                 if process_info:
-                    content += "[bold]Top Processes:[/bold]\n"
-                    for proc in process_info[:5]:  # Show top 5 processes
-                        content += f"PID {proc['pid']}: {proc['name']} - CPU: {proc['cpu_percent']:.1f}%, Mem: {proc['memory_percent']:.1f}%\n"
+                    parts.append("[bold]Top Processes:[/bold]")
+                    parts.extend(  # Show top 5 processes
+                        f"PID {proc['pid']}: {proc['name']} - CPU: {proc['cpu_percent']:.1f}%, Mem: {proc['memory_mb']:.0f} MB"
+                        for proc in process_info[:5]
+                    )
                 
-                live.update(Panel(content, title="Performance Monitor"))
+                content = "\n".join(parts)
                 
-                # Sleep briefly
-                time.sleep(1)
+                # Only repaint when something visible changed
+                if content != last_content:
+                    live.update(Panel(content, title="Performance Monitor"))
+                    last_content = content
+                
+                # Wait for the next refresh, waking early when stopped
+                stop_event.wait(MONITOR_INTERVAL)
     except Exception as e:
-        logger.error(f"Error in performance monitor: {e}")
+        logger.error("Error in performance monitor: %s", e)
         return
+    finally:
+        if publisher:
+            publisher.close()
+
+def json_default(obj: Any) -> str:
+    """
+    Convert values the json module can't encode, matching orjson's output.
+    
+    Args:
+        obj: Value to convert
+        
+    Returns:
+        ISO 8601 string for dates, str(obj) otherwise
+    """
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode an object as compact JSON bytes, using orjson when available.
+    
+    Args:
+        obj: Object to encode; datetimes are written as ISO strings
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=json_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
-def export_to_json(db_path: str, output_path: str, job_id: Optional[int] = None):
+def export_to_json(db_path: str, output_path: str, job_id: Optional[int] = None,
+                   jsonl: bool = False):
     """
     Export results to JSON file
     
@@ -577,7 +914,12 @@ def export_to_json(db_path: str, output_path: str, job_id: Optional[int] = None)
         db_path: Path to the database
         output_path: Path to output JSON file
         job_id: Specific job ID to export (None for latest job)
+        jsonl: Write one file result per line instead of a single JSON document
     """
+    from rich.table import Table
+    
+    console = get_console()
+    
     # Connect to database
     db = get_database(db_path)
     
@@ -590,12 +932,35 @@ def export_to_json(db_path: str, output_path: str, job_id: Optional[int] = None)
         # Use the most recent job
         job_id = jobs[0]['job_id']
     
-    # Export to JSON
-    import json
-    data = db.export_to_json(job_id)
+    # Export to JSON, streaming one file result at a time
+    header = db.get_export_header(job_id)
+    if not header:
+        console.print(f"[red]Job {job_id} not found in the database.[/red]")
+        raise SystemExit(1)
     
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Let SQLite build each result's JSON when it can, so rows go straight
+    # to the file without becoming Python dictionaries first
+    if db.has_json_functions():
+        rows = (row.encode('utf-8') for row in db.iter_export_json(job_id))
+    else:
+        rows = (encode_json(file_result) for file_result in db.iter_export_results(job_id))
+    
+    with open(output_path, 'wb') as f:
+        if jsonl:
+            for row in rows:
+                f.write(row + b'\n')
+        else:
+            # Write the job fields, leaving the closing brace off to append results
+            f.write(encode_json(header)[:-1] + b',"results":[\n')
+            
+            first = True
+            for row in rows:
+                if not first:
+                    f.write(b',\n')
+                f.write(row)
+                first = False
+            
+            f.write(b'\n]}\n')
     
     # Get job info for summary
     job = db.get_job(job_id)
@@ -636,6 +1001,10 @@ def list_jobs_for_directory(db_path: str, directory: str):
         db_path: Path to the database
         directory: Directory to list jobs for
     """
+    from rich.table import Table
+    
+    console = get_console()
+    
     # Connect to database
     db = get_database(db_path)
     
@@ -657,16 +1026,11 @@ def list_jobs_for_directory(db_path: str, directory: str):
     for job in jobs:
         job_id = job['job_id']
         status = job.get('status', 'unknown')
-        status_color = {
-            'completed': 'green',
-            'running': 'blue',
-            'interrupted': 'yellow',
-            'error': 'red',
-            'unknown': 'magenta'
-        }.get(status, 'white')
+        status_color = STATUS_COLORS.get(status, 'white')
         
-        total_files = db.get_file_count_for_job(job_id)
-        completed_files = db.get_completed_count_for_job(job_id)
+        counters = db.get_job_counters(job_id)
+        total_files = counters.total
+        completed_files = counters.completed
         
         jobs_table.add_row(
             str(job_id),
@@ -686,12 +1050,16 @@ def follow_process(pid_or_timestamp: str):
     Args:
         pid_or_timestamp: Process ID or timestamp of the process to follow
     """
+    console = get_console()
+    
     console.print(f"[yellow]Follow process feature is not implemented in this version.[/yellow]")
 
 def list_detached_processes():
     """
     List all detached PII analysis processes
     """
+    console = get_console()
+    
     console.print(f"[yellow]Detached processes feature is not implemented in this version.[/yellow]")
 
 def detach_process(args):
@@ -701,6 +1069,8 @@ def detach_process(args):
     Args:
         args: Command line arguments
     """
+    console = get_console()
+    
     console.print(f"[yellow]Detach process feature is not implemented in this version.[/yellow]")
 
 def reset_database(db_path: str):
@@ -709,7 +1079,12 @@ def reset_database(db_path: str):
     
     Args:
         db_path: Path to the database file
+        
+    Raises:
+        SystemExit: With exit code 1 if the reset fails
     """
+    console = get_console()
+    
     try:
         # Connect to database
         db = get_database(db_path)
@@ -725,21 +1100,29 @@ def reset_database(db_path: str):
         
     except Exception as e:
         console.print(f"[bold red]Error resetting database:[/bold red] {str(e)}")
-        return 0
+        raise SystemExit(1)
 
 def main():
-    """Main entry point for the application"""
+    """
+    Main entry point for the application
+    
+    Returns:
+        Exit code: 0 on success, 1 on runtime errors, 2 on usage errors
+    """
     # Parse command-line arguments
     args = parse_args()
     
     # Set logging level based on verbosity
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
+        file_handler.setLevel(logging.DEBUG)
     elif args.verbose:
         logging.getLogger().setLevel(logging.INFO)
     else:
         logging.getLogger().setLevel(logging.WARNING)
     
+    console = get_console()
+    
     try:
         # Apply database reset if requested
         if args.reset_db:
@@ -754,7 +1137,7 @@ def main():
         
         # Export results if requested
         if args.export:
-            export_to_json(args.db_path, args.export, args.job_id)
+            export_to_json(args.db_path, args.export, args.job_id, args.jsonl)
             return
         
         # List jobs for directory if requested
@@ -783,6 +1166,7 @@ def main():
         else:
             console.print("[bold red]Error:[/bold red] No operation specified")
             console.print("Use --help for usage information")
+            return 2
     
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -1,9 +1,70 @@
+import atexit
+import concurrent.futures
 import os
 import pathlib
-from typing import List, Optional, Tuple, Union
+from collections import Counter
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, Optional, Tuple, Union
 
 from .logger import app_logger as logger
 
+# Supported file extensions and their extraction methods, built once at import
+_SUPPORTED = {
+    'docx': 'tika',
+    'xlsx': 'tika',
+    'csv': 'tika',
+    'rtf': 'tika',
+    'pdf': 'tika_or_ocr',
+    'jpg': 'ocr',
+    'jpeg': 'ocr',
+    'png': 'ocr',
+    'tiff': 'ocr',
+    'tif': 'ocr',
+    'txt': 'tika'
+}
+_SUPPORTED_KEYS = frozenset(_SUPPORTED)
+
+# Unsupported files seen by get_extraction_method, counted by extension and
+# reported once at exit instead of logging a warning per file. Pool workers
+# exit without running atexit, so their counts are handed to the main process
+# with each task's results
+_unsupported_counts = Counter()
+
+def _log_unsupported_summary() -> None:
+    """Log how many unsupported files were skipped, by extension."""
+    if _unsupported_counts:
+        logger.warning(f"Unsupported file formats skipped: {dict(_unsupported_counts)}")
+
+atexit.register(_log_unsupported_summary)
+
+def take_unsupported_counts() -> Counter:
+    """Return the unsupported file counts seen so far and reset them.
+    
+    Returns:
+        Counter: Number of unsupported files by extension
+    """
+    counts = _unsupported_counts.copy()
+    _unsupported_counts.clear()
+    return counts
+
+def add_unsupported_counts(counts: Counter) -> None:
+    """Add unsupported file counts gathered by another process.
+    
+    Args:
+        counts: Number of unsupported files by extension
+    """
+    _unsupported_counts.update(counts)
+
+# Output directories already created by ensure_directory
+_ensured_directories = set()
+
+# Directories that never hold documents to analyze and are not descended into
+DEFAULT_SKIP_DIRS = frozenset({'.git', '__pycache__', '.venv', 'node_modules'})
+
+# Threads scanning top-level subdirectories in find_files; directory listing
+# is I/O bound, so this exceeds the CPU count (helps most on network mounts)
+FIND_FILES_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 def is_valid_file(file_path: str) -> bool:
     """Check if file exists and is accessible.
     
@@ -15,6 +76,11 @@ def is_valid_file(file_path: str) -> bool:
     """
     return os.path.isfile(file_path) and os.access(file_path, os.R_OK)
 
+@lru_cache(maxsize=4096)
+def _lower_extension(extension: str) -> str:
+    """Lowercase an extension, cached since a run sees few distinct ones."""
+    return extension.lower()
+
 def get_file_extension(file_path: str) -> str:
     """Get file extension.
     
@@ -22,29 +88,31 @@ def get_file_extension(file_path: str) -> str:
         file_path: Path to file
         
     Returns:
-        str: File extension (lowercase, without dot)
+        str: File extension (lowercase, without dot); empty for names like
+             '.hidden' that only have leading dots, as with os.path.splitext
     """
-    return os.path.splitext(file_path)[1].lower().lstrip('.')
+    dot = file_path.rfind('.')
+    sep = file_path.rfind(os.sep)
+    if os.altsep:
+        sep = max(sep, file_path.rfind(os.altsep))
+        
+    # No dot in the file name, or the name starts with it
+    if dot <= sep + 1:
+        return ''
+        
+    # Leading dots don't start an extension ('..hidden', '...')
+    if file_path[sep + 1] == '.' and not file_path[sep + 1:dot].strip('.'):
+        return ''
+        
+    return _lower_extension(file_path[dot + 1:])
 
 def get_supported_extensions() -> dict:
     """Get mapping of supported file extensions to extraction methods.
     
     Returns:
-        dict: Mapping of extensions to extraction methods
+        dict: Mapping of extensions to extraction methods (shared, do not modify)
     """
-    return {
-        'docx': 'tika',
-        'xlsx': 'tika',
-        'csv': 'tika',
-        'rtf': 'tika',
-        'pdf': 'tika_or_ocr',
-        'jpg': 'ocr',
-        'jpeg': 'ocr',
-        'png': 'ocr',
-        'tiff': 'ocr',
-        'tif': 'ocr',
-        'txt': 'tika'
-    }
+    return _SUPPORTED
 
 def is_supported_format(file_path: str) -> bool:
     """Check if file format is supported.
@@ -55,8 +123,7 @@ def is_supported_format(file_path: str) -> bool:
     Returns:
         bool: True if file format is supported
     """
-    extension = get_file_extension(file_path)
-    return extension in get_supported_extensions()
+    return get_file_extension(file_path) in _SUPPORTED_KEYS
 
 def get_extraction_method(file_path: str) -> Optional[str]:
     """Get appropriate extraction method for file.
@@ -68,24 +135,72 @@ def get_extraction_method(file_path: str) -> Optional[str]:
         str: Extraction method ('tika', 'ocr', or 'tika_or_ocr')
         None: If file format is not supported
     """
-    if not is_supported_format(file_path):
-        logger.warning(f"Unsupported file format: {file_path}")
-        return None
-        
     extension = get_file_extension(file_path)
-    return get_supported_extensions().get(extension)
+    method = _SUPPORTED.get(extension)
+    if method is None:
+        _unsupported_counts[extension] += 1
+    return method
+
+def _scan_directory(
+    directory: str,
+    extensions: Optional[FrozenSet[str]],
+    recursive: bool,
+    skip_dirs: FrozenSet[str],
+    subdirectories: Optional[List[str]] = None
+) -> Iterator[str]:
+    """Yield matching file paths below a directory using os.scandir.
+    
+    Args:
+        directory: Directory to scan
+        extensions: Lowercase extensions to include (None for all files)
+        recursive: Whether to descend into subdirectories
+        skip_dirs: Directory names not to descend into
+        subdirectories: If given, subdirectories to descend into are appended
+                        to this list instead of being scanned
+        
+    Yields:
+        str: Path of each matching file
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    # Like os.walk, symlinked directories are not followed
+                    if entry.is_dir():
+                        if recursive and entry.name not in skip_dirs and not entry.is_symlink():
+                            if subdirectories is not None:
+                                subdirectories.append(entry.path)
+                            else:
+                                yield from _scan_directory(entry.path, extensions, recursive, skip_dirs)
+                        continue
+                except OSError:
+                    continue
+                    
+                if extensions is not None and get_file_extension(entry.name) not in extensions:
+                    continue
+                        
+                yield entry.path
+    except OSError as e:
+        logger.debug(f"Could not scan directory {directory}: {e}")
 
 def find_files(
     directory: str, 
     extensions: Optional[List[str]] = None, 
-    recursive: bool = True
+    recursive: bool = True,
+    skip_dirs: Optional[FrozenSet[str]] = DEFAULT_SKIP_DIRS,
+    max_workers: Optional[int] = None
 ) -> List[str]:
     """Find files in directory with specified extensions.
     
+    Top-level subdirectories are scanned concurrently on a thread pool.
+    
     Args:
         directory: Directory to search
         extensions: List of file extensions to include (without dot)
         recursive: Whether to search recursively
+        skip_dirs: Directory names to prune from the search (None to search
+                   every directory)
+        max_workers: Number of scanning threads (None for FIND_FILES_WORKERS)
         
     Returns:
         List[str]: List of file paths
@@ -94,32 +209,43 @@ def find_files(
         logger.error(f"Directory not found: {directory}")
         return []
         
-    files = []
-    
+    extension_set = None
     if extensions:
-        extensions = [ext.lower().lstrip('.') for ext in extensions]
-    
-    for root, _, filenames in os.walk(directory):
-        for filename in filenames:
-            file_path = os.path.join(root, filename)
+        extension_set = frozenset(ext.lower().lstrip('.') for ext in extensions)
             
-            if extensions and get_file_extension(file_path) not in extensions:
-                continue
-                
-            files.append(file_path)
-            
-        if not recursive:
-            break
+    skip_dirs = frozenset(skip_dirs or ())
+    
+    # List the top level once, collecting its subdirectories for the workers
+    subdirectories = []
+    files = list(_scan_directory(directory, extension_set, recursive, skip_dirs, subdirectories))
+    
+    def scan_subdirectory(path: str) -> List[str]:
+        return list(_scan_directory(path, extension_set, recursive, skip_dirs))
+    
+    if len(subdirectories) <= 1:
+        for path in subdirectories:
+            files.extend(scan_subdirectory(path))
+        return files
+    
+    workers = min(max_workers or FIND_FILES_WORKERS, len(subdirectories))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for subdirectory_files in executor.map(scan_subdirectory, subdirectories):
+            files.extend(subdirectory_files)
             
     return files
 
 def ensure_directory(directory: str) -> None:
     """Ensure directory exists, create if it doesn't.
     
+    Directories already ensured by this process are not checked again.
+    
     Args:
         directory: Directory path
     """
+    if directory in _ensured_directories:
+        return
     pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+    _ensured_directories.add(directory)
 
 def get_output_path(
     input_path: str, 
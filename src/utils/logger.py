@@ -1,7 +1,10 @@
 import logging
 import os
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
+
+# Number of records buffered before log file writes; errors flush immediately
+LOG_BUFFER_CAPACITY = 1000
 
 def setup_logger(name, log_file=None, level=logging.INFO, console_output=True):
     """Set up a logger with file and console handlers.
@@ -25,8 +28,13 @@ def setup_logger(name, log_file=None, level=logging.INFO, console_output=True):
     )
     simple_formatter = logging.Formatter('%(levelname)s: %(message)s')
     
-    # Clear existing handlers
+    # Clear existing handlers, flushing any buffered records first
     if logger.hasHandlers():
+        for handler in logger.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target:
+                target.close()
         logger.handlers.clear()
     
     # Add file handler if log_file is provided
@@ -39,7 +47,14 @@ def setup_logger(name, log_file=None, level=logging.INFO, console_output=True):
             log_file, maxBytes=10*1024*1024, backupCount=5
         )
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        
+        # Buffer records so bulk scans write the file in batches; the buffer
+        # is flushed on errors and when logging shuts down at exit
+        buffered_handler = MemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR,
+            target=file_handler, flushOnClose=True
+        )
+        logger.addHandler(buffered_handler)
     
     # Add console handler if requested
     if console_output:
@@ -49,6 +64,21 @@ def setup_logger(name, log_file=None, level=logging.INFO, console_output=True):
     
     return logger
 
+def flush_log_buffers():
+    """Write out records held by buffered file handlers.
+    
+    Pool workers exit through os._exit, which skips logging's own shutdown,
+    so worker processes call this at task boundaries and before exiting.
+    """
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            if isinstance(handler, MemoryHandler):
+                handler.flush()
+
 # Default application logger
 app_logger = setup_logger(
     'pii_analyzer', 
@@ -0,0 +1,158 @@
+import inspect
+import os
+import struct
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Optional
+
+import psutil
+
+from .logger import app_logger as logger
+
+# Layout of the shared block: timestamp, CPU %, memory %, available memory (GB)
+STATS_FORMAT = 'dddd'
+STATS_BLOCK_SIZE = 64
+
+# Samples older than this are ignored and psutil is queried directly
+STATS_MAX_AGE = 5.0
+
+# Name of the block to read in this process, set by set_system_stats_source
+_source_name = None
+_source_block = None
+
+# Blocks published by this process; reading them needs no second attach
+_published_blocks = {}
+
+# SharedMemory(track=False) (Python 3.13+) attaches without registering the
+# block with the resource tracker
+_ATTACH_UNTRACKED = 'track' in inspect.signature(SharedMemory).parameters
+
+def get_system_stats_name(pid: Optional[int] = None) -> str:
+    """Get the shared memory block name for a sampling process.
+
+    Args:
+        pid: Process ID of the sampler (None for the current process)
+
+    Returns:
+        str: Shared memory block name
+    """
+    return f"pii_mon_{pid or os.getpid()}"
+
+class SystemStatsPublisher:
+    """Publishes system utilization samples to a shared memory block.
+
+    A single sampler (the performance monitor) reads /proc once per tick and
+    worker processes read the published values instead of querying psutil
+    themselves.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        """Create the shared memory block.
+
+        Args:
+            name: Block name (None for the current process's default name)
+        """
+        self.name = name or get_system_stats_name()
+        self._block = SharedMemory(name=self.name, create=True, size=STATS_BLOCK_SIZE)
+        _published_blocks[self.name] = self._block
+
+    def publish(self, cpu_percent: float, memory_percent: float, available_memory_gb: float):
+        """Write a new sample to the block.
+
+        Args:
+            cpu_percent: System-wide CPU utilization
+            memory_percent: System-wide memory utilization
+            available_memory_gb: Available memory in GB
+        """
+        struct.pack_into(STATS_FORMAT, self._block.buf, 0,
+                         time.time(), cpu_percent, memory_percent, available_memory_gb)
+
+    def close(self):
+        """Release and remove the block."""
+        if _published_blocks.get(self.name) is self._block:
+            del _published_blocks[self.name]
+        self._block.close()
+        try:
+            self._block.unlink()
+        except FileNotFoundError:
+            pass
+
+def set_system_stats_source(name: Optional[str]):
+    """Set the shared memory block this process reads samples from.
+
+    Args:
+        name: Block name published by the sampler, or None to use psutil
+    """
+    global _source_name, _source_block
+
+    if _source_block is not None and _source_block is not _published_blocks.get(_source_name):
+        _source_block.close()
+    _source_name = name
+    _source_block = None
+
+def _attach_block(name: str) -> Optional[SharedMemory]:
+    """Attach to a published block for reading.
+
+    The publisher's own block is used directly. Other processes attach without
+    unregistering the block from the resource tracker: they are started by
+    the publisher and share its tracker, which holds one registration per
+    name, so unregistering here would remove the publisher's and make its
+    unlink fail. Where supported the block is attached untracked.
+
+    Args:
+        name: Block name
+
+    Returns:
+        SharedMemory: The attached block, or None if it doesn't exist
+    """
+    block = _published_blocks.get(name)
+    if block is not None:
+        return block
+
+    try:
+        if _ATTACH_UNTRACKED:
+            return SharedMemory(name=name, track=False)
+        return SharedMemory(name=name)
+    except (FileNotFoundError, OSError) as e:
+        logger.debug(f"Could not attach shared memory block {name}: {e}")
+        return None
+
+def read_system_stats() -> Optional[Dict[str, float]]:
+    """Read the latest published sample.
+
+    Returns:
+        dict: cpu_percent, memory_percent and available_memory_gb, or None
+              if no sampler is running or its last sample is stale
+    """
+    global _source_block
+
+    if _source_name is None:
+        return None
+
+    if _source_block is None:
+        _source_block = _attach_block(_source_name)
+        if _source_block is None:
+            return None
+
+    timestamp, cpu_percent, memory_percent, available_memory_gb = struct.unpack_from(
+        STATS_FORMAT, _source_block.buf, 0
+    )
+    if time.time() - timestamp > STATS_MAX_AGE:
+        return None
+
+    return {
+        'cpu_percent': cpu_percent,
+        'memory_percent': memory_percent,
+        'available_memory_gb': available_memory_gb
+    }
+
+def get_available_memory_gb() -> float:
+    """Get available system memory, preferring the shared sample.
+
+    Returns:
+        float: Available memory in GB
+    """
+    stats = read_system_stats()
+    if stats is not None:
+        return stats['available_memory_gb']
+    return psutil.virtual_memory().available / (1024 * 1024 * 1024)
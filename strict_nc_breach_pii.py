@@ -8,19 +8,39 @@ import json
 import sys
 import os
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import heapq
+import io
+import itertools
 import shutil
 import logging
-from collections import defaultdict
+import operator
+from collections import Counter, defaultdict, namedtuple
 from pathlib import Path
 from datetime import datetime
 
+# ijson is optional; it lets large reports be read one file result at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional; it parses whole reports and serializes JSON reports
+# several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src directory to path to allow imports from PII analyzer modules
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
-from src.database.db_reporting import load_pii_data_from_db, get_file_type_statistics
+from src.database.db_reporting import load_pii_data_from_db, iter_entity_types_from_db, get_summary_statistics
 
 # Enhanced set of sensitive entity types based on both Presidio built-ins
 # and custom recognizers that would trigger NC breach notification
-SENSITIVE_TYPES = {
+SENSITIVE_TYPES = frozenset({
     # built‑in
     "US_SOCIAL_SECURITY_NUMBER", "US_SSN",
     "US_DRIVER_LICENSE", "US_PASSPORT",
@@ -29,7 +49,16 @@ SENSITIVE_TYPES = {
     # any custom recognisers
     "PIN_CODE", "PASSWORD", "SECURITY_ANSWER",
     "DIGITAL_SIGNATURE", "BIOMETRIC_IDENTIFIER",
-}
+})
+
+# Entity type groups used by the breach trigger and classification
+NAME_PAIR = frozenset({"FIRST_NAME", "LAST_NAME"})
+CREDENTIAL_ID = frozenset({"EMAIL_ADDRESS", "USERNAME"})
+CREDENTIAL_SECRET = frozenset({"PASSWORD", "ACCESS_CODE"})
+SSN_TYPES = frozenset({"US_SSN", "US_SOCIAL_SECURITY_NUMBER"})
+FINANCIAL_TYPES = frozenset({"CREDIT_CARD", "BANK_ACCOUNT", "US_BANK_NUMBER", "IBAN_CODE", "US_BANK_ROUTING"})
+GOV_ID_TYPES = frozenset({"US_DRIVER_LICENSE", "US_PASSPORT"})
+HEALTH_TYPES = frozenset({"MEDICAL_RECORD_NUMBER", "HEALTH_INSURANCE_POLICY_NUMBER"})
 
 # User-friendly display names for entity types
 ENTITY_DISPLAY_NAMES = {
@@ -68,70 +97,171 @@ BREACH_CLASSIFICATIONS = {
     "MULTIPLE": "HIGH-RISK"               # Multiple breach types
 }
 
+# Breach classifications in the order the executive summary lists them
+_SORTED_BREACH_CLASSIFICATIONS = tuple(sorted(BREACH_CLASSIFICATIONS.items()))
+
+# Classifications called out under "Top Risk Areas" in the executive summary
+TOP_RISK_AREAS = (
+    (BREACH_CLASSIFICATIONS["NAME_WITH_SSN"], "files contain names with Social Security Numbers"),
+    (BREACH_CLASSIFICATIONS["NAME_WITH_FINANCIALS"], "files contain names with financial account information"),
+    (BREACH_CLASSIFICATIONS["NAME_WITH_GOV_ID"], "files contain names with government ID numbers"),
+    (BREACH_CLASSIFICATIONS["CREDENTIALS"], "files contain credential pairs (username/email with password)"),
+)
+
 # Threshold values for high confidence PII
 HIGH_CONFIDENCE_THRESHOLD = 0.7
 
-def breach_trigger(entity_set: set[str]) -> bool:
+# File results sent to each worker process by find_breach_files_parallel
+ANALYSIS_BATCH_SIZE = 1000
+
+# Threads copying files in clone_high_risk_files
+CLONE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# --input value that reads the report from standard input
+STDIN_REPORT = "-"
+
+# Line written after each file in the detailed text report
+REPORT_SEPARATOR = "-" * 80
+
+# Number of distinct entity masks whose breach evaluation is cached
+EVALUATION_CACHE_SIZE = 1024
+
+# Field accessors for report entries; entries missing a field use .get defaults
+_get_type_and_text = operator.itemgetter('entity_type', 'text')
+_get_file_path = operator.itemgetter('file_path')
+
+class Entity(namedtuple('Entity', ['type', 'confidence', 'text'])):
+    """High-confidence entity kept for reporting."""
+    __slots__ = ()
+    
+    @property
+    def category(self):
+        """Display name of the entity type, looked up when a report needs it"""
+        return ENTITY_DISPLAY_NAMES.get(self.type, self.type)
+
+# Bit flags for the reasons a file triggers breach notification
+BREACH_PERSONAL_INFO = 1   # name together with sensitive data
+BREACH_CREDENTIALS = 2     # username/email with password/access code
+
+# JSON report key and text report description of each breach flag
+BREACH_REASONS = (
+    (BREACH_PERSONAL_INFO, "personal_info_with_sensitive_data",
+     "Contains personally identifiable information AND sensitive data"),
+    (BREACH_CREDENTIALS, "credential_pair",
+     "Contains credential pair (username/email + password/access code)"),
+)
+
+# Bit for each entity type the breach rules look at; a file's detected types
+# are folded into one integer mask so the rules below are a few AND tests
+ENTITY_BITS = {entity_type: 1 << bit for bit, entity_type in enumerate(sorted(
+    SENSITIVE_TYPES | NAME_PAIR | CREDENTIAL_ID | CREDENTIAL_SECRET | {"PERSON"}
+))}
+
+def entity_mask(entity_types) -> int:
     """
-    Return True if document meets NC §75‑61 personal‑info definition.
+    Fold entity_type strings into an ENTITY_BITS mask.
+    Types the breach rules don't use contribute no bits.
+    """
+    mask = 0
+    for entity_type in entity_types:
+        mask |= ENTITY_BITS.get(entity_type, 0)
+    return mask
+
+PERSON_MASK = ENTITY_BITS["PERSON"]
+NAME_PAIR_MASK = entity_mask(NAME_PAIR)
+SENSITIVE_MASK = entity_mask(SENSITIVE_TYPES)
+CREDENTIAL_ID_MASK = entity_mask(CREDENTIAL_ID)
+CREDENTIAL_SECRET_MASK = entity_mask(CREDENTIAL_SECRET)
+SSN_MASK = entity_mask(SSN_TYPES)
+FINANCIAL_MASK = entity_mask(FINANCIAL_TYPES)
+GOV_ID_MASK = entity_mask(GOV_ID_TYPES)
+HEALTH_MASK = entity_mask(HEALTH_TYPES)
+
+def breach_conditions(entity_set: set[str]) -> tuple[bool, bool, bool]:
+    """
+    Evaluate the parts of the NC §75‑61 personal‑info definition.
     entity_set = {entity_type strings detected by Presidio above the chosen score}
+    Returns (has_name, has_sensitive, credential_pair).
     """
+    return _mask_conditions(entity_mask(entity_set))
+
+def _mask_conditions(mask: int) -> tuple[bool, bool, bool]:
+    """breach_conditions for an entity_mask."""
     # (A) "first name/initial + last name" OR "PERSON" composite
-    has_name = (
-        "PERSON" in entity_set
-        or ("FIRST_NAME" in entity_set and "LAST_NAME" in entity_set)
-    )
+    has_name = mask & PERSON_MASK != 0 or mask & NAME_PAIR_MASK == NAME_PAIR_MASK
 
     # (B) any sensitive token
-    has_sensitive = bool(entity_set & SENSITIVE_TYPES)
+    has_sensitive = mask & SENSITIVE_MASK != 0
 
     # (C) credential‑only path: username / email + password / access code
-    credential_pair = (
-        ("EMAIL_ADDRESS" in entity_set or "USERNAME" in entity_set)
-        and ("PASSWORD" in entity_set or "ACCESS_CODE" in entity_set)
-    )
+    credential_pair = mask & CREDENTIAL_ID_MASK != 0 and mask & CREDENTIAL_SECRET_MASK != 0
 
-    return (has_name and has_sensitive) or credential_pair
+    return has_name, has_sensitive, credential_pair
+
+def breach_flags(entity_set: set[str]) -> int:
+    """
+    Return the reasons a document meets NC §75‑61 personal‑info definition
+    as BREACH_PERSONAL_INFO / BREACH_CREDENTIALS bit flags (0 if none).
+    """
+    return _evaluate_mask(entity_mask(entity_set))[0]
+
+def _breach_flags(has_name: bool, has_sensitive: bool, credential_pair: bool) -> int:
+    """Combine evaluated breach_conditions into breach flags."""
+    flags = 0
+    if has_name and has_sensitive:
+        flags |= BREACH_PERSONAL_INFO
+    if credential_pair:
+        flags |= BREACH_CREDENTIALS
+    return flags
+
+def breach_trigger(entity_set: set[str]) -> bool:
+    """
+    Return True if document meets NC §75‑61 personal‑info definition.
+    entity_set = {entity_type strings detected by Presidio above the chosen score}
+    """
+    return _mask_trigger(entity_mask(entity_set))
+
+def _mask_trigger(mask: int) -> bool:
+    """breach_trigger for an entity_mask."""
+    # Name + sensitive data; the credential checks are skipped once this holds
+    if mask & SENSITIVE_MASK and (mask & PERSON_MASK or mask & NAME_PAIR_MASK == NAME_PAIR_MASK):
+        return True
+
+    # Credential pair
+    return mask & CREDENTIAL_ID_MASK != 0 and mask & CREDENTIAL_SECRET_MASK != 0
 
 def classify_breach(entity_types: set[str]) -> str:
     """
     Classify the breach type based on entity types present.
     Returns a concise classification label.
     """
-    has_name = "PERSON" in entity_types or ("FIRST_NAME" in entity_types and "LAST_NAME" in entity_types)
-    has_credential_pair = (
-        ("EMAIL_ADDRESS" in entity_types or "USERNAME" in entity_types)
-        and ("PASSWORD" in entity_types or "ACCESS_CODE" in entity_types)
-    )
-    
+    return _evaluate_mask(entity_mask(entity_types))[1]
+
+def _classification_label(credentials: bool, name_with_ssn: bool, name_with_financials: bool,
+                          name_with_gov_id: bool, name_with_health: bool, name_with_sensitive: bool) -> str:
+    """
+    Get the classification label for one combination of breach categories.
+    Used to build _CLASSIFY_LUT.
+    """
     classifications = []
     
     # Check for credentials
-    if has_credential_pair:
+    if credentials:
         classifications.append(BREACH_CLASSIFICATIONS["CREDENTIALS"])
     
-    # Only check for PII combinations if we have a name
-    if has_name:
-        # Check for SSN
-        if "US_SSN" in entity_types or "US_SOCIAL_SECURITY_NUMBER" in entity_types:
-            classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_SSN"])
-        
-        # Check for financial information
-        if any(et in entity_types for et in ["CREDIT_CARD", "BANK_ACCOUNT", "US_BANK_NUMBER", "IBAN_CODE", "US_BANK_ROUTING"]):
-            classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_FINANCIALS"])
-        
-        # Check for government IDs
-        if any(et in entity_types for et in ["US_DRIVER_LICENSE", "US_PASSPORT"]):
-            classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_GOV_ID"])
-        
-        # Check for health information
-        if any(et in entity_types for et in ["MEDICAL_RECORD_NUMBER", "HEALTH_INSURANCE_POLICY_NUMBER"]):
-            classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_HEALTH"])
-        
-        # If name with sensitive info but none of the above specific categories
-        has_other_sensitive = bool(entity_types & SENSITIVE_TYPES) and len(classifications) == 0
-        if has_other_sensitive:
-            classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_OTHER"])
+    # Name combined with specific categories of sensitive data
+    if name_with_ssn:
+        classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_SSN"])
+    if name_with_financials:
+        classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_FINANCIALS"])
+    if name_with_gov_id:
+        classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_GOV_ID"])
+    if name_with_health:
+        classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_HEALTH"])
+    
+    # If name with sensitive info but none of the above specific categories
+    if name_with_sensitive and len(classifications) == 0:
+        classifications.append(BREACH_CLASSIFICATIONS["NAME_WITH_OTHER"])
     
     # If multiple classifications, use HIGH-RISK
     if len(classifications) > 1:
@@ -141,145 +271,434 @@ def classify_breach(entity_types: set[str]) -> str:
     else:
         return "UNKNOWN"  # This should not happen given our breach_trigger logic
 
-def analyze_pii_report(report_path, threshold=HIGH_CONFIDENCE_THRESHOLD):
+# Classification label for every combination of the six category bits used
+# by _classify_breach (bit 0 is credentials, bits 1-5 follow the arguments
+# of _classification_label)
+_CLASSIFY_LUT = tuple(
+    _classification_label(*((index >> bit) & 1 for bit in range(6))) for index in range(64)
+)
+
+def _classify_breach(mask: int, has_name: bool, has_sensitive: bool,
+                     has_credential_pair: bool) -> str:
     """
-    Analyzes a PII report to identify files triggering breach notification.
+    Classify the breach type from the entity_mask and its already
+    evaluated breach_conditions.
+    """
+    index = has_credential_pair
+    
+    # The name combinations only count when a name is present
+    if has_name:
+        index |= (
+            (mask & SSN_MASK != 0) << 1
+            | (mask & FINANCIAL_MASK != 0) << 2
+            | (mask & GOV_ID_MASK != 0) << 3
+            | (mask & HEALTH_MASK != 0) << 4
+            | has_sensitive << 5
+        )
+    
+    return _CLASSIFY_LUT[index]
+
+@functools.lru_cache(maxsize=EVALUATION_CACHE_SIZE)
+def _evaluate_mask(mask: int) -> tuple[int, str]:
+    """
+    Return (breach_flags, classification) for an entity_mask. Files share a
+    small number of type combinations, so results are cached per mask.
+    """
+    conditions = _mask_conditions(mask)
+    return _breach_flags(*conditions), _classify_breach(mask, *conditions)
+
+def _open_report(report_path):
+    """Open a report for binary reading; "-" reads it from standard input."""
+    if report_path == STDIN_REPORT:
+        return contextlib.nullcontext(sys.stdin.buffer)
+    return open(report_path, 'rb')
+
+def iter_report_results(report_path):
+    """
+    Iterate over the file results of a PII analysis report.
+    
+    Uses ijson to stream the results array when it is installed, so only one
+    file result is held in memory at a time; otherwise loads the whole report
+    with orjson or json.
+    
+    Args:
+        report_path: Path to the PII analysis report JSON file, or "-" to
+                     read it from standard input
+        
+    Yields:
+        Dictionary for each file result in the report
+    """
+    with _open_report(report_path) as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'results.item', use_float=True)
+            return
+        
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    yield from data.get('results', [])
+
+def iter_report_file_paths(report_path):
+    """
+    Iterate over the file paths of a PII analysis report.
+    
+    With ijson only the file_path fields are built, so the entities of each
+    result are skipped instead of being parsed into dictionaries.
     
     Args:
         report_path: Path to the PII analysis report JSON file
-        threshold: Confidence threshold for entities (default: 0.7)
         
-    Returns:
-        Dictionary of high-risk files with their entities
+    Yields:
+        File path of each file result in the report
     """
-    with open(report_path, 'r') as f:
-        data = json.load(f)
+    if ijson is not None:
+        with _open_report(report_path) as f:
+            yield from ijson.items(f, 'results.item.file_path')
+        return
     
-    # Dictionary to track files and their sensitive entities
-    high_risk_files = defaultdict(list)
-    file_entity_sets = defaultdict(set)
+    for result in iter_report_results(report_path):
+        yield result.get('file_path', '')
+
+def _count_file_type(file_type_stats, file_path):
+    """Count a file's extension in file_type_stats."""
+    if file_path:
+        ext = os.path.splitext(file_path)[1].lower()
+        file_type_stats[ext] = file_type_stats.get(ext, 0) + 1
+
+def count_file_types(file_results, file_type_stats):
+    """
+    Pass file results through unchanged, counting their file types.
     
-    # Process each file result
-    for file_result in data.get('results', []):
-        file_path = file_result.get('file_path', '')
-        entities = file_result.get('entities', [])
+    Lets the analysis fill the executive summary's file type statistics in
+    the same pass over the report, instead of reading it a second time.
+    
+    Args:
+        file_results: Iterable of file result dictionaries
+        file_type_stats: Dictionary of extension counts to update
         
-        # Collect all high-confidence entities for the file
+    Yields:
+        Each file result
+    """
+    for file_result in file_results:
+        _count_file_type(file_type_stats, file_result.get('file_path', ''))
+        yield file_result
+
+def _collect_breach_candidates(file_results, threshold, max_samples_per_type, masks, candidates):
+    """
+    Fold the high-confidence entity types of each file result into its mask.
+    
+    A file's entities may be split over several results with the same path,
+    so the breach rules are only checked once every result has been read
+    (see _build_breach_files).
+    
+    Args:
+        file_results: Iterable of file result dictionaries
+        threshold: Confidence threshold for entities
+        max_samples_per_type: Maximum entities kept per category for each file
+                              (None to keep every entity, 0 to keep none)
+        masks: Dictionary of file path to entity_mask to update; files with
+               none of the rule types are left out
+        candidates: Dictionary of file path to (type, confidence, text)
+                    tuples to update, for files whose mask is non-zero
+    """
+    keep_entities = max_samples_per_type != 0
+    sample_counts = {}
+    
+    for file_result in file_results:
+        try:
+            file_path = _get_file_path(file_result)
+        except KeyError:
+            file_path = ''
+        entities = file_result.get('entities', ())
+        
+        # Collect the high-confidence entity fields and types
+        mask = 0
+        matches = []
         for entity in entities:
-            entity_type = entity.get('entity_type', '')
-            confidence = entity.get('score', 0.0)
-            text = entity.get('text', '')
+            # Check the score first, so a low-confidence entity costs one lookup
+            try:
+                confidence = entity['score']
+            except KeyError:
+                confidence = 0.0
+            if confidence < threshold:
+                continue
             
-            if confidence >= threshold:
-                # Add to entity set for breach trigger evaluation
-                file_entity_sets[file_path].add(entity_type)
-                
-                # Store all entities (not just sensitive ones) for reporting
-                high_risk_files[file_path].append({
-                    'type': entity_type,
-                    'category': ENTITY_DISPLAY_NAMES.get(entity_type, entity_type),
-                    'confidence': confidence,
-                    'text': text
-                })
-    
-    # Filter to only files that trigger breach notification
+            try:
+                entity_type, text = _get_type_and_text(entity)
+            except KeyError:
+                entity_type = entity.get('entity_type', '')
+                text = entity.get('text', '')
+            
+            # Parsed type names are new strings; interning them makes the
+            # ENTITY_BITS lookup an identity comparison
+            entity_type = sys.intern(entity_type)
+            mask |= ENTITY_BITS.get(entity_type, 0)
+            if keep_entities:
+                matches.append((entity_type, confidence, text))
+        
+        # Files without any of the rule types (most of them) can never
+        # trigger, so nothing is kept for them
+        mask |= masks.get(file_path, 0)
+        if not mask:
+            continue
+        masks[file_path] = mask
+        
+        if keep_entities:
+            file_candidates = candidates.setdefault(file_path, [])
+            if not max_samples_per_type:
+                file_candidates.extend(matches)
+                continue
+            
+            # Skip entities once enough samples of their category are kept
+            counts = sample_counts.setdefault(file_path, defaultdict(int))
+            for match in matches:
+                category = ENTITY_DISPLAY_NAMES.get(match[0], match[0])
+                if counts[category] < max_samples_per_type:
+                    counts[category] += 1
+                    file_candidates.append(match)
+
+def _build_breach_files(masks, candidates, max_samples_per_type=None, trigger_flags=None, type_masks=None):
+    """
+    Check the breach rules on each file's combined mask and build its entries.
+    
+    Args:
+        masks: Dictionary of file path to combined entity_mask
+        candidates: Dictionary of file path to (type, confidence, text) tuples
+        max_samples_per_type: Maximum entities kept per category for each file
+                              (None to keep every entity)
+        trigger_flags: Optional dictionary filled with each high-risk file's
+                       breach_flags
+        type_masks: Optional dictionary filled with each high-risk file's
+                    entity_mask
+        
+    Returns:
+        Dictionary of high-risk files with their Entity records
+    """
     breach_files = {}
-    for file_path, entity_set in file_entity_sets.items():
-        if breach_trigger(entity_set):
-            breach_files[file_path] = high_risk_files[file_path]
+    
+    for file_path, mask in masks.items():
+        flags = _evaluate_mask(mask)[0]
+        if not flags:
+            continue
+        
+        # Build the report entries for triggering files only
+        file_entities = breach_files[file_path] = []
+        sample_counts = defaultdict(int)
+        for entity_type, confidence, text in candidates.get(file_path, ()):
+            if max_samples_per_type:
+                category = ENTITY_DISPLAY_NAMES.get(entity_type, entity_type)
+                if sample_counts[category] >= max_samples_per_type:
+                    continue
+                sample_counts[category] += 1
+            
+            # Store all entities (not just sensitive ones) for reporting
+            file_entities.append(Entity(entity_type, confidence, text))
+        
+        if trigger_flags is not None:
+            trigger_flags[file_path] = flags
+        if type_masks is not None:
+            type_masks[file_path] = mask
     
     return breach_files
 
-def analyze_pii_database(db_path, job_id=None, threshold=HIGH_CONFIDENCE_THRESHOLD):
+def find_breach_files(file_results, threshold=HIGH_CONFIDENCE_THRESHOLD, max_samples_per_type=None,
+                      trigger_flags=None, type_masks=None):
     """
-    Analyzes PII data from a database to identify files triggering breach notification.
+    Find the files whose high-confidence entities trigger breach notification.
+    
+    The entity types of all results for a file path are combined before the
+    breach rules are checked, and entity fields are only kept for files with
+    at least one of the rule types.
     
     Args:
-        db_path: Path to the SQLite database file
-        job_id: Specific job ID to analyze (most recent if None)
+        file_results: Iterable of file result dictionaries
         threshold: Confidence threshold for entities
+        max_samples_per_type: Maximum entities kept per category for each file
+                              (None to keep every entity, 0 to keep none
+                              and only record trigger_flags / type_masks)
+        trigger_flags: Optional dictionary filled with the breach_flags of
+                       each high-risk file, for the report generators
+        type_masks: Optional dictionary filled with the entity_mask of each
+                    high-risk file, so the report generators don't rebuild
+                    entity type sets
         
     Returns:
-        Dictionary of high-risk files with their entities
+        Dictionary of high-risk files with their Entity records
     """
-    # Load data from database
-    data = load_pii_data_from_db(db_path, job_id, threshold)
+    masks = {}
+    candidates = {}
+    _collect_breach_candidates(file_results, threshold, max_samples_per_type, masks, candidates)
+    return _build_breach_files(masks, candidates, max_samples_per_type, trigger_flags, type_masks)
+
+def _collect_breach_candidates_batch(file_results, threshold, max_samples_per_type):
+    """Run _collect_breach_candidates on one batch in a worker process."""
+    masks = {}
+    candidates = {}
+    _collect_breach_candidates(file_results, threshold, max_samples_per_type, masks, candidates)
+    return masks, candidates
+
+def find_breach_files_parallel(file_results, threshold=HIGH_CONFIDENCE_THRESHOLD, max_samples_per_type=None,
+                               trigger_flags=None, workers=None, type_masks=None):
+    """
+    Run find_breach_files over batches of file results in worker processes.
     
-    # Dictionary to track files and their sensitive entities
-    high_risk_files = defaultdict(list)
-    file_entity_sets = defaultdict(set)
+    Batches are read from file_results as workers free up, so a streamed
+    report is never loaded whole. Workers return each file's mask and
+    candidate entities; the masks of a path are combined across batches and
+    the breach rules are checked on the combined mask.
     
-    # Process each file result
-    for file_result in data.get('results', []):
-        file_path = file_result.get('file_path', '')
-        entities = file_result.get('entities', [])
+    Args:
+        file_results: Iterable of file result dictionaries
+        threshold: Confidence threshold for entities
+        max_samples_per_type: Maximum entities kept per category for each file
+                              (None to keep every entity, 0 to keep none)
+        trigger_flags: Optional dictionary filled with each file's breach_flags
+        workers: Number of worker processes (None for the CPU count, 1 or
+                 less to analyze in this process)
+        type_masks: Optional dictionary filled with each file's entity_mask
         
-        # Collect all high-confidence entities for the file
-        for entity in entities:
-            entity_type = entity.get('entity_type', '')
-            confidence = entity.get('score', 0.0)
-            text = entity.get('text', '')
+    Returns:
+        Dictionary of high-risk files with their entities
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return find_breach_files(file_results, threshold, max_samples_per_type, trigger_flags, type_masks)
+    
+    masks = {}
+    candidates = {}
+    file_results = iter(file_results)
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        while True:
+            # Keep two batches queued per worker
+            while len(pending) < workers * 2:
+                batch = list(itertools.islice(file_results, ANALYSIS_BATCH_SIZE))
+                if not batch:
+                    break
+                pending.append(executor.submit(_collect_breach_candidates_batch, batch, threshold,
+                                               max_samples_per_type))
             
-            # Only add entities that meet the threshold
-            if confidence >= threshold:
-                # Add to entity set for breach trigger evaluation
-                file_entity_sets[file_path].add(entity_type)
-                
-                # Store all entities (not just sensitive ones) for reporting
-                high_risk_files[file_path].append({
-                    'type': entity_type,
-                    'category': ENTITY_DISPLAY_NAMES.get(entity_type, entity_type),
-                    'confidence': confidence,
-                    'text': text
-                })
-    
-    # Filter to only files that trigger breach notification
-    breach_files = {}
-    for file_path, entity_set in file_entity_sets.items():
-        if breach_trigger(entity_set):
-            breach_files[file_path] = high_risk_files[file_path]
+            if not pending:
+                break
+            
+            # Merge in report order
+            batch_masks, batch_candidates = pending.pop(0).result()
+            for file_path, mask in batch_masks.items():
+                masks[file_path] = masks.get(file_path, 0) | mask
+            for file_path, matches in batch_candidates.items():
+                candidates.setdefault(file_path, []).extend(matches)
     
-    return breach_files
+    return _build_breach_files(masks, candidates, max_samples_per_type, trigger_flags, type_masks)
 
-def generate_executive_summary(high_risk_files, original_report_path=None, db_path=None, job_id=None):
-    """Generate a concise executive summary report of high-risk files."""
+def analyze_pii_report(report_path, threshold=HIGH_CONFIDENCE_THRESHOLD, max_samples_per_type=None,
+                       trigger_flags=None, workers=1, type_masks=None, file_type_stats=None):
+    """
+    Analyzes a PII report to identify files triggering breach notification.
+    
+    Args:
+        report_path: Path to the PII analysis report JSON file
+        threshold: Confidence threshold for entities (default: 0.7)
+        max_samples_per_type: Maximum entities kept per category for each file
+                              (None to keep every entity, 0 to keep none)
+        trigger_flags: Optional dictionary filled with each file's breach_flags
+        workers: Number of analysis processes (None for the CPU count)
+        type_masks: Optional dictionary filled with each file's entity_mask
+        file_type_stats: Optional dictionary filled with the count of each file
+                         extension in the report, for the executive summary
+        
+    Returns:
+        Dictionary of high-risk files with their entities
+    """
+    file_results = iter_report_results(report_path)
+    if file_type_stats is not None:
+        file_results = count_file_types(file_results, file_type_stats)
+    
+    return find_breach_files_parallel(file_results, threshold, max_samples_per_type,
+                                      trigger_flags, workers, type_masks)
+
+def analyze_pii_database(db_path, job_id=None, threshold=HIGH_CONFIDENCE_THRESHOLD, max_samples_per_type=None,
+                         trigger_flags=None, workers=1, type_masks=None):
+    """
+    Analyzes PII data from a database to identify files triggering breach notification.
+    
+    Args:
+        db_path: Path to the SQLite database file
+        job_id: Specific job ID to analyze (most recent if None)
+        threshold: Confidence threshold for entities
+        max_samples_per_type: Maximum entities kept per category for each file
+                              (None to keep every entity, 0 to keep none)
+        trigger_flags: Optional dictionary filled with each file's breach_flags
+        workers: Number of analysis processes (None for the CPU count)
+        type_masks: Optional dictionary filled with each file's entity_mask
+        
+    Returns:
+        Dictionary of high-risk files with their entities
+    """
+    if max_samples_per_type == 0:
+        # Only each file's entity types are needed, so let SQLite filter and
+        # group the entities instead of loading every one
+        file_results = iter_entity_types_from_db(db_path, job_id, threshold)
+    else:
+        # Load data from database
+        file_results = load_pii_data_from_db(db_path, job_id, threshold).get('results', [])
+    
+    return find_breach_files_parallel(file_results, threshold, max_samples_per_type,
+                                      trigger_flags, workers, type_masks)
+
+def _trigger_reasons(flags):
+    """Get the (key, description) of each breach reason set in flags."""
+    return [(key, description) for flag, key, description in BREACH_REASONS if flags & flag]
+
+def _file_type_mask(file_path, entities, type_masks):
+    """Get a file's entity_mask from the analysis, or from its entities if not recorded."""
+    mask = type_masks.get(file_path) if type_masks else None
+    if mask is None:
+        mask = entity_mask(entity.type for entity in entities)
+    return mask
+
+def _file_breach(file_path, entities, trigger_flags, type_masks):
+    """Get (breach_flags, classification) for a file, reusing what the analysis recorded."""
+    flags, classification = _evaluate_mask(_file_type_mask(file_path, entities, type_masks))
+    recorded_flags = trigger_flags.get(file_path) if trigger_flags else None
+    if recorded_flags is not None:
+        flags = recorded_flags
+    return flags, classification
+
+def generate_executive_summary(high_risk_files, original_report_path=None, db_path=None, job_id=None,
+                               type_masks=None, file_type_stats=None):
+    """
+    Generate a concise executive summary report of high-risk files.
+    type_masks = {file_path: entity_mask} from the analysis, if recorded
+    file_type_stats = {extension: count} counted during the analysis, if
+                      recorded; the original report is then not read again
+    """
     output = []
     output.append(f"NC §75-61 BREACH NOTIFICATION EXECUTIVE SUMMARY")
     output.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Extract file type statistics if available
-    file_type_stats = {}
-    total_files = 0
+    file_type_stats = dict(file_type_stats) if file_type_stats else {}
+    total_files = sum(file_type_stats.values())
     file_processing_stats = None
     time_stats = None
     
     # Try to extract file type information and processing stats from the database if provided
     if db_path:
         try:
-            file_type_stats = get_file_type_statistics(db_path, job_id)
+            # File type, processing and time statistics, cached until the database changes
+            file_type_stats, file_processing_stats, time_stats = get_summary_statistics(db_path, job_id)
             total_files = sum(file_type_stats.values())
-            
-            # Get file processing statistics
-            from src.database.db_reporting import get_file_processing_stats, get_processing_time_stats
-            file_processing_stats = get_file_processing_stats(db_path, job_id)
-            time_stats = get_processing_time_stats(db_path, job_id)
         except Exception as e:
             print(f"Warning: Could not extract file statistics from database: {e}")
     
     # If database not provided or failed, try from the original report
-    if not file_type_stats and original_report_path and os.path.exists(original_report_path):
+    if (not file_type_stats and original_report_path and original_report_path != STDIN_REPORT
+            and os.path.exists(original_report_path)):
         try:
-            with open(original_report_path, 'r') as f:
-                data = json.load(f)
-                
-                # Count file types from all files in the report
-                if 'results' in data:
-                    for result in data.get('results', []):
-                        file_path = result.get('file_path', '')
-                        if file_path:
-                            ext = os.path.splitext(file_path)[1].lower()
-                            file_type_stats[ext] = file_type_stats.get(ext, 0) + 1
-                            total_files += 1
+            # Count file types from all files in the report
+            for file_path in iter_report_file_paths(original_report_path):
+                _count_file_type(file_type_stats, file_path)
+            total_files = sum(file_type_stats.values())
         except Exception as e:
             print(f"Warning: Could not extract file statistics from report: {e}")
     
@@ -324,8 +743,8 @@ def generate_executive_summary(high_risk_files, original_report_path=None, db_pa
     # Count files by breach type
     breach_types = {}
     for file_path, entities in high_risk_files.items():
-        entity_types = {e['type'] for e in entities}
-        breach_type = classify_breach(entity_types)
+        mask = _file_type_mask(file_path, entities, type_masks)
+        breach_type = _evaluate_mask(mask)[1]
         breach_types[breach_type] = breach_types.get(breach_type, 0) + 1
     
     # Generate breach summary
@@ -335,7 +754,7 @@ def generate_executive_summary(high_risk_files, original_report_path=None, db_pa
     # Show counts by breach type
     output.append("")
     output.append("Files by Risk Category:")
-    for breach_type, label in sorted(BREACH_CLASSIFICATIONS.items(), key=lambda x: x[0]):
+    for breach_type, label in _SORTED_BREACH_CLASSIFICATIONS:
         count = breach_types.get(label, 0)
         if count > 0:
             output.append(f"  {label}: {count} files")
@@ -344,201 +763,237 @@ def generate_executive_summary(high_risk_files, original_report_path=None, db_pa
     output.append("")
     output.append("Top Risk Areas:")
     
-    ssn_count = breach_types.get(BREACH_CLASSIFICATIONS["NAME_WITH_SSN"], 0)
-    if ssn_count > 0:
-        output.append(f"  • {ssn_count} files contain names with Social Security Numbers")
-        
-    financial_count = breach_types.get(BREACH_CLASSIFICATIONS["NAME_WITH_FINANCIALS"], 0)
-    if financial_count > 0:
-        output.append(f"  • {financial_count} files contain names with financial account information")
-        
-    gov_id_count = breach_types.get(BREACH_CLASSIFICATIONS["NAME_WITH_GOV_ID"], 0)
-    if gov_id_count > 0:
-        output.append(f"  • {gov_id_count} files contain names with government ID numbers")
-    
-    credentials_count = breach_types.get(BREACH_CLASSIFICATIONS["CREDENTIALS"], 0)
-    if credentials_count > 0:
-        output.append(f"  • {credentials_count} files contain credential pairs (username/email with password)")
+    for label, description in TOP_RISK_AREAS:
+        count = breach_types.get(label, 0)
+        if count > 0:
+            output.append(f"  • {count} {description}")
     
     # Return formatted summary
     return "\n".join(output)
 
-def generate_report_text(high_risk_files):
-    """Generate a human-readable text report of high-risk files."""
-    output = []
-    output.append(f"NC §75-61 Breach Notification Analysis Report")
-    output.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    output.append(f"\nFiles triggering NC §75-61 breach notification requirements:\n")
+def generate_report_text(high_risk_files, trigger_flags=None, type_masks=None, out=None, top=None):
+    """
+    Generate a human-readable text report of high-risk files.
+    trigger_flags = {file_path: breach_flags} from the analysis, if recorded
+    type_masks = {file_path: entity_mask} from the analysis, if recorded
+    out = text file the report is written to line by line; if None the
+          report is returned as a string
+    top = only report this many files with the most entities (None for all)
+    """
+    stream = out if out is not None else io.StringIO()
+    write = stream.write
+    write(f"NC §75-61 Breach Notification Analysis Report\n")
+    write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    write(f"\nFiles triggering NC §75-61 breach notification requirements:\n\n")
     
-    # Sort files by number of sensitive entities (highest first)
-    sorted_files = sorted(high_risk_files.items(), key=lambda x: len(x[1]), reverse=True)
+    # Sort files by number of sensitive entities (highest first); when only
+    # the top files are shown, select them without sorting every file
+    if top is not None and top < len(high_risk_files):
+        sorted_files = heapq.nlargest(top, high_risk_files.items(), key=lambda x: len(x[1]))
+        write(f"Showing the {top} files with the most sensitive entities.\n\n")
+    else:
+        sorted_files = sorted(high_risk_files.items(), key=lambda x: len(x[1]), reverse=True)
     
     for file_path, entities in sorted_files:
-        output.append(f"File: {file_path}")
-        output.append(f"Number of entities: {len(entities)}")
-        
-        # Get classification
-        entity_types = {entity['type'] for entity in entities}
-        classification = classify_breach(entity_types)
-        output.append(f"Classification: {classification}")
+        # Get classification and trigger reasons
+        flags, classification = _file_breach(file_path, entities, trigger_flags, type_masks)
         
-        # Count entity types
-        entity_counts = defaultdict(int)
+        # Count entity types and keep a sample of entity text (max 3 per
+        # type) in a single pass over the entities
+        entity_counts = Counter()
+        samples_by_type = defaultdict(list)
         for entity in entities:
-            entity_counts[entity['category']] += 1
-        
-        output.append("Entity types:")
-        for category, count in sorted(entity_counts.items(), key=lambda x: x[1], reverse=True):
-            output.append(f"  - {category}: {count}")
+            category = entity.category
+            entity_counts[category] += 1
+            samples = samples_by_type[category]
+            if len(samples) < 3:
+                samples.append(entity)
         
-        # Extract the set of entity types for this file to explain trigger
-        output.append("Breach notification trigger reason:")
-        has_name = "PERSON" in entity_types or ("FIRST_NAME" in entity_types and "LAST_NAME" in entity_types)
-        has_sensitive = bool(entity_types & SENSITIVE_TYPES)
-        credential_pair = (
-            ("EMAIL_ADDRESS" in entity_types or "USERNAME" in entity_types)
-            and ("PASSWORD" in entity_types or "ACCESS_CODE" in entity_types)
-        )
+        # Each file's block is built as a list of lines and written at once
+        lines = [
+            f"File: {file_path}",
+            f"Number of entities: {len(entities)}",
+            f"Classification: {classification}",
+            "Entity types:",
+        ]
+        lines.extend([f"  - {category}: {count}" for category, count in entity_counts.most_common()])
         
-        if has_name and has_sensitive:
-            output.append("  - Contains personally identifiable information AND sensitive data")
-        if credential_pair:
-            output.append("  - Contains credential pair (username/email + password/access code)")
+        # Explain the breach notification trigger
+        lines.append("Breach notification trigger reason:")
+        lines.extend([f"  - {description}" for _, description in _trigger_reasons(flags)])
         
-        # Show sample of entity text (max 3 per type)
-        output.append("Sample entities (max 3 per type):")
-        samples_by_type = defaultdict(list)
-        
-        for entity in entities:
-            category = entity['category']
-            if len(samples_by_type[category]) < 3:
-                samples_by_type[category].append(entity)
-                
+        lines.append("Sample entities (max 3 per type):")
         for category, samples in samples_by_type.items():
-            output.append(f"  {category}:")
-            for sample in samples:
-                # Mask part of the sensitive data for the report
-                masked_text = mask_sensitive_text(sample['text'], sample['type'])
-                output.append(f"    - {masked_text} (confidence: {sample['confidence']:.2f})")
+            lines.append(f"  {category}:")
+            # Mask part of the sensitive data for the report
+            lines.extend([
+                f"    - {mask_sensitive_text(sample.text, sample.type)} (confidence: {sample.confidence:.2f})"
+                for sample in samples
+            ])
         
-        output.append("-" * 80)
+        lines.append(REPORT_SEPARATOR)
+        write("\n".join(lines) + "\n")
     
-    output.append(f"\nFound {len(high_risk_files)} files that would trigger breach notification")
-    output.append("requirements under North Carolina law (§75-61).")
+    write(f"\nFound {len(high_risk_files)} files that would trigger breach notification\n")
+    write("requirements under North Carolina law (§75-61).\n")
     
-    return "\n".join(output)
+    if out is None:
+        return stream.getvalue().rstrip("\n")
+
+def _dumps_indented(obj, level):
+    """Serialize obj as 2-space indented JSON nested `level` levels deep."""
+    if orjson is not None:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    else:
+        # Write non-ASCII text as is, matching orjson
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    # Newlines inside strings are escaped, so every raw newline starts a line
+    return text.replace("\n", "\n" + "  " * level)
 
-def generate_report_json(high_risk_files):
-    """Generate a JSON representation of the breach report."""
-    report = {
-        "metadata": {
-            "report_type": "NC §75-61 Breach Notification Analysis",
-            "generated_at": datetime.now().isoformat(),
-            "file_count": len(high_risk_files)
-        },
-        "breach_files": {}
+def generate_report_json(high_risk_files, trigger_flags=None, type_masks=None, out=None):
+    """
+    Generate a JSON representation of the breach report.
+    trigger_flags = {file_path: breach_flags} from the analysis, if recorded
+    type_masks = {file_path: entity_mask} from the analysis, if recorded
+    out = text file the report is written to one file entry at a time; if
+          None the report is returned as a string
+    """
+    stream = out if out is not None else io.StringIO()
+    write = stream.write
+    
+    metadata = {
+        "report_type": "NC §75-61 Breach Notification Analysis",
+        "generated_at": datetime.now().isoformat(),
+        "file_count": len(high_risk_files)
     }
+    write('{\n  "metadata": ' + _dumps_indented(metadata, 1) + ',\n  "breach_files": {')
     
+    separator = "\n    "
     for file_path, entities in high_risk_files.items():
         # Group entities by type
-        entity_types = {entity['type'] for entity in entities}
         entity_by_type = defaultdict(list)
         
         for entity in entities:
-            entity_by_type[entity['type']].append({
-                "text": mask_sensitive_text(entity['text'], entity['type']),
-                "confidence": entity['score'] if 'score' in entity else entity['confidence'],
-                "category": entity['category']
-            })
+            entity_by_type[entity.type].append(entity)
         
-        # Determine breach trigger reason
-        has_name = "PERSON" in entity_types or ("FIRST_NAME" in entity_types and "LAST_NAME" in entity_types)
-        has_sensitive = bool(entity_types & SENSITIVE_TYPES)
-        credential_pair = (
-            ("EMAIL_ADDRESS" in entity_types or "USERNAME" in entity_types)
-            and ("PASSWORD" in entity_types or "ACCESS_CODE" in entity_types)
-        )
+        # Mask each group with its type's masking function, looked up once per type
+        for entity_type, group in entity_by_type.items():
+            masker = _MASKERS.get(entity_type, _mask_other)
+            entity_by_type[entity_type] = [
+                {"text": masker(entity.text), "confidence": entity.confidence, "category": entity.category}
+                for entity in group
+            ]
         
-        breach_reasons = []
-        if has_name and has_sensitive:
-            breach_reasons.append("personal_info_with_sensitive_data")
-        if credential_pair:
-            breach_reasons.append("credential_pair")
+        # Determine breach trigger reason and classification
+        flags, classification = _file_breach(file_path, entities, trigger_flags, type_masks)
         
-        # Add classification
-        classification = classify_breach(entity_types)
+        breach_reasons = [key for key, _ in _trigger_reasons(flags)]
         
-        # Add to the report
-        report["breach_files"][file_path] = {
+        # Write this file's entry; only one entry is held in memory at a time
+        entry = {
             "entity_count": len(entities),
-            "entity_types": list(entity_types),
+            "entity_types": list(entity_by_type),
             "classification": classification,
             "breach_reasons": breach_reasons,
-            "entities_by_type": dict(entity_by_type)
+            "entities_by_type": entity_by_type
         }
+        write(separator + _dumps_indented(file_path, 0) + ": " + _dumps_indented(entry, 2))
+        separator = ",\n    "
+    
+    write("\n  }\n}" if high_risk_files else "}\n}")
     
-    return json.dumps(report, indent=2)
+    if out is None:
+        return stream.getvalue()
+
+def _copy_file(file_path, dest_path):
+    """Copy one file, returning dest_path or None if it failed."""
+    try:
+        try:
+            # copy2 uses the kernel's zero-copy path (sendfile) on Linux
+            shutil.copy2(file_path, dest_path)
+        except FileNotFoundError:
+            if not os.path.exists(file_path):
+                raise
+            # The destination directory is only created once a source exists
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            shutil.copy2(file_path, dest_path)
+        return dest_path
+    except FileNotFoundError:
+        print(f"Warning: Could not find {file_path}")
+        return None
+    except Exception as e:
+        print(f"Error copying {file_path}: {e}")
+        return None
 
 def clone_high_risk_files(high_risk_files, clone_dir):
     """Clone the high-risk files to a specified directory maintaining structure."""
-    if not os.path.exists(clone_dir):
-        os.makedirs(clone_dir)
+    os.makedirs(clone_dir, exist_ok=True)
+    
+    # Each file's destination is the clone root with its normalized absolute
+    # path appended; report paths come from the input, so '..' components
+    # are resolved before the root is prefixed
+    clone_root = os.path.abspath(clone_dir).rstrip(os.sep)
     
-    copied_files = []
+    copies = []
     
+    # Missing source files are reported by _copy_file when opening them fails,
+    # rather than checked with an extra stat per file here
     for file_path in high_risk_files.keys():
-        # Check if file exists
-        if not os.path.exists(file_path):
-            print(f"Warning: Could not find {file_path}")
+        dest_path = clone_root + os.path.abspath(file_path)
+        if not dest_path.startswith(clone_root + os.sep):
+            print(f"Warning: Skipping {file_path}, it would be copied outside {clone_dir}")
             continue
-            
-        # Create the destination directory structure
-        rel_path = os.path.relpath(file_path, '/')
-        dest_path = os.path.join(clone_dir, rel_path)
-        dest_dir = os.path.dirname(dest_path)
-        
-        if not os.path.exists(dest_dir):
-            os.makedirs(dest_dir)
-        
-        # Copy the file
-        try:
-            shutil.copy2(file_path, dest_path)
-            copied_files.append(dest_path)
-        except Exception as e:
-            print(f"Error copying {file_path}: {e}")
+        copies.append((file_path, dest_path))
+    
+    # Copies are I/O bound, so run several at once
+    with concurrent.futures.ThreadPoolExecutor(max_workers=CLONE_WORKERS) as executor:
+        results = executor.map(lambda copy: _copy_file(*copy), copies)
+        copied_files = [dest_path for dest_path in results if dest_path]
     
     return copied_files
 
+def _mask_sensitive(text):
+    """Show only the last 4 characters of sensitive data"""
+    if len(text) > 4:
+        return f"****{text[-4:]}"
+    return "****"
+
+def _mask_credential_id(text):
+    """Partially mask an email address or username"""
+    username, at, domain = text.partition('@')
+    if at:  # Email address
+        if len(username) > 2:
+            return f"{username[0]}***@{domain}"
+        return f"***@{domain}"
+    elif len(text) > 4:  # Username
+        return f"{text[0]}***{text[-1]}"
+    return "****"
+
+def _mask_name(text):
+    """Show initials for person names"""
+    parts = text.split()
+    if len(parts) > 1:
+        return ' '.join([p[0] + '.' for p in parts])
+    elif len(text) > 0:
+        return text[0] + '.'
+    return "****"
+
+def _mask_other(text):
+    """Show the first and last character of other types"""
+    if len(text) > 4:
+        return f"{text[0]}***{text[-1]}"
+    return "****"
+
+# Masking function for each entity type; other types use _mask_other
+_MASKERS = {
+    **{entity_type: _mask_name for entity_type in ("PERSON", "FIRST_NAME", "LAST_NAME")},
+    **{entity_type: _mask_credential_id for entity_type in CREDENTIAL_ID},
+    **{entity_type: _mask_sensitive for entity_type in SENSITIVE_TYPES},
+}
+
 def mask_sensitive_text(text, entity_type):
     """Masks sensitive text for display in reports"""
-    if entity_type in SENSITIVE_TYPES:
-        # Show only last 4 characters for sensitive data
-        if len(text) > 4:
-            return f"****{text[-4:]}"
-        return "****"
-    elif entity_type in ["EMAIL_ADDRESS", "USERNAME"]:
-        # Partially mask email/username
-        if '@' in text:  # Email address
-            username, domain = text.split('@', 1)
-            if len(username) > 2:
-                return f"{username[0]}***@{domain}"
-            return f"***@{domain}"
-        elif len(text) > 4:  # Username
-            return f"{text[0]}***{text[-1]}"
-        return "****"
-    elif entity_type in ["PERSON", "FIRST_NAME", "LAST_NAME"]:
-        # Show initials for person names
-        parts = text.split()
-        if len(parts) > 1:
-            return ' '.join([p[0] + '.' for p in parts])
-        elif len(text) > 0:
-            return text[0] + '.'
-        return "****"
-    else:
-        # For other types, show first and last character
-        if len(text) > 4:
-            return f"{text[0]}***{text[-1]}"
-        return "****"
+    return _MASKERS.get(entity_type, _mask_other)(text)
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -563,7 +1018,8 @@ Examples:
     
     # Input options
     input_group = parser.add_mutually_exclusive_group(required=True)
-    input_group.add_argument("--input", "-i", type=str, help="Input JSON file with PII analysis results")
+    input_group.add_argument("--input", "-i", type=str,
+                             help=f"Input JSON file with PII analysis results ('{STDIN_REPORT}' for stdin)")
     input_group.add_argument("--db-path", "-d", type=str, help="Database file with PII analysis results")
     parser.add_argument("--job-id", type=int, help="Specific job ID to analyze (for database input)")
     
@@ -573,10 +1029,14 @@ Examples:
                         help="Output format (default: text)")
     parser.add_argument("--summary", "-s", action="store_true", help="Show only executive summary")
     parser.add_argument("--detailed-report", "-r", action="store_true", help="Include detailed file info with examples")
+    parser.add_argument("--top", type=int, default=None,
+                        help="Only list the N files with the most entities in the detailed report (default: all)")
     
     # Processing options
     parser.add_argument("--threshold", "-t", type=float, default=HIGH_CONFIDENCE_THRESHOLD,
                         help=f"Confidence threshold (default: {HIGH_CONFIDENCE_THRESHOLD})")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Number of analysis processes (default: CPU count)")
     parser.add_argument("--copy-high-risk-files", "-c", type=str,
                        help="Copy high-risk files to specified directory")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show INFO level log messages")
@@ -595,34 +1055,60 @@ def main():
         logging.getLogger().setLevel(logging.INFO)
         logging.getLogger('pii_database').setLevel(logging.INFO)
     
+    # The executive summary only needs each file's type mask, so no entity
+    # records are kept for it
+    summary_only = args.format == "text" and (args.summary or not args.detailed_report)
+    max_samples = 0 if summary_only else None
+    trigger_flags = {}
+    type_masks = {}
+    
+    # The summary's file type counts are taken while the report is analyzed
+    file_type_stats = {} if summary_only and args.input else None
+    
     try:
         # Analyze PII data based on input type
         if args.input:
             print(f"Analyzing PII report from JSON file: {args.input}")
-            high_risk_files = analyze_pii_report(args.input, args.threshold)
+            high_risk_files = analyze_pii_report(args.input, args.threshold, max_samples, trigger_flags,
+                                                 args.workers, type_masks, file_type_stats)
         else:
             print(f"Analyzing PII data from database: {args.db_path}")
-            high_risk_files = analyze_pii_database(args.db_path, args.job_id, args.threshold)
+            high_risk_files = analyze_pii_database(args.db_path, args.job_id, args.threshold, max_samples,
+                                                   trigger_flags, args.workers, type_masks)
         
         print(f"Found {len(high_risk_files)} high-risk files that trigger breach notification")
         
-        # Generate appropriate report
+        # Generate appropriate report; the detailed text and JSON reports are
+        # written to the output as they are generated instead of being built
+        # in memory
+        report = None
+        write_report = None
         if args.format == "text":
             if args.summary or not args.detailed_report:
                 if args.input:
-                    report = generate_executive_summary(high_risk_files, args.input)
+                    report = generate_executive_summary(high_risk_files, args.input, type_masks=type_masks,
+                                                        file_type_stats=file_type_stats)
                 else:
-                    report = generate_executive_summary(high_risk_files, db_path=args.db_path, job_id=args.job_id)
+                    report = generate_executive_summary(high_risk_files, db_path=args.db_path, job_id=args.job_id,
+                                                        type_masks=type_masks)
             else:
-                report = generate_report_text(high_risk_files)
+                write_report = functools.partial(generate_report_text, top=args.top)
         else:  # json format
-            report = generate_report_json(high_risk_files)
+            write_report = generate_report_json
         
         # Output report
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(report)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                if report is None:
+                    write_report(high_risk_files, trigger_flags, type_masks, out=f)
+                else:
+                    f.write(report)
             print(f"Report saved to {args.output}")
+        elif report is None:
+            print()
+            write_report(high_risk_files, trigger_flags, type_masks, out=sys.stdout)
+            if write_report is generate_report_json:
+                print()
         else:
             print("\n" + report)
         
@@ -7,7 +7,6 @@ import os
 import sys
 import json
 import sqlite3
-import tempfile
 from datetime import datetime
 
 # Add project root to path
@@ -18,13 +17,8 @@ import inspect_db
 
 def create_test_db():
     """Create a test database with sample error files"""
-    # Create a temporary database file
-    temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-    db_path = temp_db.name
-    temp_db.close()
-    
-    # Create a connection to the database
-    conn = sqlite3.connect(db_path)
+    # Create an in-memory database; nothing is written to disk
+    conn = sqlite3.connect(":memory:")
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
@@ -106,16 +100,16 @@ def create_test_db():
     
     conn.commit()
     
-    return db_path, conn
+    return conn
 
 def main():
     """Test both text and JSON output formats"""
     try:
         # Create test database
         print("Creating test database...")
-        db_path, conn = create_test_db()
+        conn = create_test_db()
         
-        print(f"Test database created at: {db_path}")
+        print("Test database created in memory")
         
         # Test text output
         print("\n=== TESTING TEXT OUTPUT ===")
@@ -137,7 +131,6 @@ def main():
         
         # Clean up
         conn.close()
-        os.unlink(db_path)
         print("\nClean up complete")
         
     except Exception as e:
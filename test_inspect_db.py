@@ -6,7 +6,6 @@ Unit tests for inspect_db.py focusing on error file reset functionality
 import unittest
 import os
 import sqlite3
-import tempfile
 import sys
 from datetime import datetime
 
@@ -19,21 +18,17 @@ class TestInspectDb(unittest.TestCase):
     Tests for inspect_db.py
     """
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up a test database with sample data
+        Build the sample database once; each test gets its own copy
         """
-        # Create a temporary database file
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        self.db_path = self.temp_db.name
-        self.temp_db.close()
-        
-        # Create a connection to the database
-        self.conn = sqlite3.connect(self.db_path)
-        self.cursor = self.conn.cursor()
+        # Create an in-memory template database
+        cls.template = sqlite3.connect(":memory:")
+        cursor = cls.template.cursor()
         
         # Create the necessary tables
-        self.cursor.executescript("""
+        cursor.executescript("""
         CREATE TABLE jobs (
             job_id INTEGER PRIMARY KEY,
             name TEXT,
@@ -75,7 +70,7 @@ class TestInspectDb(unittest.TestCase):
         """)
         
         # Insert a sample job
-        self.cursor.execute("""
+        cursor.execute("""
         INSERT INTO jobs (job_id, name, status, total_files, processed_files, error_files)
         VALUES (1, 'Test Job', 'running', 10, 5, 5)
         """)
@@ -98,19 +93,35 @@ class TestInspectDb(unittest.TestCase):
             (5, 1, '/path/to/zero.txt', 'txt', 0, 'error', '2025-01-01 12:00:00', '2025-01-01 12:01:00', 'Zero bytes')
         ]
         
-        self.cursor.executemany("""
+        cursor.executemany("""
         INSERT INTO files (file_id, job_id, file_path, file_type, file_size, status, process_start, process_end, error_message)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, test_files)
         
-        self.conn.commit()
+        cls.template.commit()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Close the template database
+        """
+        cls.template.close()
+    
+    def setUp(self):
+        """
+        Copy the template database for this test
+        """
+        # The backup API copies the template's pages directly instead of
+        # re-running the schema and inserts
+        self.conn = sqlite3.connect(":memory:")
+        self.template.backup(self.conn)
+        self.cursor = self.conn.cursor()
     
     def tearDown(self):
         """
         Clean up after tests
         """
         self.conn.close()
-        os.unlink(self.db_path)
     
     def test_reset_error_files(self):
         """
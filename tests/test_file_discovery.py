@@ -15,6 +15,7 @@ import unittest
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.database.db_utils import get_database
+from src.core import file_discovery
 from src.core.file_discovery import (
     scan_directory,
     scan_file_list,
@@ -220,6 +221,80 @@ class TestFileDiscovery(unittest.TestCase):
         self.assertGreater(stats['size_stats']['total_size'], 0)
         self.assertGreater(stats['size_stats']['avg_size'], 0)
 
+class TestBatchedScan(unittest.TestCase):
+    """Test cases for batched registration during directory scans"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = create_test_directory(os.path.join(self.temp_dir, "data"), num_files=20)
+        self.db = get_database(os.path.join(self.temp_dir, "test.db"))
+        self.job_id = self.db.create_job(self.data_dir)
+        
+        # Use a small batch so several transactions are needed
+        self.original_batch_size = file_discovery.SCAN_BATCH_SIZE
+        file_discovery.SCAN_BATCH_SIZE = 2
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        file_discovery.SCAN_BATCH_SIZE = self.original_batch_size
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_scan_registers_all_batches(self):
+        """Test that every supported file is registered once across batches"""
+        extensions = {'.txt', '.pdf', '.docx'}
+        events = []
+        
+        result = scan_directory(self.db, self.job_id, self.data_dir, extensions, events.append)
+        
+        # Files 0-19 cycle through 8 extensions, 3 of which are supported
+        self.assertEqual(result['added'], 9)
+        self.assertEqual(result['total'], 9)
+        self.assertEqual(self.db.get_job(self.job_id)['total_files'], 9)
+        
+        # Progress is reported per batch, not per file
+        progress_events = [e for e in events if e['type'] == 'progress']
+        self.assertEqual(len(progress_events), 5)
+        self.assertEqual(events[-1]['type'], 'completed')
+        
+        # Scanning again registers nothing new
+        result = scan_directory(self.db, self.job_id, self.data_dir, extensions)
+        self.assertEqual(result['added'], 0)
+        self.assertEqual(result['total'], 9)
+    
+    def test_extension_matching(self):
+        """Test extension matching with mixed case, dotted and dotfile names"""
+        for name in ("REPORT.TXT", ".txt", "..txt", "notes"):
+            with open(os.path.join(self.data_dir, name), 'w') as f:
+                f.write("content")
+        
+        # Extensions may be given with or without dots
+        scan_directory(self.db, self.job_id, self.data_dir, {'txt'})
+        
+        paths = {path for _, path in self.db.get_pending_files(self.job_id, limit=100)}
+        self.assertIn(os.path.join(self.data_dir, "REPORT.TXT"), paths)
+        self.assertNotIn(os.path.join(self.data_dir, ".txt"), paths)
+        self.assertNotIn(os.path.join(self.data_dir, "..txt"), paths)
+        self.assertNotIn(os.path.join(self.data_dir, "notes"), paths)
+        
+        # File types keep their leading dot in the database
+        file_types = {row[0] for row in self.db.conn.execute("SELECT DISTINCT file_type FROM files")}
+        self.assertEqual(file_types, {'.txt'})
+    
+    def test_statistics_use_job_status_index(self):
+        """Test that status counts are grouped and answered from the composite index"""
+        scan_directory(self.db, self.job_id, self.data_dir, {'txt', 'pdf', 'docx'})
+        
+        stats = get_file_statistics(self.db, self.job_id)
+        self.assertEqual(stats, {'pending': 9, 'processing': 0, 'completed': 0, 'error': 0, 'total': 9})
+        
+        plan = self.db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT status, COUNT(*) FROM files WHERE job_id = ? GROUP BY status",
+            (self.job_id,)
+        ).fetchall()
+        self.assertIn('idx_files_job_status', ' '.join(row['detail'] for row in plan))
+
 def manual_test():
     """Run a manual test for interactive exploration"""
     # Create temporary test directory
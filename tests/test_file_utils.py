@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test script for the file utility helpers
+"""
+
+import os
+import sys
+import tempfile
+import shutil
+import unittest
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import file_utils
+from src.utils.file_utils import (ensure_directory, find_files, get_extraction_method, get_file_extension,
+                                  get_supported_extensions, is_supported_format)
+
+class TestFindFiles(unittest.TestCase):
+    """Test cases for find_files"""
+
+    def setUp(self):
+        """Create a small directory tree"""
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'sub', 'deep'))
+        for rel_path in ['a.txt', 'b.PDF', 'noext', '.txt', 'sub/c.docx', 'sub/deep/d.txt']:
+            with open(os.path.join(self.temp_dir, rel_path), 'w') as f:
+                f.write('test')
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def relative(self, files):
+        """Convert found paths to sorted relative paths"""
+        return sorted(os.path.relpath(f, self.temp_dir) for f in files)
+
+    def test_all_files(self):
+        """Test that every file is found without an extension filter"""
+        self.assertEqual(self.relative(find_files(self.temp_dir)), [
+            '.txt', 'a.txt', 'b.PDF', 'noext',
+            os.path.join('sub', 'c.docx'), os.path.join('sub', 'deep', 'd.txt')
+        ])
+
+    def test_extension_filter(self):
+        """Test that extensions match case-insensitively with or without dots"""
+        files = find_files(self.temp_dir, extensions=['.txt', 'pdf'])
+        self.assertEqual(self.relative(files), [
+            'a.txt', 'b.PDF', os.path.join('sub', 'deep', 'd.txt')
+        ])
+
+    def test_non_recursive(self):
+        """Test that subdirectories are skipped when not recursive"""
+        files = find_files(self.temp_dir, extensions=['txt', 'docx'], recursive=False)
+        self.assertEqual(self.relative(files), ['a.txt'])
+
+    def test_skip_dirs(self):
+        """Test that tooling directories are pruned unless skip_dirs is None"""
+        os.makedirs(os.path.join(self.temp_dir, 'node_modules'))
+        with open(os.path.join(self.temp_dir, 'node_modules', 'e.txt'), 'w') as f:
+            f.write('test')
+
+        files = self.relative(find_files(self.temp_dir, extensions=['txt']))
+        self.assertNotIn(os.path.join('node_modules', 'e.txt'), files)
+
+        files = self.relative(find_files(self.temp_dir, extensions=['txt'], skip_dirs=None))
+        self.assertIn(os.path.join('node_modules', 'e.txt'), files)
+
+        files = self.relative(find_files(self.temp_dir, extensions=['txt'], skip_dirs={'deep'}))
+        self.assertEqual(files, ['a.txt', os.path.join('node_modules', 'e.txt')])
+
+    def test_single_worker_matches_parallel(self):
+        """Test that scanning subdirectories in parallel finds the same files"""
+        for i in range(5):
+            os.makedirs(os.path.join(self.temp_dir, f'dir{i}', 'nested'))
+            with open(os.path.join(self.temp_dir, f'dir{i}', 'nested', f'{i}.txt'), 'w') as f:
+                f.write('test')
+
+        parallel = find_files(self.temp_dir, extensions=['txt'])
+        sequential = find_files(self.temp_dir, extensions=['txt'], max_workers=1)
+        self.assertEqual(len(parallel), 7)
+        self.assertEqual(sorted(parallel), sorted(sequential))
+
+    def test_missing_directory(self):
+        """Test that a missing directory returns no files"""
+        self.assertEqual(find_files(os.path.join(self.temp_dir, 'missing')), [])
+
+class TestEnsureDirectory(unittest.TestCase):
+    """Test cases for ensure_directory"""
+
+    def test_directory_created_once(self):
+        """Test that a directory is created and later calls skip mkdir"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            directory = os.path.join(temp_dir, 'out', 'nested')
+            ensure_directory(directory)
+            self.assertTrue(os.path.isdir(directory))
+
+            with mock.patch('pathlib.Path.mkdir') as mkdir:
+                ensure_directory(directory)
+            mkdir.assert_not_called()
+        finally:
+            shutil.rmtree(temp_dir)
+
+class TestGetFileExtension(unittest.TestCase):
+    """Test cases for get_file_extension"""
+
+    def test_matches_splitext(self):
+        """Test that extensions match os.path.splitext for typical and edge-case paths"""
+        paths = [
+            'report.PDF', '/data/archive.tar.gz', '/data/dir.d/README', 'README',
+            '.hidden', '/data/.hidden', '..hidden', '/data/...', '.hidden.txt',
+            '/data/trailing.', 'a.b/c', '/data/..a.txt', ''
+        ]
+        for path in paths:
+            expected = os.path.splitext(path)[1].lower().lstrip('.')
+            self.assertEqual(get_file_extension(path), expected, path)
+
+class TestSupportedFormats(unittest.TestCase):
+    """Test cases for supported format lookups"""
+
+    def test_supported_format(self):
+        """Test that supported extensions are recognized case-insensitively"""
+        self.assertTrue(is_supported_format('/data/report.PDF'))
+        self.assertTrue(is_supported_format('scan.tif'))
+        self.assertFalse(is_supported_format('archive.zip'))
+        self.assertFalse(is_supported_format('README'))
+
+    def test_extraction_method(self):
+        """Test that each extension maps to its extraction method"""
+        self.assertEqual(get_extraction_method('a.docx'), 'tika')
+        self.assertEqual(get_extraction_method('a.pdf'), 'tika_or_ocr')
+        self.assertEqual(get_extraction_method('a.JPEG'), 'ocr')
+        self.assertIsNone(get_extraction_method('a.zip'))
+
+    def test_unsupported_files_are_counted(self):
+        """Test that unsupported files are counted by extension"""
+        file_utils._unsupported_counts.clear()
+        get_extraction_method('a.zip')
+        get_extraction_method('/data/b.ZIP')
+        get_extraction_method('README')
+        self.assertEqual(file_utils._unsupported_counts, {'zip': 2, '': 1})
+        file_utils._unsupported_counts.clear()
+    
+    def test_unsupported_counts_move_between_processes(self):
+        """Test that counts taken in a worker are merged into the main process's summary"""
+        file_utils._unsupported_counts.clear()
+        get_extraction_method('a.zip')
+        counts = file_utils.take_unsupported_counts()
+        self.assertEqual(counts, {'zip': 1})
+        self.assertEqual(file_utils._unsupported_counts, {})
+        
+        file_utils.add_unsupported_counts(counts)
+        file_utils.add_unsupported_counts({'zip': 2, 'exe': 1})
+        self.assertEqual(file_utils._unsupported_counts, {'zip': 3, 'exe': 1})
+        file_utils._unsupported_counts.clear()
+
+    def test_mapping_is_cached(self):
+        """Test that the mapping is built once and reused"""
+        self.assertIs(get_supported_extensions(), get_supported_extensions())
+        self.assertEqual(get_supported_extensions()['txt'], 'tika')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for the buffered log file handler
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.logger import setup_logger, flush_log_buffers
+
+class TestLogBuffer(unittest.TestCase):
+    """Test cases for buffering and flushing log records"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, 'test.log')
+        self.logger = setup_logger('pii_test_buffer', self.log_file, console_output=False)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        for handler in self.logger.handlers:
+            target = handler.target
+            handler.close()
+            target.close()
+        self.logger.handlers.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def read_log(self):
+        """Read the log file contents"""
+        with open(self.log_file) as f:
+            return f.read()
+
+    def test_flush_writes_buffered_records(self):
+        """Test that buffered records reach the file only once flushed"""
+        self.logger.info("buffered message")
+        self.assertNotIn("buffered message", self.read_log())
+
+        flush_log_buffers()
+        self.assertIn("buffered message", self.read_log())
+
+    def test_errors_flush_immediately(self):
+        """Test that an error record flushes the buffer without help"""
+        self.logger.info("earlier message")
+        self.logger.error("failure message")
+
+        contents = self.read_log()
+        self.assertIn("earlier message", contents)
+        self.assertIn("failure message", contents)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Test script for the process_files command-line tool
+Tests the helpers used by the status, export and processing commands
+"""
+
+import os
+import sys
+import time
+import tempfile
+import shutil
+import unittest
+import argparse
+import json
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import process_files
+from src.database.db_utils import get_database, PIIDatabase
+
+class TestStatusSnapshot(unittest.TestCase):
+    """Test cases for status snapshots written by running jobs"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_dir = process_files.STATUS_SNAPSHOT_DIR
+        process_files.STATUS_SNAPSHOT_DIR = os.path.join(self.temp_dir, 'logs')
+        self.db_path = os.path.join(self.temp_dir, 'test.db')
+
+    def tearDown(self):
+        """Clean up test environment"""
+        process_files.STATUS_SNAPSHOT_DIR = self.original_dir
+        shutil.rmtree(self.temp_dir)
+
+    def make_snapshot(self, job_id=1):
+        """Create a snapshot dictionary for the test database"""
+        return {
+            'job_id': job_id,
+            'db_path': os.path.abspath(self.db_path),
+            'directory': self.temp_dir,
+            'processed': 5,
+            'failed': 1,
+            'pending': 4,
+            'running_since': time.time(),
+            'last_file': 'file5.txt'
+        }
+
+    def test_snapshot_round_trip(self):
+        """Test that a written snapshot is loaded back for the same database"""
+        process_files.write_status_snapshot(self.make_snapshot())
+
+        snapshot = process_files.load_status_snapshot(self.db_path, 1)
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(snapshot['processed'], 5)
+        self.assertEqual(snapshot['last_file'], 'file5.txt')
+
+        # Without a job ID the freshest snapshot for the database is used
+        self.assertEqual(process_files.load_status_snapshot(self.db_path)['job_id'], 1)
+
+    def test_snapshot_ignored_for_other_database(self):
+        """Test that snapshots of a different database are ignored"""
+        process_files.write_status_snapshot(self.make_snapshot())
+
+        other_db = os.path.join(self.temp_dir, 'other.db')
+        self.assertIsNone(process_files.load_status_snapshot(other_db, 1))
+
+    def test_stale_and_removed_snapshots(self):
+        """Test that stale or removed snapshots fall back to the database"""
+        process_files.write_status_snapshot(self.make_snapshot())
+
+        original_max_age = process_files.STATUS_SNAPSHOT_MAX_AGE
+        process_files.STATUS_SNAPSHOT_MAX_AGE = -1
+        try:
+            self.assertIsNone(process_files.load_status_snapshot(self.db_path, 1))
+        finally:
+            process_files.STATUS_SNAPSHOT_MAX_AGE = original_max_age
+
+        process_files.remove_status_snapshot(1)
+        self.assertIsNone(process_files.load_status_snapshot(self.db_path, 1))
+
+class TestExportToJson(unittest.TestCase):
+    """Test cases for streaming JSON export"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.db')
+        self.output_path = os.path.join(self.temp_dir, 'export.json')
+
+        db = get_database(self.db_path)
+        self.job_id = db.create_job(self.temp_dir)
+        for i in range(3):
+            db.register_file(self.job_id, f"/data/file{i}.txt", 100, ".txt", time.time())
+        file_ids = [file_id for file_id, _ in db.get_pending_files(self.job_id)]
+
+        entity = {'entity_type': 'SSN', 'text': '123-45-6789', 'start': 0, 'end': 11, 'score': 0.99}
+        db.store_results_batch(self.job_id, [
+            {'file_id': file_ids[0], 'success': True, 'processing_time': 0.5,
+             'entities': [entity, entity], 'metadata': {'pages': 1}},
+            {'file_id': file_ids[1], 'success': True, 'processing_time': 0.2, 'entities': []}
+        ])
+        self.expected = db.export_to_json(self.job_id)
+        db.close()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def check_export(self):
+        """Export the job and compare it with the in-memory export"""
+        process_files.export_to_json(self.db_path, self.output_path, self.job_id)
+
+        with open(self.output_path) as f:
+            data = json.load(f)
+
+        self.assertEqual(data['job_id'], self.job_id)
+        self.assertEqual(data['total_files'], 3)
+        self.assertEqual(len(data['results']), 3)
+        self.assertEqual(data['results'], self.expected['results'])
+        self.assertEqual(len(data['results'][0]['entities']), 2)
+        self.assertEqual(data['results'][0]['metadata'], {'pages': 1})
+
+    def test_streamed_export_matches(self):
+        """Test that the streamed export contains every file and entity"""
+        self.check_export()
+
+    def test_export_without_sqlite_json(self):
+        """Test that the Python encoders write the same export"""
+        with mock.patch.object(PIIDatabase, 'has_json_functions', return_value=False):
+            self.check_export()
+
+            original_orjson = process_files.orjson
+            process_files.orjson = None
+            try:
+                self.check_export()
+            finally:
+                process_files.orjson = original_orjson
+
+    def test_jsonl_export(self):
+        """Test that JSON Lines output has one file result per line"""
+        process_files.export_to_json(self.db_path, self.output_path, self.job_id, jsonl=True)
+
+        with open(self.output_path) as f:
+            results = [json.loads(line) for line in f]
+
+        self.assertEqual(results, self.expected['results'])
+
+class TestShowStatus(unittest.TestCase):
+    """Test cases for the --status table"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.db')
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_job_without_files(self):
+        """Test that a job with no registered files is shown without errors"""
+        db = get_database(self.db_path)
+        job_id = db.create_job(self.temp_dir)
+        db.close()
+
+        process_files.show_status(self.db_path, job_id)
+
+    def test_all_jobs_with_running_snapshot(self):
+        """Test that listing all jobs shows every job, using the snapshot for the running one"""
+        from rich.console import Console
+
+        db = get_database(self.db_path)
+        first_job = db.create_job(os.path.join(self.temp_dir, 'first'))
+        second_job = db.create_job(os.path.join(self.temp_dir, 'second'))
+        db.close()
+
+        original_dir = process_files.STATUS_SNAPSHOT_DIR
+        process_files.STATUS_SNAPSHOT_DIR = os.path.join(self.temp_dir, 'logs')
+        try:
+            process_files.write_status_snapshot({
+                'job_id': second_job,
+                'db_path': os.path.abspath(self.db_path),
+                'directory': os.path.join(self.temp_dir, 'second'),
+                'processed': 5,
+                'failed': 1,
+                'pending': 4,
+                'running_since': time.time(),
+                'last_file': 'file5.txt'
+            })
+
+            console = Console(record=True, width=200)
+            with mock.patch.object(process_files, 'get_console', return_value=console):
+                process_files.show_status(self.db_path)
+        finally:
+            process_files.STATUS_SNAPSHOT_DIR = original_dir
+
+        output = console.export_text()
+        self.assertIn(f"Job {first_job} - ", output)
+        self.assertIn(f"Job {second_job} - ", output)
+        self.assertIn("file5.txt", output)
+
+class TestParseArgs(unittest.TestCase):
+    """Test cases for command-line argument parsing"""
+
+    def test_directories_are_canonical(self):
+        """Test that directory arguments match the paths stored with jobs"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            args = process_files.parse_args([os.path.join(temp_dir, '.') + os.sep])
+            self.assertEqual(args.directory, temp_dir)
+
+            args = process_files.parse_args(['--list-jobs', temp_dir + os.sep])
+            self.assertEqual(args.list_jobs, temp_dir)
+        finally:
+            shutil.rmtree(temp_dir)
+
+class TestExitCodes(unittest.TestCase):
+    """Test cases for command-line exit codes"""
+
+    def test_missing_directory_is_usage_error(self):
+        """Test that a missing directory argument exits with code 2"""
+        args = argparse.Namespace(directory=None)
+        with self.assertRaises(SystemExit) as cm:
+            process_files.process_directory(args)
+        self.assertEqual(cm.exception.code, 2)
+
+    def test_nonexistent_directory_is_usage_error(self):
+        """Test that a directory that does not exist exits with code 2"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            args = argparse.Namespace(directory=os.path.join(temp_dir, 'missing'))
+            with self.assertRaises(SystemExit) as cm:
+                process_files.process_directory(args)
+            self.assertEqual(cm.exception.code, 2)
+        finally:
+            shutil.rmtree(temp_dir)
+
+if __name__ == '__main__':
+    unittest.main()
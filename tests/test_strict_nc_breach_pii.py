@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Test script for the NC breach notification analysis
+"""
+
+import io
+import os
+import sys
+import json
+import tempfile
+import shutil
+import time
+import unittest
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import strict_nc_breach_pii
+from src.database import db_reporting
+from src.database.db_utils import get_database
+
+def make_entity(entity_type, text, score=0.9):
+    """Build an entity dictionary as written by the exporter"""
+    return {'entity_type': entity_type, 'text': text, 'start': 0, 'end': len(text), 'score': score}
+
+class TestBreachTrigger(unittest.TestCase):
+    """Test cases for the breach trigger and classification rules"""
+
+    def test_breach_trigger(self):
+        """Test each path of the NC personal information definition"""
+        trigger = strict_nc_breach_pii.breach_trigger
+        self.assertTrue(trigger({'PERSON', 'US_SSN'}))
+        self.assertTrue(trigger({'FIRST_NAME', 'LAST_NAME', 'CREDIT_CARD'}))
+        self.assertTrue(trigger({'USERNAME', 'ACCESS_CODE'}))
+        self.assertFalse(trigger({'FIRST_NAME', 'CREDIT_CARD'}))
+        self.assertFalse(trigger({'PERSON', 'LOCATION'}))
+        self.assertFalse(trigger({'US_SSN'}))
+        self.assertFalse(trigger(set()))
+
+    def test_classify_breach(self):
+        """Test that breach classifications match the entity types present"""
+        classify = strict_nc_breach_pii.classify_breach
+        labels = strict_nc_breach_pii.BREACH_CLASSIFICATIONS
+        self.assertEqual(classify({'PERSON', 'US_SSN'}), labels['NAME_WITH_SSN'])
+        self.assertEqual(classify({'PERSON', 'US_PASSPORT'}), labels['NAME_WITH_GOV_ID'])
+        self.assertEqual(classify({'PERSON', 'PIN_CODE'}), labels['NAME_WITH_OTHER'])
+        self.assertEqual(classify({'EMAIL_ADDRESS', 'PASSWORD'}), labels['CREDENTIALS'])
+        self.assertEqual(classify({'PERSON', 'US_SSN', 'CREDIT_CARD'}), labels['MULTIPLE'])
+        self.assertEqual(classify({'PERSON', 'MEDICAL_RECORD_NUMBER', 'USERNAME', 'PASSWORD'}), labels['MULTIPLE'])
+        self.assertEqual(classify({'PERSON', 'PIN_CODE', 'USERNAME', 'PASSWORD'}), labels['CREDENTIALS'])
+        self.assertEqual(classify({'US_SSN', 'CREDIT_CARD'}), 'UNKNOWN')
+
+    def test_breach_flags(self):
+        """Test that breach flags record each path of the definition that holds"""
+        flags = strict_nc_breach_pii.breach_flags
+        personal = strict_nc_breach_pii.BREACH_PERSONAL_INFO
+        credentials = strict_nc_breach_pii.BREACH_CREDENTIALS
+        self.assertEqual(flags({'PERSON', 'US_SSN', 'USERNAME', 'PASSWORD'}), personal | credentials)
+        self.assertEqual(flags({'FIRST_NAME', 'LAST_NAME', 'PIN_CODE'}), personal)
+        self.assertEqual(flags({'EMAIL_ADDRESS', 'ACCESS_CODE'}), credentials)
+        self.assertEqual(flags({'PERSON'}), 0)
+        self.assertEqual(flags(set()), 0)
+
+    def test_evaluation_cached_per_mask(self):
+        """Test that type sets with the same mask share one cached evaluation"""
+        strict_nc_breach_pii._evaluate_mask.cache_clear()
+        first = strict_nc_breach_pii.breach_flags({'PERSON', 'US_SSN'})
+        second = strict_nc_breach_pii.classify_breach({'PERSON', 'US_SSN', 'LOCATION'})
+
+        self.assertEqual(first, strict_nc_breach_pii.BREACH_PERSONAL_INFO)
+        self.assertEqual(second, strict_nc_breach_pii.BREACH_CLASSIFICATIONS['NAME_WITH_SSN'])
+        self.assertEqual(strict_nc_breach_pii._evaluate_mask.cache_info().hits, 1)
+
+    def test_entity_mask(self):
+        """Test that entity masks keep one bit per rule type and ignore other types"""
+        entity_mask = strict_nc_breach_pii.entity_mask
+        bits = strict_nc_breach_pii.ENTITY_BITS
+        self.assertEqual(len(set(bits.values())), len(bits))
+        self.assertLess(max(bits.values()), 1 << 64)
+        self.assertEqual(entity_mask({'PERSON', 'LOCATION'}), bits['PERSON'])
+        self.assertEqual(entity_mask(set()), 0)
+        self.assertTrue(strict_nc_breach_pii.breach_trigger({'FIRST_NAME', 'LAST_NAME', 'DATE_TIME', 'US_SSN'}))
+
+class TestMaskSensitiveText(unittest.TestCase):
+    """Test cases for masking entity text in reports"""
+
+    def test_masking_by_type(self):
+        """Test that each entity type is masked by its rule"""
+        mask = strict_nc_breach_pii.mask_sensitive_text
+        self.assertEqual(mask('123-45-6789', 'US_SSN'), '****6789')
+        self.assertEqual(mask('hunter2', 'PASSWORD'), '****ter2')
+        self.assertEqual(mask('jane@example.com', 'EMAIL_ADDRESS'), 'j***@example.com')
+        self.assertEqual(mask('jdoe42', 'USERNAME'), 'j***2')
+        self.assertEqual(mask('Jane Q Doe', 'PERSON'), 'J. Q. D.')
+        self.assertEqual(mask('Raleigh', 'LOCATION'), 'R***h')
+        self.assertEqual(mask('NC', 'LOCATION'), '****')
+
+class TestAnalyzePiiReport(unittest.TestCase):
+    """Test cases for finding breach files in a JSON report"""
+
+    def setUp(self):
+        """Write a small report"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.report_path = os.path.join(self.temp_dir, 'report.json')
+
+        report = {
+            'job_id': 1,
+            'results': [
+                {'file_path': '/data/ssn.txt', 'entities': [
+                    make_entity('PERSON', 'Jane Doe'),
+                    make_entity('US_SSN', '123-45-6789'),
+                    make_entity('LOCATION', 'Raleigh')
+                ]},
+                {'file_path': '/data/low_score.txt', 'entities': [
+                    make_entity('PERSON', 'John Roe'),
+                    make_entity('US_SSN', '987-65-4321', score=0.4)
+                ]},
+                {'file_path': '/data/creds.txt', 'entities': [
+                    make_entity('EMAIL_ADDRESS', 'jane@example.com'),
+                    make_entity('PASSWORD', 'hunter2')
+                ]},
+                {'file_path': '/data/empty.txt', 'entities': []}
+            ]
+        }
+        with open(self.report_path, 'w') as f:
+            json.dump(report, f)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_breach_files(self):
+        """Test that only triggering files are returned with their entities"""
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+
+        self.assertEqual(sorted(breach_files), ['/data/creds.txt', '/data/ssn.txt'])
+        self.assertEqual(
+            [e.type for e in breach_files['/data/ssn.txt']],
+            ['PERSON', 'US_SSN', 'LOCATION']
+        )
+        self.assertEqual(breach_files['/data/ssn.txt'][1].category, 'Social Security Number')
+
+    def test_trigger_flags(self):
+        """Test that the trigger reasons are recorded and used by the reports"""
+        trigger_flags = {}
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path, trigger_flags=trigger_flags)
+
+        self.assertEqual(trigger_flags, {
+            '/data/ssn.txt': strict_nc_breach_pii.BREACH_PERSONAL_INFO,
+            '/data/creds.txt': strict_nc_breach_pii.BREACH_CREDENTIALS
+        })
+
+        # Reports built from the recorded flags match recomputed ones
+        with_flags = json.loads(strict_nc_breach_pii.generate_report_json(breach_files, trigger_flags))
+        recomputed = json.loads(strict_nc_breach_pii.generate_report_json(breach_files))
+        self.assertEqual(with_flags['breach_files'], recomputed['breach_files'])
+        self.assertEqual(with_flags['breach_files']['/data/creds.txt']['breach_reasons'], ['credential_pair'])
+
+        text = strict_nc_breach_pii.generate_report_text(breach_files, trigger_flags)
+        self.assertIn("  - Contains credential pair (username/email + password/access code)", text)
+        self.assertIn("  - Contains personally identifiable information AND sensitive data", text)
+
+    def test_type_masks(self):
+        """Test that reports built from the recorded type masks match recomputed ones"""
+        trigger_flags, type_masks = {}, {}
+        breach_files = strict_nc_breach_pii.analyze_pii_report(
+            self.report_path, trigger_flags=trigger_flags, type_masks=type_masks
+        )
+        entity_mask = strict_nc_breach_pii.entity_mask
+        self.assertEqual(type_masks['/data/ssn.txt'], entity_mask({'PERSON', 'US_SSN'}))
+
+        with_masks = json.loads(strict_nc_breach_pii.generate_report_json(breach_files, trigger_flags, type_masks))
+        recomputed = json.loads(strict_nc_breach_pii.generate_report_json(breach_files))
+        self.assertEqual(with_masks['breach_files'], recomputed['breach_files'])
+        self.assertEqual(with_masks['breach_files']['/data/ssn.txt']['entity_types'], ['PERSON', 'US_SSN', 'LOCATION'])
+        self.assertEqual(
+            with_masks['breach_files']['/data/ssn.txt']['entities_by_type']['US_SSN'],
+            [{'text': '****6789', 'confidence': 0.9, 'category': 'Social Security Number'}]
+        )
+
+        self.assertEqual(
+            strict_nc_breach_pii.generate_report_text(breach_files, type_masks=type_masks).split('\n')[2:],
+            strict_nc_breach_pii.generate_report_text(breach_files).split('\n')[2:]
+        )
+
+    def test_parallel_matches_serial(self):
+        """Test that analysis in worker processes gives the same result"""
+        original_batch_size = strict_nc_breach_pii.ANALYSIS_BATCH_SIZE
+        strict_nc_breach_pii.ANALYSIS_BATCH_SIZE = 1
+        try:
+            serial_flags, parallel_flags = {}, {}
+            serial_masks, parallel_masks = {}, {}
+            serial = strict_nc_breach_pii.analyze_pii_report(
+                self.report_path, trigger_flags=serial_flags, type_masks=serial_masks
+            )
+            parallel = strict_nc_breach_pii.analyze_pii_report(
+                self.report_path, trigger_flags=parallel_flags, workers=2, type_masks=parallel_masks
+            )
+        finally:
+            strict_nc_breach_pii.ANALYSIS_BATCH_SIZE = original_batch_size
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(list(parallel), list(serial))
+        self.assertEqual(parallel_flags, serial_flags)
+        self.assertEqual(parallel_masks, serial_masks)
+
+    def test_zero_workers_runs_serially(self):
+        """Test that zero workers analyzes in this process instead of starting a pool"""
+        serial = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+        with mock.patch.object(strict_nc_breach_pii.os, 'cpu_count', return_value=4), \
+                mock.patch.object(strict_nc_breach_pii.concurrent.futures, 'ProcessPoolExecutor',
+                                  side_effect=AssertionError("process pool started")):
+            self.assertEqual(strict_nc_breach_pii.analyze_pii_report(self.report_path, workers=0), serial)
+
+    def test_duplicate_file_path(self):
+        """Test that a file's entities split over several results are combined before the rules are checked"""
+        report = {'results': [
+            {'file_path': '/a.txt', 'entities': [make_entity('PERSON', 'Jane Doe')]},
+            {'file_path': '/b.txt', 'entities': [make_entity('LOCATION', 'Raleigh')]},
+            {'file_path': '/a.txt', 'entities': [make_entity('US_SSN', '123-45-6789')]},
+            {'file_path': '/a.txt', 'entities': [make_entity('US_SSN', '223-45-6789')]}
+        ]}
+        with open(self.report_path, 'w') as f:
+            json.dump(report, f)
+
+        original_batch_size = strict_nc_breach_pii.ANALYSIS_BATCH_SIZE
+        strict_nc_breach_pii.ANALYSIS_BATCH_SIZE = 1
+        try:
+            for workers in (1, 2):
+                trigger_flags, type_masks = {}, {}
+                breach_files = strict_nc_breach_pii.analyze_pii_report(
+                    self.report_path, max_samples_per_type=1, trigger_flags=trigger_flags,
+                    workers=workers, type_masks=type_masks
+                )
+
+                self.assertEqual(list(breach_files), ['/a.txt'])
+                self.assertEqual([e.text for e in breach_files['/a.txt']], ['Jane Doe', '123-45-6789'])
+                self.assertEqual(trigger_flags, {'/a.txt': strict_nc_breach_pii.BREACH_PERSONAL_INFO})
+                self.assertEqual(type_masks, {'/a.txt': strict_nc_breach_pii.entity_mask({'PERSON', 'US_SSN'})})
+        finally:
+            strict_nc_breach_pii.ANALYSIS_BATCH_SIZE = original_batch_size
+
+    def test_threshold(self):
+        """Test that lowering the threshold includes lower-confidence entities"""
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path, threshold=0.3)
+        self.assertIn('/data/low_score.txt', breach_files)
+
+    def test_file_paths(self):
+        """Test that the file paths of every result are read without their entities"""
+        self.assertEqual(
+            list(strict_nc_breach_pii.iter_report_file_paths(self.report_path)),
+            ['/data/ssn.txt', '/data/low_score.txt', '/data/creds.txt', '/data/empty.txt']
+        )
+
+    def test_file_type_stats_counted_during_analysis(self):
+        """Test that file types counted during the analysis give the same executive summary"""
+        file_type_stats = {}
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path, file_type_stats=file_type_stats)
+        self.assertEqual(file_type_stats, {'.txt': 4})
+
+        fused = strict_nc_breach_pii.generate_executive_summary(
+            breach_files, self.report_path, file_type_stats=file_type_stats
+        )
+        reread = strict_nc_breach_pii.generate_executive_summary(breach_files, self.report_path)
+        self.assertEqual(fused.split('\n')[2:], reread.split('\n')[2:])
+        self.assertIn("Total Files Analyzed: 4", fused)
+
+    def test_entities_missing_fields(self):
+        """Test that entities without a score are dropped and missing type or text default to empty"""
+        breach_files = strict_nc_breach_pii.find_breach_files([{'file_path': '/data/partial.txt', 'entities': [
+            {'entity_type': 'PERSON', 'score': 0.9},
+            {'entity_type': 'US_SSN', 'text': '123-45-6789', 'score': 0.9},
+            {'entity_type': 'CREDIT_CARD', 'text': '4111111111111111'}
+        ]}])
+        self.assertEqual(
+            [(e.type, e.text) for e in breach_files['/data/partial.txt']],
+            [('PERSON', ''), ('US_SSN', '123-45-6789')]
+        )
+
+    def test_max_samples_per_type(self):
+        """Test that only the requested number of samples per category is kept"""
+        report = {'results': [{'file_path': '/data/many.txt', 'entities': [
+            make_entity('PERSON', 'Jane Doe')
+        ] + [make_entity('US_SSN', f'123-45-678{i}') for i in range(5)]}]}
+        with open(self.report_path, 'w') as f:
+            json.dump(report, f)
+
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path, max_samples_per_type=2)
+        self.assertEqual(
+            [e.type for e in breach_files['/data/many.txt']],
+            ['PERSON', 'US_SSN', 'US_SSN']
+        )
+
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+        self.assertEqual(len(breach_files['/data/many.txt']), 6)
+
+    def test_summary_without_entities(self):
+        """Test that the executive summary only needs the recorded type masks"""
+        type_masks = {}
+        breach_files = strict_nc_breach_pii.analyze_pii_report(
+            self.report_path, max_samples_per_type=0, type_masks=type_masks
+        )
+        self.assertEqual(breach_files, {'/data/ssn.txt': [], '/data/creds.txt': []})
+
+        summary = strict_nc_breach_pii.generate_executive_summary(
+            breach_files, self.report_path, type_masks=type_masks
+        )
+        full = strict_nc_breach_pii.generate_executive_summary(
+            strict_nc_breach_pii.analyze_pii_report(self.report_path), self.report_path
+        )
+        self.assertEqual(summary.split('\n')[2:], full.split('\n')[2:])
+
+    def test_without_ijson(self):
+        """Test that reports are loaded whole when ijson is unavailable"""
+        original_ijson = strict_nc_breach_pii.ijson
+        original_orjson = strict_nc_breach_pii.orjson
+        strict_nc_breach_pii.ijson = None
+        try:
+            for loader in (original_orjson, None):
+                strict_nc_breach_pii.orjson = loader
+                results = list(strict_nc_breach_pii.iter_report_results(self.report_path))
+                breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+
+                self.assertEqual(len(results), 4)
+                self.assertEqual(
+                    list(strict_nc_breach_pii.iter_report_file_paths(self.report_path)),
+                    [result['file_path'] for result in results]
+                )
+                self.assertEqual(sorted(breach_files), ['/data/creds.txt', '/data/ssn.txt'])
+        finally:
+            strict_nc_breach_pii.ijson = original_ijson
+            strict_nc_breach_pii.orjson = original_orjson
+
+    def test_report_from_stdin(self):
+        """Test that a report can be piped in on standard input"""
+        with open(self.report_path, 'rb') as f:
+            data = f.read()
+
+        original_stdin = sys.stdin
+        sys.stdin = io.TextIOWrapper(io.BytesIO(data))
+        try:
+            breach_files = strict_nc_breach_pii.analyze_pii_report(strict_nc_breach_pii.STDIN_REPORT)
+        finally:
+            sys.stdin = original_stdin
+
+        self.assertEqual(breach_files, strict_nc_breach_pii.analyze_pii_report(self.report_path))
+
+    def test_text_report_written_to_file(self):
+        """Test that the text report written line by line matches the returned report"""
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+        out = io.StringIO()
+        self.assertIsNone(strict_nc_breach_pii.generate_report_text(breach_files, out=out))
+
+        report = strict_nc_breach_pii.generate_report_text(breach_files)
+        self.assertEqual(out.getvalue().split('\n')[2:], (report + '\n').split('\n')[2:])
+
+    def test_text_report_top_files(self):
+        """Test that the text report can be limited to the files with the most entities"""
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+        report = strict_nc_breach_pii.generate_report_text(breach_files)
+        top = strict_nc_breach_pii.generate_report_text(breach_files, top=1)
+
+        self.assertIn("Showing the 1 files with the most sensitive entities.", top)
+        self.assertEqual(top.count("File: "), 1)
+        first_file = report[report.index("File: "):report.index("-" * 80)]
+        self.assertIn(first_file, top)
+        self.assertIn(f"Found {len(breach_files)} files", top)
+
+        # A limit above the number of files reports every file
+        self.assertEqual(
+            strict_nc_breach_pii.generate_report_text(breach_files, top=len(breach_files)).split('\n')[2:],
+            report.split('\n')[2:]
+        )
+
+    def test_json_report_written_to_file(self):
+        """Test that the JSON report written entry by entry is indented JSON"""
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+        out = io.StringIO()
+        self.assertIsNone(strict_nc_breach_pii.generate_report_json(breach_files, out=out))
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['breach_files'], json.loads(strict_nc_breach_pii.generate_report_json(breach_files))['breach_files'])
+        self.assertEqual(report['metadata']['file_count'], len(breach_files))
+        self.assertEqual(out.getvalue(), json.dumps(report, indent=2, ensure_ascii=False))
+
+        empty = strict_nc_breach_pii.generate_report_json({})
+        self.assertEqual(json.loads(empty)['breach_files'], {})
+
+    def test_json_report_without_orjson(self):
+        """Test that the json fallback writes the same JSON report"""
+        breach_files = strict_nc_breach_pii.analyze_pii_report(self.report_path)
+        report_text = strict_nc_breach_pii.generate_report_json(breach_files)
+        report = json.loads(report_text)
+
+        original_orjson = strict_nc_breach_pii.orjson
+        strict_nc_breach_pii.orjson = None
+        try:
+            fallback_text = strict_nc_breach_pii.generate_report_json(breach_files)
+            fallback = json.loads(fallback_text)
+        finally:
+            strict_nc_breach_pii.orjson = original_orjson
+
+        # Non-ASCII text is written unescaped by both serializers
+        self.assertIn("§75-61", fallback_text)
+        self.assertIn("§75-61", report_text)
+
+        self.assertEqual(fallback['breach_files'], report['breach_files'])
+        self.assertEqual(fallback['metadata']['report_type'], report['metadata']['report_type'])
+
+class TestAnalyzePiiDatabase(unittest.TestCase):
+    """Test cases for finding breach files in a results database"""
+
+    def setUp(self):
+        """Store results for a small job"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.db')
+
+        db = get_database(self.db_path)
+        self.job_id = db.create_job(self.temp_dir)
+        for name in ('ssn.txt', 'low_score.txt', 'pending.txt'):
+            db.register_file(self.job_id, f"/data/{name}", 100, ".txt", time.time())
+        file_ids = [file_id for file_id, _ in db.get_pending_files(self.job_id)]
+
+        db.store_results_batch(self.job_id, [
+            {'file_id': file_ids[0], 'success': True, 'processing_time': 0.1,
+             'entities': [make_entity('PERSON', 'Jane Doe'), make_entity('US_SSN', '123-45-6789')]},
+            {'file_id': file_ids[1], 'success': True, 'processing_time': 0.1,
+             'entities': [make_entity('PERSON', 'John Roe'), make_entity('US_SSN', '987-65-4321', score=0.4)]}
+        ])
+        db.close()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_breach_files(self):
+        """Test that entities below the threshold are left out by the query"""
+        breach_files = strict_nc_breach_pii.analyze_pii_database(self.db_path, self.job_id)
+        self.assertEqual(list(breach_files), ['/data/ssn.txt'])
+        self.assertEqual([e.type for e in breach_files['/data/ssn.txt']], ['PERSON', 'US_SSN'])
+
+        breach_files = strict_nc_breach_pii.analyze_pii_database(self.db_path, self.job_id, threshold=0.3)
+        self.assertEqual(sorted(breach_files), ['/data/low_score.txt', '/data/ssn.txt'])
+
+    def test_entity_types_only(self):
+        """Test that keeping no entities reads grouped entity types with the same result"""
+        trigger_flags, type_masks = {}, {}
+        full_flags, full_masks = {}, {}
+        breach_files = strict_nc_breach_pii.analyze_pii_database(
+            self.db_path, self.job_id, max_samples_per_type=0, trigger_flags=trigger_flags, type_masks=type_masks
+        )
+        full = strict_nc_breach_pii.analyze_pii_database(
+            self.db_path, self.job_id, trigger_flags=full_flags, type_masks=full_masks
+        )
+
+        self.assertEqual(breach_files, {'/data/ssn.txt': []})
+        self.assertEqual(list(full), list(breach_files))
+        self.assertEqual((trigger_flags, type_masks), (full_flags, full_masks))
+
+        results = list(db_reporting.iter_entity_types_from_db(self.db_path, threshold=0.3))
+        self.assertEqual([r['file_path'] for r in results], ['/data/ssn.txt', '/data/low_score.txt'])
+        self.assertEqual([e['score'] for e in results[1]['entities'] if e['entity_type'] == 'US_SSN'], [0.4])
+
+    def test_summary_statistics_cached_until_write(self):
+        """Test that summary statistics are reused until the database changes"""
+        cached = db_reporting._cached_summary_statistics
+        cached.cache_clear()
+
+        file_types, processing_stats, _ = db_reporting.get_summary_statistics(self.db_path, self.job_id)
+        self.assertEqual(file_types, {'.txt': 3})
+        self.assertEqual(processing_stats['completed'], 2)
+
+        # Changing the returned dictionaries doesn't change the cached copy
+        file_types['.pdf'] = 1
+        self.assertEqual(db_reporting.get_summary_statistics(self.db_path, self.job_id)[0], {'.txt': 3})
+        self.assertEqual(cached.cache_info().hits, 1)
+
+        db = get_database(self.db_path)
+        db.register_file(self.job_id, "/data/new.docx", 100, ".docx", time.time())
+        db.close()
+
+        file_types, _, _ = db_reporting.get_summary_statistics(self.db_path, self.job_id)
+        self.assertEqual(file_types, {'.txt': 3, '.docx': 1})
+
+class TestCloneHighRiskFiles(unittest.TestCase):
+    """Test cases for copying high-risk files"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_clone_keeps_structure(self):
+        """Test that files are copied under their absolute paths and missing files skipped"""
+        source_files = [os.path.join(self.temp_dir, 'src', name) for name in ('a.txt', os.path.join('sub', 'b.txt'))]
+        for path in source_files:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(path)
+
+        clone_dir = os.path.join(self.temp_dir, 'clone')
+        high_risk_files = {path: [] for path in source_files + [os.path.join(self.temp_dir, 'missing.txt')]}
+        copied = strict_nc_breach_pii.clone_high_risk_files(high_risk_files, clone_dir)
+
+        self.assertEqual(len(copied), 2)
+        for path in source_files:
+            with open(os.path.join(clone_dir, os.path.relpath(path, '/'))) as f:
+                self.assertEqual(f.read(), path)
+
+    def test_clone_stays_under_root(self):
+        """Test that '..' in a source path can't place a copy outside the clone directory"""
+        source = os.path.join(self.temp_dir, 'src', 'a.txt')
+        os.makedirs(os.path.dirname(source))
+        with open(source, 'w') as f:
+            f.write(source)
+
+        # Enough '..' components to climb from the clone directory to '/'
+        traversal = os.path.join(os.path.dirname(source), *(['..'] * 20)) + source
+        clone_dir = os.path.join(self.temp_dir, 'clone')
+        copied = strict_nc_breach_pii.clone_high_risk_files({traversal: []}, clone_dir)
+
+        expected = os.path.join(clone_dir, os.path.relpath(source, '/'))
+        self.assertEqual(copied, [expected])
+        self.assertTrue(os.path.isfile(expected))
+
+    def test_missing_source_creates_no_directories(self):
+        """Test that a missing source file leaves no empty directories behind"""
+        clone_dir = os.path.join(self.temp_dir, 'clone')
+        missing = os.path.join(self.temp_dir, 'nonexistent', 'dir', 'a.txt')
+        copied = strict_nc_breach_pii.clone_high_risk_files({missing: []}, clone_dir)
+
+        self.assertEqual(copied, [])
+        self.assertEqual(os.listdir(clone_dir), [])
+
+if __name__ == '__main__':
+    unittest.main()
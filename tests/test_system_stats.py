@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared system utilization samples
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import system_stats
+
+class TestSystemStats(unittest.TestCase):
+    """Test cases for publishing and reading system samples"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.publisher = system_stats.SystemStatsPublisher(f"pii_test_{os.getpid()}")
+        system_stats.set_system_stats_source(self.publisher.name)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        system_stats.set_system_stats_source(None)
+        self.publisher.close()
+
+    def test_round_trip(self):
+        """Test that a published sample is read back"""
+        self.publisher.publish(42.0, 55.5, 3.25)
+
+        stats = system_stats.read_system_stats()
+        self.assertEqual(stats, {
+            'cpu_percent': 42.0,
+            'memory_percent': 55.5,
+            'available_memory_gb': 3.25
+        })
+        self.assertEqual(system_stats.get_available_memory_gb(), 3.25)
+
+    def test_stale_sample_is_ignored(self):
+        """Test that an unpublished or stale block falls back to psutil"""
+        self.assertIsNone(system_stats.read_system_stats())
+
+        self.publisher.publish(42.0, 55.5, 3.25)
+        original_max_age = system_stats.STATS_MAX_AGE
+        system_stats.STATS_MAX_AGE = -1
+        try:
+            self.assertIsNone(system_stats.read_system_stats())
+            self.assertGreater(system_stats.get_available_memory_gb(), 0)
+        finally:
+            system_stats.STATS_MAX_AGE = original_max_age
+
+    def test_no_source(self):
+        """Test that reading without a sampler returns None"""
+        system_stats.set_system_stats_source(None)
+        self.assertIsNone(system_stats.read_system_stats())
+
+        system_stats.set_system_stats_source('pii_test_missing_block')
+        self.assertIsNone(system_stats.read_system_stats())
+
+    def test_no_resource_tracker_errors(self):
+        """Test that reading in the publisher and in worker processes leaves its registration intact"""
+        # The resource tracker reports errors on its own stderr, so the
+        # publisher runs in a subprocess whose stderr is checked after exit;
+        # the script is a file so spawned workers can import it
+        script = textwrap.dedent("""
+            import multiprocessing
+            import sys
+            sys.path.insert(0, {root!r})
+            from src.utils import system_stats
+
+            def read(name):
+                system_stats.set_system_stats_source(name)
+                stats = system_stats.read_system_stats()
+                system_stats.set_system_stats_source(None)
+                return stats
+
+            if __name__ == '__main__':
+                publisher = system_stats.SystemStatsPublisher()
+                publisher.publish(42.0, 55.5, 3.25)
+                assert read(publisher.name)['cpu_percent'] == 42.0
+                for method in ('spawn', 'forkserver'):
+                    with multiprocessing.get_context(method).Pool(2) as pool:
+                        assert pool.map(read, [publisher.name] * 4)[0]['cpu_percent'] == 42.0
+                publisher.close()
+        """).format(root=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_path = os.path.join(temp_dir, 'publish_and_read.py')
+            with open(script_path, 'w') as f:
+                f.write(script)
+
+            result = subprocess.run([sys.executable, script_path], capture_output=True, text=True, timeout=120)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn('Traceback', result.stderr)
+        self.assertNotIn('leaked shared_memory', result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
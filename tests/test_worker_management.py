@@ -9,7 +9,10 @@ import sys
 import tempfile
 import shutil
 import time
+import threading
+import _thread
 import unittest
+from unittest.mock import patch
 from typing import Dict, Any, List
 
 # Add project root to path
@@ -23,9 +26,27 @@ from src.core.worker_management import (
     process_single_file_thread_safe,
     estimate_completion_time,
     interrupt_processing,
+    commit_results,
+    calculate_chunk_size,
+    MAX_TASK_CHUNK_SIZE,
     SafeQueue
 )
 
+def slow_file_chunk(files, db_path, job_id):
+    """Worker task that runs long enough to be interrupted"""
+    time.sleep(60)
+    return [], {}
+
+def crashing_file_chunk(files, db_path, job_id):
+    """Worker task whose process dies on files named 'crash'"""
+    if any('crash' in file_path for _, file_path in files):
+        os._exit(1)
+    return [
+        {'file_id': file_id, 'file_path': file_path, 'success': True,
+         'processing_time': 0.0, 'entities': []}
+        for file_id, file_path in files
+    ], {}
+
 # Mock processing function for testing
 def mock_process_file(file_path: str, settings: Dict[str, Any]) -> Dict[str, Any]:
     """Mock processing function that simulates finding entities"""
@@ -265,6 +286,194 @@ class TestWorkerManagement(unittest.TestCase):
         processing_files = sum(1 for f in job_data['results'] if f['status'] == 'processing')
         self.assertEqual(processing_files, 0)
 
+class TestCommitResults(unittest.TestCase):
+    """Test cases for batched result commits"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = get_database(os.path.join(self.temp_dir, "test.db"))
+        self.job_id = self.db.create_job(self.temp_dir)
+        
+        for i in range(3):
+            self.db.register_file(self.job_id, f"/data/file{i}.txt", 100, ".txt", time.time())
+        self.file_ids = [file_id for file_id, _ in self.db.get_pending_files(self.job_id)]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_batch_updates_files_and_job(self):
+        """Test that a batch stores results, statuses and job counters together"""
+        entity = {'entity_type': 'SSN', 'text': '123-45-6789', 'start': 0, 'end': 11, 'score': 0.99}
+        results = [
+            {'file_id': self.file_ids[0], 'file_path': '/data/file0.txt', 'success': True,
+             'processing_time': 0.1, 'entities': [entity, entity]},
+            {'file_id': self.file_ids[1], 'file_path': '/data/file1.txt', 'success': True,
+             'processing_time': 0.1, 'entities': []},
+            {'file_id': self.file_ids[2], 'file_path': '/data/file2.txt', 'success': False,
+             'error_message': 'Unreadable'}
+        ]
+        
+        events = []
+        commit_results(self.db, self.job_id, results, events.append)
+        
+        # Every result is reported to the callback after the commit
+        self.assertEqual([e['type'] for e in events], ['file_completed', 'file_completed', 'file_error'])
+        self.assertEqual(events[2]['error'], 'Unreadable')
+        
+        job = self.db.get_job(self.job_id)
+        self.assertEqual(job['processed_files'], 2)
+        self.assertEqual(job['error_files'], 1)
+        
+        counts = self.db.get_file_status_counts(self.job_id)
+        self.assertEqual(counts.get('completed'), 2)
+        self.assertEqual(counts.get('error'), 1)
+        
+        entity_count = self.db.conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+        self.assertEqual(entity_count, 2)
+    
+    def test_failed_batch_stores_files_individually(self):
+        """Test that a rolled back batch falls back to per-file writes"""
+        entity = {'entity_type': 'SSN', 'text': '123-45-6789', 'start': 0, 'end': 11, 'score': 0.99}
+        # sqlite3 can't bind a dict, so this result fails the batch transaction
+        bad_entity = dict(entity, text={'not': 'text'})
+        results = [
+            {'file_id': self.file_ids[0], 'file_path': '/data/file0.txt', 'success': True,
+             'processing_time': 0.1, 'entities': [entity]},
+            {'file_id': self.file_ids[1], 'file_path': '/data/file1.txt', 'success': True,
+             'processing_time': 0.1, 'entities': [bad_entity]},
+            {'file_id': self.file_ids[2], 'file_path': '/data/file2.txt', 'success': False,
+             'error_message': 'Unreadable'}
+        ]
+        
+        events = []
+        failed_count = commit_results(self.db, self.job_id, results, events.append)
+        
+        # Only the file that couldn't be stored is reported as an error
+        self.assertEqual(failed_count, 1)
+        self.assertEqual([e['type'] for e in events], ['file_completed', 'file_error', 'file_error'])
+        
+        counts = self.db.get_file_status_counts(self.job_id)
+        self.assertEqual(counts, {'completed': 1, 'error': 2})
+        
+        job = self.db.get_job(self.job_id)
+        self.assertEqual(job['processed_files'], 1)
+        self.assertEqual(job['error_files'], 2)
+
+class TestStopEvent(unittest.TestCase):
+    """Test cases for stopping processing through an event"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = get_database(os.path.join(self.temp_dir, "test.db"))
+        self.job_id = self.db.create_job(self.temp_dir)
+        self.db.register_file(self.job_id, "/data/file0.txt", 100, ".txt", time.time())
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_stop_before_start(self):
+        """Test that a set stop event leaves files pending and the job interrupted"""
+        stop_event = threading.Event()
+        stop_event.set()
+        
+        result = process_files_parallel(
+            self.db, self.job_id, None, max_workers=1, stop_event=stop_event
+        )
+        
+        self.assertEqual(result['status'], 'interrupted')
+        self.assertEqual(result['processed'], 0)
+        self.assertEqual(self.db.get_file_status_counts(self.job_id), {'pending': 1})
+
+class TestChunkErrors(unittest.TestCase):
+    """Test cases for chunks that fail as a whole"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = get_database(os.path.join(self.temp_dir, "test.db"))
+        self.job_id = self.db.create_job(self.temp_dir)
+        for i in range(3):
+            self.db.register_file(self.job_id, f"/data/file{i}.txt", 100, ".txt", time.time())
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_failed_chunk_marks_files_as_errors(self):
+        """Test that files in a chunk whose task raises are not left processing"""
+        events = []
+        # A lambda can't be pickled, so every submitted task fails
+        with patch('src.core.worker_management.process_file_chunk', lambda *args: []):
+            result = process_files_parallel(
+                self.db, self.job_id, None, max_workers=1, progress_callback=events.append
+            )
+        
+        self.assertEqual(result['errors'], 3)
+        self.assertEqual(self.db.get_file_status_counts(self.job_id), {'error': 3})
+        self.assertEqual([e['type'] for e in events], ['file_error'] * 3)
+    
+    def test_dead_worker_only_fails_its_file(self):
+        """Test that files sharing a chunk with one that kills its worker are retried"""
+        self.db.register_file(self.job_id, "/data/crash.txt", 100, ".txt", time.time())
+        
+        with patch('src.core.worker_management.process_file_chunk', crashing_file_chunk), \
+                patch('src.core.worker_management.calculate_chunk_size', return_value=4):
+            result = process_files_parallel(self.db, self.job_id, None, max_workers=2)
+        
+        self.assertEqual(result['processed'], 3)
+        self.assertEqual(result['errors'], 1)
+        self.assertEqual(self.db.get_file_status_counts(self.job_id), {'completed': 3, 'error': 1})
+
+class TestInterrupt(unittest.TestCase):
+    """Test cases for interrupting running chunks"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = get_database(os.path.join(self.temp_dir, "test.db"))
+        self.job_id = self.db.create_job(self.temp_dir)
+        for i in range(3):
+            self.db.register_file(self.job_id, f"/data/file{i}.txt", 100, ".txt", time.time())
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_keyboard_interrupt_abandons_running_files(self):
+        """Test that a KeyboardInterrupt stops waiting and returns running files to pending"""
+        # Simulates the second Ctrl+C, which raises in the main thread
+        timer = threading.Timer(2.0, _thread.interrupt_main)
+        start = time.monotonic()
+        with patch('src.core.worker_management.process_file_chunk', slow_file_chunk):
+            timer.start()
+            result = process_files_parallel(self.db, self.job_id, None, max_workers=1)
+        
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertEqual(result['status'], 'interrupted')
+        self.assertEqual(self.db.get_job_status(self.job_id), 'interrupted')
+        self.assertEqual(self.db.get_file_status_counts(self.job_id), {'pending': 3})
+
+class TestChunkSize(unittest.TestCase):
+    """Test cases for task chunk sizing"""
+    
+    def test_chunk_size_bounds(self):
+        """Test that chunks are at least one file and capped for large batches"""
+        self.assertEqual(calculate_chunk_size(0, 4), 1)
+        self.assertEqual(calculate_chunk_size(3, 8), 1)
+        self.assertEqual(calculate_chunk_size(100, 4), 6)
+        self.assertEqual(calculate_chunk_size(100000, 4), MAX_TASK_CHUNK_SIZE)
+        
+        # A bad worker count never divides by zero
+        self.assertEqual(calculate_chunk_size(100, 0), 25)
+
 def manual_test():
     """Run a manual test for interactive exploration"""
     from tests.test_file_discovery import create_test_directory
@@ -9,17 +9,30 @@ import json
 import sys
 import os
 import argparse
+import concurrent.futures
 import shutil
 import logging
 from enum import IntEnum
 from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Set, Optional, Any, Tuple
+
+# ijson is optional; it lets large reports be read one file result at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional; it parses whole reports several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add src directory to path to allow imports from PII analyzer modules
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
-from src.database.db_reporting import load_pii_data_from_db, get_file_type_statistics
+from src.database.db_reporting import load_pii_data_from_db, get_summary_statistics
 
 # UNC-System classification tiers
 class UNCTier(IntEnum):
@@ -28,25 +41,31 @@ class UNCTier(IntEnum):
     CONFIDENTIAL = 2  # Tier-2
     RESTRICTED = 3    # Tier-3
 
+# Threads copying files in clone_classified_files
+CLONE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Tiers in the order the executive summary lists them
+_SORTED_TIERS = tuple(sorted(UNCTier))
+
 # Maps entity types to UNC classification tiers
-RESTRICTED = {
+RESTRICTED = frozenset({
     "US_SOCIAL_SECURITY_NUMBER", "US_SSN", "CREDIT_CARD", "BANK_ACCOUNT",
     "US_DRIVER_LICENSE", "US_PASSPORT",
     "MEDICAL_RECORD_NUMBER", "HEALTH_INSURANCE_POLICY_NUMBER",
     "PASSWORD", "ACCESS_CODE", "AWS_SECRET_KEY", "ITAR_CONTROLLED",
     "PIN_CODE", "SECURITY_ANSWER", "DIGITAL_SIGNATURE", "BIOMETRIC_IDENTIFIER",
-}
+})
 
-CONFIDENTIAL = {
+CONFIDENTIAL = frozenset({
     "STUDENT_ID", "EMPLOYEE_ID", "GOV_ID",
     "IBAN_CODE", "US_BANK_NUMBER", "US_BANK_ROUTING", "SWIFT_CODE",
     "DONOR_NAME", "GRANT_ID"
-}
+})
 
-INTERNAL = {
+INTERNAL = frozenset({
     "PERSON", "FIRST_NAME", "LAST_NAME", "EMAIL_ADDRESS", "PHONE_NUMBER",
     "ORG", "IP_ADDRESS", "US_POSTAL_CODE", "USERNAME", "ADDRESS"
-}
+})
 
 # User-friendly display names for entity types
 ENTITY_DISPLAY_NAMES = {
@@ -111,6 +130,25 @@ TIER_DISPLAY = {
     }
 }
 
+# Tiers whose entity types the executive summary lists, most sensitive first
+_SUMMARY_TIER_TYPES = (
+    (UNCTier.RESTRICTED, RESTRICTED),
+    (UNCTier.CONFIDENTIAL, CONFIDENTIAL),
+    (UNCTier.INTERNAL, INTERNAL),
+)
+
+# Sort rank and sensitivity label of each entity type in the detailed report;
+# types in several sets take the most sensitive one
+_ENTITY_SENSITIVITY = {
+    **{entity_type: (1, "Internal") for entity_type in INTERNAL},
+    **{entity_type: (2, "Confidential") for entity_type in CONFIDENTIAL},
+    **{entity_type: (3, "Restricted") for entity_type in RESTRICTED},
+}
+_PUBLIC_SENSITIVITY = (0, "Public")
+
+# Line between files in the detailed report
+REPORT_SEPARATOR = "-" * 80
+
 # Threshold values for high confidence PII
 HIGH_CONFIDENCE_THRESHOLD = 0.7
 
@@ -119,34 +157,30 @@ def tier_for_entities(entity_types: Set[str]) -> UNCTier:
     Return the highest UNC tier indicated by the set of
     Presidio entity type strings found in a document.
     """
-    if entity_types & RESTRICTED:
+    if not entity_types.isdisjoint(RESTRICTED):
         return UNCTier.RESTRICTED
-    if entity_types & CONFIDENTIAL:
+    if not entity_types.isdisjoint(CONFIDENTIAL):
         return UNCTier.CONFIDENTIAL
-    if entity_types & INTERNAL:
+    if not entity_types.isdisjoint(INTERNAL):
         return UNCTier.INTERNAL
     return UNCTier.PUBLIC
 
-def analyze_pii_report(report_path: str, threshold: float = HIGH_CONFIDENCE_THRESHOLD) -> Dict[str, Dict]:
+def classify_file_results(file_results: Iterable[Dict], threshold: float = HIGH_CONFIDENCE_THRESHOLD) -> Dict[str, Dict]:
     """
-    Analyzes a PII report to classify files according to UNC data classification tiers.
+    Classify file results according to UNC data classification tiers.
     
     Args:
-        report_path: Path to the PII analysis report JSON file
-        threshold: Confidence threshold for entities (default: 0.7)
+        file_results: Iterable of file result dictionaries
+        threshold: Confidence threshold for entities
         
     Returns:
         Dictionary of files with their entities and classification tiers
     """
-    with open(report_path, 'r') as f:
-        data = json.load(f)
-    
-    # Dictionary to track files and their entities
-    file_entities = defaultdict(list)
-    file_entity_sets = defaultdict(set)
+    # Entity types and report entries per file, built in a single pass
+    files = {}
     
     # Process each file result
-    for file_result in data.get('results', []):
+    for file_result in file_results:
         file_path = file_result.get('file_path', '')
         entities = file_result.get('entities', [])
         
@@ -157,33 +191,128 @@ def analyze_pii_report(report_path: str, threshold: float = HIGH_CONFIDENCE_THRE
             text = entity.get('text', '')
             
             if confidence >= threshold:
+                # Parsed type names are new strings; interning keeps one copy per
+                # type across the stored entries and speeds the tier set lookups
+                entity_type = sys.intern(entity_type)
+                record = files.get(file_path)
+                if record is None:
+                    record = files[file_path] = {'types': set(), 'entities': []}
+                
                 # Add to entity set for tier evaluation
-                file_entity_sets[file_path].add(entity_type)
+                record['types'].add(entity_type)
                 
                 # Store all entities for reporting
-                file_entities[file_path].append({
+                record['entities'].append({
                     'type': entity_type,
                     'category': ENTITY_DISPLAY_NAMES.get(entity_type, entity_type),
                     'confidence': confidence,
                     'text': text
                 })
     
-    # Classify each file according to UNC tiers
+    # Classify each file with entities according to UNC tiers
     classified_files = {}
-    for file_path, entity_set in file_entity_sets.items():
-        tier = tier_for_entities(entity_set)
-        
-        # Only include files with entities (exclude purely public)
-        if len(file_entities[file_path]) > 0:
-            classified_files[file_path] = {
-                'tier': tier,
-                'tier_name': TIER_DISPLAY[tier]['name'],
-                'entities': file_entities[file_path],
-                'entity_types': list(entity_set)
-            }
+    for file_path, record in files.items():
+        tier = tier_for_entities(record['types'])
+        classified_files[file_path] = {
+            'tier': tier,
+            'tier_name': TIER_DISPLAY[tier]['name'],
+            'entities': record['entities'],
+            'entity_types': list(record['types'])
+        }
     
     return classified_files
 
+def iter_report_results(report_path: str) -> Iterable[Dict]:
+    """
+    Iterate over the file results of a PII analysis report.
+    
+    Uses ijson to stream the results array when it is installed, so only one
+    file result is held in memory at a time; otherwise loads the whole report
+    with orjson or json.
+    
+    Args:
+        report_path: Path to the PII analysis report JSON file
+        
+    Yields:
+        Dictionary for each file result in the report
+    """
+    if ijson is not None:
+        with open(report_path, 'rb') as f:
+            yield from ijson.items(f, 'results.item', use_float=True)
+        return
+    
+    if orjson is not None:
+        with open(report_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(report_path, 'r') as f:
+            data = json.load(f)
+    yield from data.get('results', [])
+
+def iter_report_file_paths(report_path: str) -> Iterable[str]:
+    """
+    Iterate over the file paths of a PII analysis report.
+    
+    With ijson only the file_path fields are built, so the entities of each
+    result are skipped instead of being parsed into dictionaries.
+    
+    Args:
+        report_path: Path to the PII analysis report JSON file
+        
+    Yields:
+        File path of each file result in the report
+    """
+    if ijson is not None:
+        with open(report_path, 'rb') as f:
+            yield from ijson.items(f, 'results.item.file_path')
+        return
+    
+    for result in iter_report_results(report_path):
+        yield result.get('file_path', '')
+
+def _count_file_type(file_type_stats: Dict[str, int], file_path: str):
+    """Count a file's extension in file_type_stats."""
+    if file_path:
+        ext = os.path.splitext(file_path)[1].lower()
+        file_type_stats[ext] = file_type_stats.get(ext, 0) + 1
+
+def count_file_types(file_results: Iterable[Dict], file_type_stats: Dict[str, int]) -> Iterable[Dict]:
+    """
+    Pass file results through unchanged, counting their file types.
+    
+    Lets the analysis fill the executive summary's file type statistics in
+    the same pass over the report, instead of reading it a second time.
+    
+    Args:
+        file_results: Iterable of file result dictionaries
+        file_type_stats: Dictionary of extension counts to update
+        
+    Yields:
+        Each file result
+    """
+    for file_result in file_results:
+        _count_file_type(file_type_stats, file_result.get('file_path', ''))
+        yield file_result
+
+def analyze_pii_report(report_path: str, threshold: float = HIGH_CONFIDENCE_THRESHOLD,
+                       file_type_stats: Optional[Dict[str, int]] = None) -> Dict[str, Dict]:
+    """
+    Analyzes a PII report to classify files according to UNC data classification tiers.
+    
+    Args:
+        report_path: Path to the PII analysis report JSON file
+        threshold: Confidence threshold for entities (default: 0.7)
+        file_type_stats: Optional dictionary filled with the extension counts
+                         of every file in the report, for the executive summary
+        
+    Returns:
+        Dictionary of files with their entities and classification tiers
+    """
+    file_results = iter_report_results(report_path)
+    if file_type_stats is not None:
+        file_results = count_file_types(file_results, file_type_stats)
+    return classify_file_results(file_results, threshold)
+
 def analyze_pii_database(db_path: str, job_id: Optional[int] = None, threshold: float = HIGH_CONFIDENCE_THRESHOLD) -> Dict[str, Dict]:
     """
     Analyzes PII data from a database to classify files according to UNC data classification tiers.
@@ -196,89 +325,54 @@ def analyze_pii_database(db_path: str, job_id: Optional[int] = None, threshold:
     Returns:
         Dictionary of files with their entities and classification tiers
     """
-    # Load data from database
+    # Load data from database (already filtered by the threshold)
     data = load_pii_data_from_db(db_path, job_id, threshold)
     
-    # Dictionary to track files and their entities
-    file_entities = defaultdict(list)
-    file_entity_sets = defaultdict(set)
+    return classify_file_results(data.get('results', []), threshold)
+
+def generate_executive_summary(classified_files: Dict[str, Dict], original_report_path: str = None, db_path: str = None, job_id: Optional[int] = None,
+                               file_type_stats: Optional[Dict[str, int]] = None) -> str:
+    """
+    Generate a concise executive summary report of classified files.
     
-    # Process each file result
-    for file_result in data.get('results', []):
-        file_path = file_result.get('file_path', '')
-        entities = file_result.get('entities', [])
-        
-        # Collect all high-confidence entities for the file
-        for entity in entities:
-            entity_type = entity.get('entity_type', '')
-            confidence = entity.get('score', 0.0)
-            text = entity.get('text', '')
-            
-            # Add to entity set for tier evaluation
-            file_entity_sets[file_path].add(entity_type)
-            
-            # Store all entities for reporting
-            file_entities[file_path].append({
-                'type': entity_type,
-                'category': ENTITY_DISPLAY_NAMES.get(entity_type, entity_type),
-                'confidence': confidence,
-                'text': text
-            })
-    
-    # Classify each file according to UNC tiers
-    classified_files = {}
-    for file_path, entity_set in file_entity_sets.items():
-        tier = tier_for_entities(entity_set)
-        
-        # Only include files with entities (exclude purely public)
-        if len(file_entities[file_path]) > 0:
-            classified_files[file_path] = {
-                'tier': tier,
-                'tier_name': TIER_DISPLAY[tier]['name'],
-                'entities': file_entities[file_path],
-                'entity_types': list(entity_set)
-            }
+    Args:
+        classified_files: Dictionary of files with their entities and classification tiers
+        original_report_path: Optional path to the PII analysis report, read for
+                              file type counts when no other source provides them
+        db_path: Optional path to the PII database to read file, processing
+                 and time statistics from
+        job_id: Optional job ID to limit the database statistics to
+        file_type_stats: Optional dictionary of extension counts recorded by
+                         analyze_pii_report; the original report is then not read again
     
-    return classified_files
-
-def generate_executive_summary(classified_files: Dict[str, Dict], original_report_path: str = None, db_path: str = None, job_id: Optional[int] = None) -> str:
-    """Generate a concise executive summary report of classified files."""
+    Returns:
+        Executive summary report text
+    """
     output = []
     output.append(f"UNC DATA CLASSIFICATION EXECUTIVE SUMMARY")
     output.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Extract file type statistics if available
-    file_type_stats = {}
-    total_files = 0
+    file_type_stats = dict(file_type_stats) if file_type_stats else {}
+    total_files = sum(file_type_stats.values())
     file_processing_stats = None
     
     # Try to extract file type information and processing stats from the database if provided
     if db_path:
         try:
-            file_type_stats = get_file_type_statistics(db_path, job_id)
+            # File type, processing and time statistics, cached until the database changes
+            file_type_stats, file_processing_stats, time_stats = get_summary_statistics(db_path, job_id)
             total_files = sum(file_type_stats.values())
-            
-            # Get file processing statistics
-            from src.database.db_reporting import get_file_processing_stats, get_processing_time_stats
-            file_processing_stats = get_file_processing_stats(db_path, job_id)
-            time_stats = get_processing_time_stats(db_path, job_id)
         except Exception as e:
             print(f"Warning: Could not extract file statistics from database: {e}")
     
     # If database not provided or failed, try from the original report
     if not file_type_stats and original_report_path and os.path.exists(original_report_path):
         try:
-            with open(original_report_path, 'r') as f:
-                data = json.load(f)
-                
-                # Count file types from all files in the report
-                if 'results' in data:
-                    for result in data.get('results', []):
-                        file_path = result.get('file_path', '')
-                        if file_path:
-                            ext = os.path.splitext(file_path)[1].lower()
-                            file_type_stats[ext] = file_type_stats.get(ext, 0) + 1
-                            total_files += 1
+            # Count file types from all files in the report
+            for file_path in iter_report_file_paths(original_report_path):
+                _count_file_type(file_type_stats, file_path)
+            total_files = sum(file_type_stats.values())
         except Exception as e:
             print(f"Warning: Could not extract file statistics from report: {e}")
     
@@ -333,7 +427,7 @@ def generate_executive_summary(classified_files: Dict[str, Dict], original_repor
     # Show counts by tier
     output.append("")
     output.append("Classification Summary:")
-    for tier in sorted([UNCTier.RESTRICTED, UNCTier.CONFIDENTIAL, UNCTier.INTERNAL, UNCTier.PUBLIC]):
+    for tier in _SORTED_TIERS:
         count = tier_counts.get(tier, 0)
         if count > 0:
             tier_info = TIER_DISPLAY[tier]
@@ -349,23 +443,14 @@ def generate_executive_summary(classified_files: Dict[str, Dict], original_repor
     output.append("")
     output.append("Top Sensitive Entity Types by Tier:")
     
-    # Restricted entities
-    if UNCTier.RESTRICTED in entity_by_tier and entity_by_tier[UNCTier.RESTRICTED]:
-        output.append(f"  {TIER_DISPLAY[UNCTier.RESTRICTED]['name']}:")
-        for entity_type in sorted(entity_by_tier[UNCTier.RESTRICTED] & RESTRICTED):
-            output.append(f"    • {ENTITY_DISPLAY_NAMES.get(entity_type, entity_type)}")
-    
-    # Confidential entities
-    if UNCTier.CONFIDENTIAL in entity_by_tier and entity_by_tier[UNCTier.CONFIDENTIAL]:
-        output.append(f"  {TIER_DISPLAY[UNCTier.CONFIDENTIAL]['name']}:")
-        for entity_type in sorted(entity_by_tier[UNCTier.CONFIDENTIAL] & CONFIDENTIAL):
-            output.append(f"    • {ENTITY_DISPLAY_NAMES.get(entity_type, entity_type)}")
-    
-    # Internal entities
-    if UNCTier.INTERNAL in entity_by_tier and entity_by_tier[UNCTier.INTERNAL]:
-        output.append(f"  {TIER_DISPLAY[UNCTier.INTERNAL]['name']}:")
-        for entity_type in sorted(entity_by_tier[UNCTier.INTERNAL] & INTERNAL):
-            output.append(f"    • {ENTITY_DISPLAY_NAMES.get(entity_type, entity_type)}")
+    # Restricted, confidential and internal entities
+    for tier, tier_types in _SUMMARY_TIER_TYPES:
+        if entity_by_tier.get(tier):
+            output.append(f"  {TIER_DISPLAY[tier]['name']}:")
+            output.extend([
+                f"    • {ENTITY_DISPLAY_NAMES.get(entity_type, entity_type)}"
+                for entity_type in sorted(entity_by_tier[tier] & tier_types)
+            ])
     
     # Return formatted summary
     return "\n".join(output)
@@ -376,7 +461,7 @@ def generate_detailed_report(classified_files: Dict[str, Dict]) -> str:
     output.append(f"UNC DATA CLASSIFICATION DETAILED REPORT")
     output.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     output.append(f"Total Files: {len(classified_files)}")
-    output.append("-" * 80)
+    output.append(REPORT_SEPARATOR)
     
     # Sort files by tier (highest to lowest) and then by path
     sorted_files = sorted(
@@ -406,20 +491,13 @@ def generate_detailed_report(classified_files: Dict[str, Dict]) -> str:
         # Print entities by type, sorted by highest sensitivity
         for entity_type, group in sorted(
             entity_groups.items(),
-            key=lambda x: (
-                -(3 if x[0] in RESTRICTED else 
-                  2 if x[0] in CONFIDENTIAL else 
-                  1 if x[0] in INTERNAL else 0),
-                x[0]
-            )
+            key=lambda x: (-_ENTITY_SENSITIVITY.get(x[0], _PUBLIC_SENSITIVITY)[0], x[0])
         ):
             # Get friendly name for entity type
             friendly_name = ENTITY_DISPLAY_NAMES.get(entity_type, entity_type)
             
             # Determine sensitivity tier of this entity type
-            entity_tier = "Restricted" if entity_type in RESTRICTED else \
-                         "Confidential" if entity_type in CONFIDENTIAL else \
-                         "Internal" if entity_type in INTERNAL else "Public"
+            entity_tier = _ENTITY_SENSITIVITY.get(entity_type, _PUBLIC_SENSITIVITY)[1]
             
             output.append(f"  - {friendly_name} ({entity_tier}):")
             
@@ -433,7 +511,7 @@ def generate_detailed_report(classified_files: Dict[str, Dict]) -> str:
             if len(group) > 5:
                 output.append(f"    ... and {len(group) - 5} more instances")
         
-        output.append("-" * 80)
+        output.append(REPORT_SEPARATOR)
     
     return "\n".join(output)
 
@@ -503,14 +581,24 @@ def clone_classified_files(classified_files: Dict[str, Dict], clone_dir: str, mi
     """
     os.makedirs(clone_dir, exist_ok=True)
     
-    # Create tier subdirectories
+    # Create tier subdirectories; files already in them count as taken
+    # target paths, so duplicates are found without a stat per file
+    target_paths = set()
     for tier in UNCTier:
         if min_tier is None or tier >= min_tier:
             tier_dir = os.path.join(clone_dir, TIER_DISPLAY[tier]['name'])
             os.makedirs(tier_dir, exist_ok=True)
+            target_paths.update(
+                os.path.join(tier_dir, name) for name in _directory_entries(tier_dir)
+            )
+    
+    # Source files are checked against one listing of each parent directory
+    # instead of being stat'ed one at a time
+    source_entries = {}
     
-    # Copy files to appropriate tier directories
-    copied_files = []
+    # Choose every target path first, so duplicate names are resolved in
+    # order before any copies run
+    copies = []
     for file_path, file_data in classified_files.items():
         tier = file_data['tier']
         
@@ -518,30 +606,109 @@ def clone_classified_files(classified_files: Dict[str, Dict], clone_dir: str, mi
         if min_tier is not None and tier < min_tier:
             continue
         
-        # Create target directory
+        parent, filename = os.path.split(file_path)
+        entries = source_entries.get(parent)
+        if entries is None:
+            entries = source_entries[parent] = _directory_entries(parent or os.curdir)
+        if filename not in entries:
+            continue
+        
+        # Target directory for the file's tier
         target_dir = os.path.join(clone_dir, TIER_DISPLAY[tier]['name'])
+        target_path = os.path.join(target_dir, filename)
         
-        # Copy file
-        try:
-            if os.path.exists(file_path):
-                filename = os.path.basename(file_path)
-                target_path = os.path.join(target_dir, filename)
-                
-                # Handle duplicate filenames by adding a suffix
-                if os.path.exists(target_path):
-                    base, ext = os.path.splitext(filename)
-                    i = 1
-                    while os.path.exists(target_path):
-                        target_path = os.path.join(target_dir, f"{base}_{i}{ext}")
-                        i += 1
-                
-                shutil.copy2(file_path, target_path)
-                copied_files.append(file_path)
-        except Exception as e:
-            print(f"Error copying {file_path}: {e}")
+        # Handle duplicate filenames by adding a suffix
+        if target_path in target_paths:
+            base, ext = os.path.splitext(filename)
+            i = 1
+            while target_path in target_paths:
+                target_path = os.path.join(target_dir, f"{base}_{i}{ext}")
+                i += 1
+        
+        target_paths.add(target_path)
+        copies.append((file_path, target_path))
+    
+    # Copies are I/O bound, so run several at once
+    with concurrent.futures.ThreadPoolExecutor(max_workers=CLONE_WORKERS) as executor:
+        results = executor.map(lambda copy: _copy_file(*copy), copies)
+        copied_files = [file_path for file_path in results if file_path]
     
     return copied_files
 
+def _directory_entries(directory: str) -> Set[str]:
+    """List the entry names of a directory, or an empty set if it can't be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+def _copy_file(file_path: str, target_path: str) -> Optional[str]:
+    """Copy one file, returning file_path or None if it failed."""
+    try:
+        shutil.copy2(file_path, target_path)
+        return file_path
+    except Exception as e:
+        print(f"Error copying {file_path}: {e}")
+        return None
+
+def _mask_fully(text: str) -> str:
+    """Mask highly sensitive information completely."""
+    return "********"
+
+def _mask_name(text: str) -> str:
+    """Partially mask names, keeping the first letter of each part."""
+    parts = text.split()
+    if len(parts) == 1:
+        # Single name
+        if len(text) <= 2:
+            return text[0] + "*"
+        return text[0] + "*" * (len(text) - 1)
+    else:
+        # Multiple parts (e.g., "John Smith")
+        masked_parts = []
+        for part in parts:
+            if len(part) <= 1:
+                masked_parts.append(part)
+            else:
+                masked_parts.append(part[0] + "*" * (len(part) - 1))
+        return " ".join(masked_parts)
+
+def _mask_id(text: str) -> str:
+    """Partially mask IDs and numbers, keeping the last 4 characters."""
+    if len(text) <= 4:
+        return "*" * len(text)
+    return "*" * (len(text) - 4) + text[-4:]
+
+def _mask_email(text: str) -> str:
+    """Partially mask the username of an email address."""
+    username, at, domain = text.partition("@")
+    if not at:
+        return _mask_default(text)
+    if len(username) <= 2:
+        masked_username = username
+    else:
+        masked_username = username[0] + "*" * (len(username) - 2) + username[-1]
+    return f"{masked_username}@{domain}"
+
+def _mask_default(text: str) -> str:
+    """Default masking for other types - show first and last character."""
+    if len(text) <= 2:
+        return text
+    return text[0] + "*" * (len(text) - 2) + text[-1]
+
+# Masking function for each entity type; other types use _mask_default
+MASK_FUNCTIONS = {
+    **dict.fromkeys(("US_SOCIAL_SECURITY_NUMBER", "US_SSN", "CREDIT_CARD",
+                     "PASSWORD", "ACCESS_CODE", "PIN_CODE",
+                     "SECURITY_ANSWER", "AWS_SECRET_KEY"), _mask_fully),
+    **dict.fromkeys(("PERSON", "FIRST_NAME", "LAST_NAME"), _mask_name),
+    **dict.fromkeys(("US_DRIVER_LICENSE", "US_PASSPORT", "BANK_ACCOUNT",
+                     "MEDICAL_RECORD_NUMBER", "HEALTH_INSURANCE_POLICY_NUMBER",
+                     "US_BANK_NUMBER", "US_BANK_ROUTING", "IBAN_CODE"), _mask_id),
+    "EMAIL_ADDRESS": _mask_email,
+}
+
 def mask_sensitive_text(text: str, entity_type: str) -> str:
     """
     Mask sensitive text for display in reports.
@@ -557,51 +724,7 @@ def mask_sensitive_text(text: str, entity_type: str) -> str:
     if not text:
         return ""
     
-    # Highly sensitive information (always mask completely)
-    if entity_type in {"US_SOCIAL_SECURITY_NUMBER", "US_SSN", "CREDIT_CARD", 
-                      "PASSWORD", "ACCESS_CODE", "PIN_CODE", 
-                      "SECURITY_ANSWER", "AWS_SECRET_KEY"}:
-        return "********"
-    
-    # Partially mask names
-    if entity_type in {"PERSON", "FIRST_NAME", "LAST_NAME"}:
-        parts = text.split()
-        if len(parts) == 1:
-            # Single name
-            if len(text) <= 2:
-                return text[0] + "*"
-            return text[0] + "*" * (len(text) - 1)
-        else:
-            # Multiple parts (e.g., "John Smith")
-            masked_parts = []
-            for part in parts:
-                if len(part) <= 1:
-                    masked_parts.append(part)
-                else:
-                    masked_parts.append(part[0] + "*" * (len(part) - 1))
-            return " ".join(masked_parts)
-    
-    # Partially mask IDs and numbers
-    if entity_type in {"US_DRIVER_LICENSE", "US_PASSPORT", "BANK_ACCOUNT", 
-                       "MEDICAL_RECORD_NUMBER", "HEALTH_INSURANCE_POLICY_NUMBER",
-                       "US_BANK_NUMBER", "US_BANK_ROUTING", "IBAN_CODE"}:
-        if len(text) <= 4:
-            return "*" * len(text)
-        return "*" * (len(text) - 4) + text[-4:]
-    
-    # Partially mask emails
-    if entity_type == "EMAIL_ADDRESS" and "@" in text:
-        username, domain = text.split("@", 1)
-        if len(username) <= 2:
-            masked_username = username
-        else:
-            masked_username = username[0] + "*" * (len(username) - 2) + username[-1]
-        return f"{masked_username}@{domain}"
-    
-    # Default masking for other types - show first and last character
-    if len(text) <= 2:
-        return text
-    return text[0] + "*" * (len(text) - 2) + text[-1]
+    return MASK_FUNCTIONS.get(entity_type, _mask_default)(text)
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -660,11 +783,15 @@ def main() -> Dict[str, Any]:
         logging.getLogger().setLevel(logging.INFO)
         logging.getLogger('pii_database').setLevel(logging.INFO)
     
+    # The summary's file type counts are taken while the report is analyzed
+    summary_only = args.format == "text" and (args.summary or not args.detailed_report)
+    file_type_stats = {} if summary_only and args.input else None
+    
     try:
         # Analyze PII data based on input type
         if args.input:
             print(f"Analyzing PII report from JSON file: {args.input}")
-            classified_files = analyze_pii_report(args.input, args.threshold)
+            classified_files = analyze_pii_report(args.input, args.threshold, file_type_stats)
         else:
             print(f"Analyzing PII data from database: {args.db_path}")
             classified_files = analyze_pii_database(args.db_path, args.job_id, args.threshold)
@@ -682,7 +809,8 @@ def main() -> Dict[str, Any]:
         if args.format == "text":
             if args.summary or not args.detailed_report:
                 if args.input:
-                    report = generate_executive_summary(filtered_files, args.input)
+                    report = generate_executive_summary(filtered_files, args.input,
+                                                        file_type_stats=file_type_stats)
                 else:
                     report = generate_executive_summary(filtered_files, db_path=args.db_path, job_id=args.job_id)
             else: